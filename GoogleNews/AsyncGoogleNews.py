@@ -0,0 +1,367 @@
+from collections.abc import AsyncIterator, Iterable
+from datetime import datetime, timedelta
+from time import perf_counter
+from typing import TYPE_CHECKING
+from urllib.parse import quote
+
+from .GoogleNews import GoogleNews
+from .NewsResult import NewsResult
+from .Parser import Parser
+from .Query import Query, ResultPage
+from .RateLimiter import raise_if_blocked
+
+
+if TYPE_CHECKING:
+    import asyncio
+
+    import aiohttp
+
+
+class AsyncGoogleNews(GoogleNews):
+    """
+    asyncio flavour of `GoogleNews`.
+    `search`, `get_page`, `page_at`, `get_news`, `fetch` and `fetch_news` are
+    coroutines, and
+    `gather_pages`, `search_many` and `search_languages` fetch concurrently,
+    never running more than `concurrency` requests at the same time.
+    Several instances can share one keep-alive connection pool by passing the
+    same `aiohttp.ClientSession` as `session`.
+    """
+
+    __slots__ = (
+        "_concurrency",
+        "_semaphore",
+        "_semaphore_loop",
+        "_session",
+        "_owns_session",
+    )
+
+    _concurrency: int
+    _semaphore: "asyncio.Semaphore | None"
+    _semaphore_loop: "asyncio.AbstractEventLoop | None"
+    _session: "aiohttp.ClientSession | None"
+    _owns_session: bool
+
+    def __init__(
+        self,
+        lang: str = "en",
+        period: str = "",
+        start: str = "",
+        end: str = "",
+        concurrency: int = 10,
+        session: "aiohttp.ClientSession | None" = None,
+        parser: Parser | None = None,
+    ):
+        super().__init__(lang=lang, period=period, start=start, end=end, parser=parser)
+
+        self._concurrency = concurrency
+        self._semaphore = None
+        self._semaphore_loop = None
+        self._session = session
+        self._owns_session = session is None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def set_concurrency(self, concurrency: int):
+        self._concurrency = concurrency
+        self._semaphore = None
+
+    async def close(self):
+        """
+        Closes the underlying aiohttp session if it was opened by this instance.
+        A session given to the constructor is left open for its other users.
+        """
+
+        if self._session is not None and self._owns_session:
+            await self._session.close()
+            self._session = None
+
+    async def search(self, search_key: str):
+        """
+        Searches for a term in google.com in the news section and retrieves
+        the first page into __results.
+        Parameters:
+        key = the search term
+        """
+        self._search_key = quote(search_key)
+        await self.get_page()
+
+    async def page_at(self, page: int = 1, search_key: str | None = None):
+        """
+        Retrieves a specific page from google.com in the news sections.
+        Parameter:
+        page = number of the page to be retrieved
+        search_key = quoted search term, defaults to the one given to search()
+        """
+        query = self._query(self._search_key if search_key is None else search_key)
+
+        try:
+            result_page = await self.fetch(query, page)
+            self._total_count = result_page.total_count
+
+            return result_page.results
+        except Exception as e_parser:
+            self._count("errors", error=type(e_parser).__name__)
+            print(e_parser)
+            if self._exception:
+                raise
+
+        return []
+
+    async def fetch(self, query: Query, page: int = 1):
+        """
+        Retrieves a page of the google.com news search `query` as a
+        `ResultPage`, without reading nor changing the settings and __results
+        of the instance, see GoogleNews.fetch. Errors are raised.
+        """
+        url = query.search_url(page)
+        headers = self._headers_for(query.lang)
+
+        cached = self._cached_page(url, headers)
+        if cached is not None:
+            results, total_count = cached
+        else:
+            content = await self._fetch(query.search_url(page, localized=True), headers)
+            items, total_count = self._parse_search(content)
+            results = self._parse_items(items, query.lang)
+            self._cache_results(url, results, total_count, headers)
+
+        return ResultPage(query, page, results, total_count)
+
+    async def fetch_news(self, query: Query, deamplify: bool = False):
+        """ `fetch` for news.google.com searches, topics and sections. """
+
+        url, cache_url = self._news_urls(deamplify=deamplify, query=query)
+
+        results = await self._news_at(url, cache_url, deamplify, query.lang)
+
+        return ResultPage(query, 1, results)
+
+    async def get_page(self, page: int = 1):
+        """
+        Retrieves a specific page from google.com in the news sections into __results.
+        Parameter:
+        page = number of the page to be retrieved
+        """
+        self._add_results(await self.page_at(page))
+
+    async def iter_results(
+        self,
+        search_key: str | None = None,
+        max_pages: int | None = None,
+        stop_when_older_than: datetime | timedelta | None = None,
+    ) -> AsyncIterator[NewsResult]:
+        """
+        Yields the results of the search page after page, without keeping them
+        in __results. Use with `async for`, see GoogleNews.iter_results.
+        """
+        step = self._result_pager(search_key, stop_when_older_than)
+
+        for page in self._page_numbers(max_pages):
+            results, last_page = step(await self.page_at(page))
+            for result in results:
+                yield result
+
+            if last_page:
+                return
+
+    async def poll_new(
+        self,
+        search_key: str | None = None,
+        max_pages: int | None = None,
+    ):
+        """ The results not returned by a previous poll, see GoogleNews.poll_new. """
+        step, done = self._result_poller(search_key)
+
+        for page in self._page_numbers(max_pages):
+            if step(await self.page_at(page)):
+                break
+
+        return done()
+
+    async def poll_new_news(self, key: str = "", deamplify: bool = False):
+        """ See GoogleNews.poll_new_news. """
+        url, cache_url, done = self._news_poller(key, deamplify)
+
+        try:
+            results = await self._news_at(url, cache_url, deamplify)
+        except Exception as e_parser:
+            self._count("errors", error=type(e_parser).__name__)
+            print(e_parser)
+            if self._exception:
+                raise
+            return []
+
+        return done(results)
+
+    async def get_news(self, key: str = "", deamplify: bool = False):
+        url, cache_url = self._news_urls(key, deamplify)
+
+        try:
+            self._add_results(await self._news_at(url, cache_url, deamplify))
+        except Exception as e_parser:
+            self._count("errors", error=type(e_parser).__name__)
+            print(e_parser)
+            if self._exception:
+                raise
+
+    async def gather_pages(self, pages: Iterable[int]):
+        """
+        Retrieves several pages of the current search concurrently into __results.
+        Results are appended in page order, whatever order the responses arrive in.
+        Parameter:
+        pages = page numbers to be retrieved, e.g. range(1, 11)
+        """
+        import asyncio
+
+        results = await asyncio.gather(*(self.page_at(page) for page in pages))
+
+        for page_results in results:
+            self._add_results(page_results)
+
+        return self._results
+
+    async def search_many(self, queries: Iterable[str], pages: Iterable[int] = (1,)):
+        """
+        Searches several terms concurrently without touching __results.
+        Returns a dict mapping every query to its results, in page order.
+        Parameters:
+        queries = the search terms
+        pages = page numbers to be retrieved for every search term
+        """
+        import asyncio
+
+        queries = list(queries)
+        pages = list(pages)
+
+        pages_per_query = await asyncio.gather(*(
+            asyncio.gather(*(self.page_at(page, quote(query)) for page in pages))
+            for query in queries
+        ))
+
+        results: dict[str, list[NewsResult]] = {}
+        for query, query_pages in zip(queries, pages_per_query, strict=True):
+            results[query] = [
+                result for page_results in query_pages for result in page_results
+            ]
+
+        return results
+
+    async def search_languages(
+        self,
+        search_key: str,
+        langs: Iterable[str],
+        pages: int = 1,
+    ):
+        """
+        Runs the search `search_key` in every language of `langs` concurrently
+        and returns a LanguageResults, see GoogleNews.search_languages. All the
+        languages are gathered at once, their requests sharing the
+        `concurrency` limit of the instance.
+        Parameters:
+        search_key = the search term
+        langs = languages of the results, e.g. ["en", "it", "ru"]
+        pages = number of pages to retrieve per language
+        """
+        import asyncio
+
+        # Loading the date parsers would block the loop
+        searched, queries = await asyncio.to_thread(
+            self._language_search, search_key, langs
+        )
+
+        async def run(lang: str):
+            item = searched.languages[lang]
+            started = perf_counter()
+            try:
+                for page in range(1, pages + 1):
+                    self._add_language_page(item, await self.fetch(queries[lang], page))
+            except Exception as error:
+                self._count("errors", error=type(error).__name__)
+                item.error = error
+            finally:
+                item.seconds = perf_counter() - started
+
+        await asyncio.gather(*(run(lang) for lang in queries))
+
+        return self._merge_languages(searched)
+
+    async def _news_at(
+        self,
+        url: str,
+        cache_url: str,
+        deamplify: bool = False,
+        lang: str | None = None,
+    ):
+        lang = lang if lang is not None else self._lang
+        headers = self._headers_for(lang)
+
+        cached = self._cached_page(cache_url, headers)
+        if cached is not None:
+            return cached[0]
+
+        page = await self._fetch(url, headers)
+        results = self._parse_news_page(page, deamplify, lang)
+        self._cache_results(cache_url, results, headers=headers)
+
+        return results
+
+    def _limiter(self):
+        """ Semaphore bounding the in-flight requests of the running loop. """
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self._concurrency)
+            self._semaphore_loop = loop
+
+        return self._semaphore
+
+    async def _fetch(self, url: str, headers: dict[str, str] | None = None):
+        import aiohttp
+
+        if headers is None:
+            headers = self._headers
+
+        if self._cache is not None:
+            page = self._cache.get_page(url, headers)
+            if page is not None:
+                self._count("cache_hits")
+                return page
+
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+            self._owns_session = True
+
+        attempts = 0
+
+        async def request():
+            nonlocal attempts
+            attempts += 1
+            if attempts > 1:
+                self._count("retries")
+
+            async with self._limiter():
+                with self._stage("download", url=url):
+                    async with self._session.get(url, headers=headers) as resp:
+                        resp.raise_for_status()
+                        page = await resp.read()
+
+            self._count("requests")
+            self._count("bytes_downloaded", len(page))
+            return page
+
+        if self._rate_limiter is not None:
+            page = await self._rate_limiter.async_call(url, request)
+        else:
+            page = await request()
+            raise_if_blocked(url, page)
+
+        if self._cache is not None:
+            self._cache.set_page(url, headers, page)
+
+        return page
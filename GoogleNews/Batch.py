@@ -0,0 +1,73 @@
+from dataclasses import dataclass, field
+from typing import Any
+
+from .Extractor import Extractor
+from .NewsResult import NewsResult
+from .UrlCanonicalizer import UrlCanonicalizer
+
+
+@dataclass(slots=True)
+class BatchResult:
+    """
+    Outcome of one query of `GoogleNews.batch`.
+    `error` holds the exception that stopped the query, in which case
+    `results` only holds the pages retrieved before it. `seconds` is the time
+    spent on the query.
+    """
+
+    query: str | dict[str, Any]
+    results: list[NewsResult] = field(default_factory=list)
+    total_count: int = 0
+    error: BaseException | None = None
+    seconds: float = 0.0
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+@dataclass(slots=True)
+class LanguageResults:
+    """
+    Outcome of `GoogleNews.search_languages`: the results of every language
+    merged newest first, and per language the `BatchResult` of its search,
+    with its own results, error and seconds. These results are copies of the
+    NewsResult dicts with an extra "lang" key, the language of the search,
+    which is not part of NewsResult.
+    `warmup_seconds` is the time spent loading the date parsers of the
+    languages before the searches started.
+    """
+
+    results: list[NewsResult] = field(default_factory=list)
+    languages: dict[str, BatchResult] = field(default_factory=dict)
+    warmup_seconds: float = 0.0
+
+    @property
+    def ok(self):
+        return all(item.ok for item in self.languages.values())
+
+
+def parse_search_page(
+    page: bytes,
+    lang: str,
+    backend: str,
+    selective: bool,
+    extractor: Extractor | None = None,
+    url_canonicalizer: UrlCanonicalizer | None = None,
+):
+    """
+    Parses a google.com result page into (results, total count).
+    Module level so that it can run in a process pool.
+    """
+
+    from .GoogleNews import GoogleNews
+    from .Parser import Parser
+
+    googlenews = GoogleNews(lang=lang, parser=Parser(backend, selective))
+    if extractor is not None:
+        googlenews.set_extractor(extractor)
+    if url_canonicalizer is not None:
+        googlenews.set_url_canonicalizer(url_canonicalizer)
+    results = googlenews._parse_items(googlenews._parse_response(page))
+
+    return results, googlenews.total_count()
@@ -0,0 +1,241 @@
+import hashlib
+import pickle
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from operator import itemgetter
+from typing import Any
+from urllib.parse import parse_qsl, quote, urlencode, urlsplit, urlunsplit
+
+
+class MemoryCache:
+    """ Thread-safe LRU of values, each with its own expiry timestamp. """
+
+    __slots__ = (
+        "_maxsize",
+        "_lock",
+        "_entries",
+    )
+
+    _maxsize: int
+    _lock: threading.Lock
+    _entries: "OrderedDict[str, tuple[float, Any]]"
+
+    def __init__(self, maxsize: int = 256):
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key: str):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            if entry[0] < time.time():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, value: Any, expires: float):
+        with self._lock:
+            self._entries[key] = (expires, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class DiskCache:
+    """
+    sqlite backed store of zlib compressed pickles, shared by processes
+    pointing at the same file.
+    """
+
+    __slots__ = (
+        "_path",
+        "_lock",
+        "_connection",
+    )
+
+    _path: str
+    _lock: threading.Lock
+    _connection: sqlite3.Connection
+
+    def __init__(self, path: str):
+        self._path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache"
+                " (key TEXT PRIMARY KEY, expires REAL NOT NULL, value BLOB NOT NULL)"
+            )
+
+    def get(self, key: str):
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT expires, value FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+
+        if row is None or row[0] < time.time():
+            return None
+
+        return row[0], pickle.loads(zlib.decompress(row[1]))
+
+    def set(self, key: str, value: Any, expires: float):
+        blob = zlib.compress(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO cache (key, expires, value) VALUES (?, ?, ?)",
+                (key, expires, blob),
+            )
+
+    def purge(self):
+        """ Deletes the expired entries. """
+
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM cache WHERE expires < ?", (time.time(),)
+            )
+
+    def clear(self):
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM cache")
+
+    def close(self):
+        self._connection.close()
+
+
+class ResponseCache:
+    """
+    Opt-in cache of the downloaded pages and of their parsed results, keyed by
+    the URL, normalized by `normalize_url`, and the request headers.
+    Parameters:
+    ttl = seconds an entry stays valid
+    ttls = per endpoint TTLs, keyed by "host/path" prefixes such as
+           "news.google.com/topics" or "www.google.com/search"; the longest
+           matching prefix wins over `ttl`
+    maxsize = number of entries kept in memory
+    path = sqlite file to also keep the entries on disk
+    """
+
+    __slots__ = (
+        "_ttl",
+        "_ttls",
+        "_memory",
+        "_disk",
+    )
+
+    _ttl: float
+    _ttls: list[tuple[str, float]]
+    _memory: MemoryCache
+    _disk: DiskCache | None
+
+    def __init__(
+        self,
+        ttl: float = 300,
+        ttls: dict[str, float] | None = None,
+        maxsize: int = 256,
+        path: str | None = None,
+    ):
+        self._ttl = ttl
+        self._ttls = sorted(
+            (ttls or {}).items(), key=lambda item: len(item[0]), reverse=True
+        )
+        self._memory = MemoryCache(maxsize)
+        self._disk = DiskCache(path) if path is not None else None
+
+    def ttl_for(self, url: str):
+        parts = urlsplit(url)
+        endpoint = parts.netloc + parts.path
+
+        for prefix, ttl in self._ttls:
+            if endpoint.startswith(prefix):
+                return ttl
+
+        return self._ttl
+
+    def get_page(self, url: str, headers: dict[str, str]) -> bytes | None:
+        return self._get(self.key("page", url, headers))
+
+    def set_page(self, url: str, headers: dict[str, str], page: bytes):
+        self._set(self.key("page", url, headers), page, self.ttl_for(url))
+
+    def get_results(self, url: str, headers: dict[str, str]):
+        """ Parsed results of a page, as given to `set_results`. """
+
+        results = self._get(self.key("results", url, headers))
+
+        return pickle.loads(results) if results is not None else None
+
+    def set_results(self, url: str, headers: dict[str, str], results: Any):
+        # Kept pickled so that callers can not alter the cached entries
+        results = pickle.dumps(results, protocol=pickle.HIGHEST_PROTOCOL)
+        self._set(self.key("results", url, headers), results, self.ttl_for(url))
+
+    def clear(self):
+        self._memory.clear()
+        if self._disk is not None:
+            self._disk.clear()
+
+    def close(self):
+        if self._disk is not None:
+            self._disk.close()
+
+    @staticmethod
+    def key(kind: str, url: str, headers: dict[str, str]):
+        normalized = "\n".join(
+            [kind, normalize_url(url)]
+            + [f"{name.lower()}:{value}" for name, value in sorted(headers.items())]
+        )
+
+        return hashlib.sha1(normalized.encode()).hexdigest()
+
+    def _get(self, key: str):
+        entry = self._memory.get(key)
+        if entry is None and self._disk is not None:
+            entry = self._disk.get(key)
+            if entry is not None:
+                self._memory.set(key, entry[1], entry[0])
+
+        return entry[1] if entry is not None else None
+
+    def _set(self, key: str, value: Any, ttl: float):
+        expires = time.time() + ttl
+
+        self._memory.set(key, value, expires)
+        if self._disk is not None:
+            self._disk.set(key, value, expires)
+
+
+def normalize_url(url: str):
+    """
+    `url` with a lower case scheme and host, and its query parameters sorted
+    by name and encoded the same way, so that equivalent URLs share their
+    cache entries. Repeated parameters keep their order, and the fragment is
+    kept as it is.
+    """
+
+    parts = urlsplit(url.strip())
+    query = urlencode(
+        sorted(parse_qsl(parts.query, keep_blank_values=True), key=itemgetter(0)),
+        quote_via=quote,
+    )
+
+    return urlunsplit(
+        (parts.scheme.lower(), parts.netloc.lower(), parts.path, query, parts.fragment)
+    )
@@ -0,0 +1,156 @@
+import re
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+from functools import lru_cache
+
+
+RELATIVE_DATE = re.compile(
+    r"(\d+|an?|one)\s*"
+    r"(s|sec|secs|seconds?|m|min|mins|minutes?|h|hr|hrs|hours?|d|days?|w|wk|wks|weeks?"
+    r"|mo|months?|y|yr|yrs|years?)"
+    r"\s+ago",
+    re.IGNORECASE,
+)
+ABSOLUTE_DATE = re.compile(
+    r"(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?\s+(\d{1,2}),?\s+(\d{4})",
+    re.IGNORECASE,
+)
+ISO_DATE = re.compile(r"\d{4}-\d{2}-\d{2}(?:[T ][\d:.]+)?(?:Z|[+-]\d{2}:?\d{2})?")
+
+MONTHS = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
+}
+UNITS = {
+    "s": "seconds",
+    "m": "minutes",
+    "h": "hours",
+    "d": "days",
+    "w": "weeks",
+}
+
+
+class DateNormalizer:
+    """
+    Turns the dates shown next to the results into datetimes.
+    English relative dates ("3 hours ago"), "Oct 12, 2026" style dates and
+    ISO values are handled by precompiled patterns, anything else falls back
+    to `dateparser`, imported on first use and restricted to the locale data of
+    `lang`. Results are memoized per (lang, string, reference time bucket),
+    relative dates being computed from the start of the bucket, and so are
+    the dateparser parsers, per (language, reference time bucket).
+    Parameters:
+    maxsize = number of parsed dates kept in the LRU cache
+    granularity = width of a reference time bucket in seconds
+    parsers = number of dateparser parsers kept in their LRU cache
+    """
+
+    __slots__ = (
+        "_granularity",
+        "_cached_parse",
+        "_cached_parser",
+    )
+
+    _granularity: int
+
+    def __init__(self, maxsize: int = 4096, granularity: int = 60, parsers: int = 64):
+        self._granularity = granularity
+        self._cached_parse = lru_cache(maxsize=maxsize)(self._parse)
+        self._cached_parser = lru_cache(maxsize=parsers)(self._parser)
+
+    def parse(self, text: str | None, lang: str = "en", now: datetime | None = None):
+        if not text:
+            return None
+
+        text = text.strip()
+        if not text:
+            return None
+
+        if now is None:
+            now = datetime.now()
+
+        return self._cached_parse(lang, text, self._bucket(now))
+
+    def warm(self, langs: Iterable[str]):
+        """
+        Imports dateparser and builds the parsers of `langs` for the current
+        reference time bucket now, instead of on the first date of each
+        language that needs them, e.g. before searching many languages from
+        several threads.
+        """
+        bucket = self._bucket(datetime.now())
+        for lang in langs:
+            self._cached_parser(self._language(lang), bucket)
+
+    def cache_info(self):
+        return self._cached_parse.cache_info()
+
+    def cache_clear(self):
+        self._cached_parse.cache_clear()
+
+    def _bucket(self, now: datetime):
+        return int(now.timestamp() // self._granularity)
+
+    def _parse(self, lang: str, text: str, bucket: int):
+        reference = datetime.fromtimestamp(bucket * self._granularity)
+
+        match = RELATIVE_DATE.fullmatch(text)
+        if match:
+            amount, unit = match.groups()
+            return reference - self._delta(
+                1 if not amount.isdigit() else int(amount), unit.lower()
+            )
+
+        match = ABSOLUTE_DATE.fullmatch(text)
+        if match:
+            month, day, year = match.groups()
+            try:
+                return datetime(int(year), MONTHS[month[:3].lower()], int(day))
+            except ValueError:
+                return None
+
+        if ISO_DATE.fullmatch(text):
+            try:
+                value = datetime.fromisoformat(text.replace("Z", "+00:00"))
+                return value.replace(tzinfo=None)
+            except ValueError:
+                pass
+
+        parser = self._cached_parser(self._language(lang), bucket)
+        return parser.get_date_data(text).date_obj
+
+    def _parser(self, language: str, bucket: int):
+        """ dateparser parser of `language`, relative to the start of `bucket`. """
+
+        from dateparser.date import DateDataParser
+
+        settings = {"RELATIVE_BASE": datetime.fromtimestamp(bucket * self._granularity)}
+        try:
+            parser = DateDataParser(languages=[language], settings=settings)
+            # Unknown languages are only reported by the first parse
+            parser.get_date_data("1")
+        except ValueError:
+            # dateparser does not know this language, let it detect one
+            parser = DateDataParser(settings=settings)
+
+        return parser
+
+    @staticmethod
+    def _language(lang: str):
+        return lang.split("-")[0].lower()
+
+    @staticmethod
+    def _delta(amount: int, unit: str):
+        if unit.startswith("mi"):
+            return timedelta(minutes=amount)
+        if unit.startswith("mo") or unit[0] == "y":
+            from dateutil.relativedelta import relativedelta
+
+            if unit.startswith("mo"):
+                return relativedelta(months=amount)
+            return relativedelta(years=amount)
+
+        return timedelta(**{UNITS[unit[0]]: amount})
+
+
+default_date_normalizer = DateNormalizer()
@@ -0,0 +1,242 @@
+import hashlib
+import re
+import threading
+from collections.abc import Iterable
+from math import ceil, log
+from urllib.parse import urlsplit, urlunsplit
+
+from .NewsResult import NewsResult
+
+
+WORD = re.compile(r"\w+")
+
+
+def canonical_url(url: str):
+    """
+    Key under which two links are considered the same article: scheme and
+    host lowercased, "www." dropped, fragment and trailing slash removed.
+    """
+
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower().removeprefix("www.")
+    path = parts.path.rstrip("/") or "/"
+
+    return urlunsplit((parts.scheme.lower(), host, path, parts.query, ""))
+
+
+def simhash(text: str, bits: int = 64):
+    """ SimHash of the lowercased words of `text`. """
+
+    weights = [0] * bits
+    for word in WORD.findall(text.lower()):
+        digest = hashlib.blake2b(word.encode(), digest_size=8).digest()
+        value = int.from_bytes(digest, "big")
+        for bit in range(bits):
+            weights[bit] += 1 if value >> bit & 1 else -1
+
+    return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
+
+class BloomFilter:
+    """
+    Fixed size set of strings answering "maybe seen" / "never seen".
+    Parameters:
+    capacity = number of items the false positive rate is sized for
+    error_rate = false positive rate reached at `capacity` items
+    """
+
+    __slots__ = (
+        "_size",
+        "_hashes",
+        "_bits",
+        "_count",
+    )
+
+    _size: int
+    _hashes: int
+    _bits: bytearray
+    _count: int
+
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 0.001):
+        self._size = max(8, ceil(-capacity * log(error_rate) / log(2) ** 2))
+        self._hashes = max(1, round(self._size / capacity * log(2)))
+        self._bits = bytearray((self._size + 7) // 8)
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def __contains__(self, key: str):
+        return all(self._bits[i >> 3] & (1 << (i & 7)) for i in self._indexes(key))
+
+    def add(self, key: str):
+        """ Adds `key`, returns False if it was (probably) already present. """
+
+        new = False
+        for i in self._indexes(key):
+            if not self._bits[i >> 3] & (1 << (i & 7)):
+                self._bits[i >> 3] |= 1 << (i & 7)
+                new = True
+
+        if new:
+            self._count += 1
+
+        return new
+
+    def _indexes(self, key: str):
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "big")
+        second = int.from_bytes(digest[8:], "big") | 1
+
+        return ((first + i * second) % self._size for i in range(self._hashes))
+
+
+class Deduplicator:
+    """
+    Drops repeated results as they are added, across pages and queries.
+    Links are compared on their `canonical_url`, in an exact set or, when
+    `bloom_capacity` is given, in two rotating Bloom filters of that capacity
+    so that memory stays bounded for long-running crawlers (the title index
+    rotates along with them). Titles whose SimHash differs in at most
+    `title_distance` bits from an earlier title are near duplicates; 0
+    disables the title check.
+    """
+
+    __slots__ = (
+        "_title_distance",
+        "_bloom_capacity",
+
+        "_lock",
+        "_links",
+        "_previous_links",
+        "_bands",
+        "_previous_bands",
+
+        "_kept",
+        "_dropped_links",
+        "_dropped_titles",
+    )
+
+    BANDS = 4
+    BAND_BITS = 16
+
+    _title_distance: int
+    _bloom_capacity: int | None
+
+    _lock: threading.Lock
+    _links: set[str] | BloomFilter
+    _previous_links: BloomFilter | None
+    _bands: list[dict[int, list[int]]]
+    _previous_bands: list[dict[int, list[int]]]
+
+    _kept: int
+    _dropped_links: int
+    _dropped_titles: int
+
+    def __init__(self, title_distance: int = 3, bloom_capacity: int | None = None):
+        if title_distance >= self.BANDS:
+            raise ValueError(f"title_distance must be lower than {self.BANDS}")
+
+        self._title_distance = title_distance
+        self._bloom_capacity = bloom_capacity
+
+        self._lock = threading.Lock()
+        self.clear()
+
+    def __len__(self):
+        return self._kept
+
+    @property
+    def stats(self):
+        """ Number of results kept and dropped so far. """
+
+        return {
+            "kept": self._kept,
+            "dropped_links": self._dropped_links,
+            "dropped_titles": self._dropped_titles,
+        }
+
+    def clear(self):
+        with self._lock:
+            if self._bloom_capacity is None:
+                self._links = set()
+            else:
+                self._links = BloomFilter(self._bloom_capacity)
+            self._previous_links = None
+            self._bands = [{} for _ in range(self.BANDS)]
+            self._previous_bands = []
+
+            self._kept = 0
+            self._dropped_links = 0
+            self._dropped_titles = 0
+
+    def add(self, result: NewsResult):
+        """ Records `result`, returns False if it repeats an earlier result. """
+
+        link = canonical_url(result["link"]) if result.get("link") else None
+        title = result.get("title") or ""
+        fingerprint = None
+        if self._title_distance and WORD.search(title):
+            fingerprint = simhash(title)
+
+        with self._lock:
+            if link is not None and self._seen_link(link):
+                self._dropped_links += 1
+                return False
+
+            if fingerprint is not None and self._seen_title(fingerprint):
+                self._dropped_titles += 1
+                return False
+
+            if link is not None:
+                self._add_link(link)
+            if fingerprint is not None:
+                self._add_title(fingerprint)
+
+            self._kept += 1
+            return True
+
+    def filter(self, results: Iterable[NewsResult]):
+        """ The results that do not repeat an earlier one. """
+
+        return [result for result in results if self.add(result)]
+
+    def _seen_link(self, link: str):
+        if link in self._links:
+            return True
+
+        return self._previous_links is not None and link in self._previous_links
+
+    def _add_link(self, link: str):
+        if isinstance(self._links, set):
+            self._links.add(link)
+            return
+
+        if len(self._links) >= self._bloom_capacity:
+            self._previous_links = self._links
+            self._links = BloomFilter(self._bloom_capacity)
+            self._previous_bands = self._bands
+            self._bands = [{} for _ in range(self.BANDS)]
+
+        self._links.add(link)
+
+    def _seen_title(self, fingerprint: int):
+        bands = self._split(fingerprint)
+
+        # Within the distance, at least one band of the two fingerprints is equal
+        for indexes in (self._bands, self._previous_bands):
+            for band, index in zip(bands, indexes, strict=False):
+                for candidate in index.get(band, ()):
+                    if (candidate ^ fingerprint).bit_count() <= self._title_distance:
+                        return True
+
+        return False
+
+    def _add_title(self, fingerprint: int):
+        for band, index in zip(self._split(fingerprint), self._bands, strict=True):
+            index.setdefault(band, []).append(fingerprint)
+
+    def _split(self, fingerprint: int):
+        mask = (1 << self.BAND_BITS) - 1
+
+        return [fingerprint >> (i * self.BAND_BITS) & mask for i in range(self.BANDS)]
@@ -0,0 +1,113 @@
+from typing import Any
+
+
+# A field is read at the end of a path of steps from the result node: "tag"
+# moves to the first descendant with that name (like bs4's `find`), "~tag" to
+# the next sibling with that name (`find_next_sibling`). The value is the text
+# of the node reached, or one of its attributes.
+FieldRule = tuple[tuple[str, ...], str]
+Layout = dict[str, FieldRule]
+
+SEARCH_LAYOUT: Layout = {
+    "title": (("h3",), "text"),
+    "link": ((), "href"),
+    "media": (("div", "div", "div", "~div"), "text"),
+    "date": (("div", "~div", "span"), "text"),
+    "desc": (("div", "~div", "div", "~div", "div", "div", "div"), "text"),
+    "img": (("img",), "src"),
+}
+
+# (fields read on the node, (step, subtree) of every next step)
+Trie = tuple[tuple[tuple[str, str], ...], tuple[tuple[str, Any], ...]]
+
+
+def build_trie(layout: Layout) -> Trie:
+    """ Merges the paths of `layout` so that shared prefixes are walked once. """
+
+    fields = []
+    children: dict[str, Layout] = {}
+
+    for name, (path, value) in layout.items():
+        if path:
+            children.setdefault(path[0], {})[name] = (path[1:], value)
+        else:
+            fields.append((name, value))
+
+    return tuple(fields), tuple(
+        (step, build_trie(sublayout)) for step, sublayout in children.items()
+    )
+
+
+class Extractor:
+    """
+    Computes every field of a result node from a single walk, driven by a
+    declarative layout mapping each field to its path. Paths are merged in a
+    trie, so that nodes shared by several fields are only looked up once.
+    Parameters:
+    layout = field name -> (path, "text" or attribute name), see SEARCH_LAYOUT
+    """
+
+    __slots__ = (
+        "_layout",
+        "_trie",
+    )
+
+    _layout: Layout
+    _trie: Trie
+
+    def __init__(self, layout: Layout | None = None):
+        self._layout = dict(layout if layout is not None else SEARCH_LAYOUT)
+        self._trie = build_trie(self._layout)
+
+    @property
+    def layout(self):
+        return dict(self._layout)
+
+    def extract(self, node: Any):
+        """ Field values of `node`, None for the fields whose path is missing. """
+
+        fields = dict.fromkeys(self._layout)
+        self._walk(node, self._trie, fields, None)
+
+        return fields
+
+    def node_visits(self, node: Any):
+        """ Number of nodes `extract` looks at for `node`. """
+
+        visits = [0]
+        self._walk(node, self._trie, dict.fromkeys(self._layout), visits)
+
+        return visits[0]
+
+    def _walk(self, node: Any, trie: Trie, fields: dict, visits: list[int] | None):
+        names, children = trie
+
+        for name, value in names:
+            fields[name] = node.get_text() if value == "text" else node.get(value)
+
+        for step, child in children:
+            target = self._step(node, step, visits)
+            if target is not None:
+                self._walk(target, child, fields, visits)
+
+    @staticmethod
+    def _step(node: Any, step: str, visits: list[int] | None):
+        if step[0] == "~":
+            name = step[1:]
+            candidates = node.next_siblings
+        else:
+            name = step
+            candidates = node.descendants
+
+        seen = 0
+        for candidate in candidates:
+            seen += 1
+            if candidate.name == name:
+                break
+        else:
+            candidate = None
+
+        if visits is not None:
+            visits[0] += seen
+
+        return candidate
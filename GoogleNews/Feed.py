@@ -0,0 +1,132 @@
+import html
+import re
+import xml.etree.ElementTree as ET
+from collections.abc import Iterable
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+from .NewsResult import NewsResult
+
+
+TAG = re.compile(r"<[^>]+>")
+SPACES = re.compile(r"\s+")
+
+
+def feed_url(news_url: str):
+    """ RSS flavour of a news.google.com search, topic or section URL. """
+
+    return news_url.replace(
+        "https://news.google.com/", "https://news.google.com/rss/", 1
+    )
+
+
+def parse_feed(page: bytes | Iterable[bytes]) -> list[NewsResult]:
+    """
+    Results of a Google News RSS feed, or of an Atom feed, given whole or as
+    the chunks of its download.
+    Items are read with a pull parser and dropped once converted, so the whole
+    document is never held as a tree. Dates come from the RFC 822 / ISO values
+    of the feed, as naive UTC datetimes like the `<time datetime>` values of
+    news.google.com pages.
+    """
+
+    results: list[NewsResult] = []
+    parser = ET.XMLPullParser(events=("end",))
+
+    for chunk in (page,) if isinstance(page, bytes) else page:
+        parser.feed(chunk)
+        results.extend(feed_items(parser))
+
+    parser.close()
+    results.extend(feed_items(parser))
+
+    return results
+
+
+def feed_items(parser: ET.XMLPullParser):
+    """ Results of the items completed since the previous call. """
+
+    for _, element in parser.read_events():
+        if local_name(element.tag) not in ("item", "entry"):
+            continue
+
+        fields = {local_name(child.tag): child for child in element}
+        source = fields.get("source")
+        media = text_of(source)
+        title = text_of(fields.get("title")) or ""
+        if media and title.endswith(" - " + media):
+            # google appends the publisher to the headline
+            title = title[: -len(media) - 3]
+
+        date = text_of(first(fields, "pubDate", "published", "updated"))
+        desc = first(fields, "description", "summary", "content")
+
+        yield {
+            'title': title,
+            'desc': strip_html(text_of(desc)),
+            'date': date,
+            'datetime': parse_date(date),
+            'link': link_of(fields.get("link")),
+            'img': None,
+            'media': media,
+            'site': source.get("url") if source is not None else None,
+            'reporter': text_of(fields.get("author")),
+        }
+        element.clear()
+
+
+def first(fields: dict[str, ET.Element], *names: str):
+    # Elements without children are falsy, `or` can not pick between them
+    for name in names:
+        if name in fields:
+            return fields[name]
+
+    return None
+
+
+def local_name(tag: str):
+    return tag.rpartition("}")[2]
+
+
+def text_of(element: ET.Element | None):
+    if element is None:
+        return None
+
+    if len(element):
+        # Atom authors and sources nest their name
+        return text_of(element[0])
+
+    return element.text.strip() if element.text else None
+
+
+def link_of(element: ET.Element | None):
+    if element is None:
+        return None
+
+    # Atom keeps the link in an attribute
+    return element.get("href") or text_of(element)
+
+
+def strip_html(text: str | None):
+    if not text:
+        return None
+
+    return SPACES.sub(" ", html.unescape(TAG.sub(" ", text))).strip() or None
+
+
+def parse_date(text: str | None):
+    if not text:
+        return None
+
+    try:
+        if text[:4].isdigit():
+            value = datetime.fromisoformat(text.replace("Z", "+00:00"))
+        else:
+            value = parsedate_to_datetime(text)
+    except (TypeError, ValueError):
+        return None
+
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+
+    return value
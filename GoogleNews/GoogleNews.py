@@ -1,13 +1,40 @@
 import logging
 import re
-from urllib.parse import parse_qs, quote, unquote, urlencode, urlparse, urlunparse
-from urllib.request import Request, urlopen
+from collections.abc import Iterable, Iterator
+from contextlib import closing
+from datetime import datetime, timedelta
+from itertools import chain, count
+from time import perf_counter
+from typing import TYPE_CHECKING, Any
+from urllib.parse import quote, unquote
+
+from .DateNormalizer import DateNormalizer, default_date_normalizer
+from .Deduplicator import Deduplicator, canonical_url
+from .Extractor import Extractor
+from .Metrics import NO_STAGE, Metrics
+from .NewsBatch import NewsBatch
+from .NewsResult import NewsResult
+from .Parser import Parser
+from .Query import Query, ResultPage
+from .QueryBuilder import check_time_range
+from .RateLimiter import RateLimiter, raise_if_blocked
+from .ResultIndex import ResultIndex
+from .UrlCanonicalizer import UrlCanonicalizer, default_url_canonicalizer
 
-import dateparser
-from bs4 import BeautifulSoup
-from dateutil.parser import parse
 
-from .NewsResult import NewsResult
+if TYPE_CHECKING:
+    from .Batch import BatchResult, LanguageResults
+    from .Cache import ResponseCache
+    from .Sink import Sink
+    from .Transport import Transport
+    from .WatchStore import WatchStore, Watermark
+
+
+# Fields extracted from every news.google.com article and RSS item, counted
+# as parse failures when missing: articles have no description and items no
+# image, only some publishers give a site or reporter
+NEWS_FIELDS = ("title", "date", "datetime", "link", "img", "media")
+FEED_FIELDS = ("title", "desc", "date", "datetime", "link", "media")
 
 
 class GoogleNews:
@@ -18,15 +45,31 @@ class GoogleNews:
         "_search_key",
         "_topic",
         "_topic_section",
+        "_news_backend",
 
         "_period",
         "_start",
         "_end",
 
         "_results",
+        "_index",
         "_total_count",
-
-        "_exception"
+        "_sink",
+        "_keep_results",
+
+        "_exception",
+        "_streaming",
+
+        "_transport",
+        "_parser",
+        "_extractor",
+        "_url_canonicalizer",
+        "_date_normalizer",
+        "_cache",
+        "_deduplicator",
+        "_rate_limiter",
+        "_watch_store",
+        "_metrics",
     )
 
     _lang: str
@@ -35,15 +78,31 @@ class GoogleNews:
     _search_key: str | None
     _topic: str | None
     _topic_section: str | None
+    _news_backend: str
 
     _period: str | None
     _start: str | None
     _end: str | None
 
     _results: list[NewsResult]
+    _index: ResultIndex
     _total_count: int
+    _sink: "Sink | None"
+    _keep_results: bool
 
     _exception: bool
+    _streaming: bool
+
+    _transport: "Transport"
+    _parser: Parser
+    _extractor: Extractor
+    _url_canonicalizer: UrlCanonicalizer
+    _date_normalizer: DateNormalizer
+    _cache: "ResponseCache | None"
+    _deduplicator: Deduplicator | None
+    _rate_limiter: RateLimiter | None
+    _watch_store: "WatchStore | None"
+    _metrics: Metrics | None
 
     def __init__(
         self,
@@ -51,6 +110,8 @@ class GoogleNews:
         period: str = "",
         start: str = "",
         end: str = "",
+        transport: "Transport | None" = None,
+        parser: Parser | None = None,
     ):
         self._lang = lang
         self._user_agent = "Mozilla/5.0 (X11; Ubuntu; Linux i686; rv:64.0) Gecko/20100101 Firefox/64.0"
@@ -58,22 +119,46 @@ class GoogleNews:
         self._search_key = None
         self._topic = None
         self._topic_section = None
+        self._news_backend = "html"
 
         self._period = period
+        check_time_range(start, end)
         self._start = start
         self._end = end
 
         self._results = []
+        self._index = ResultIndex()
         self._total_count = 0
+        self._sink = None
+        self._keep_results = True
 
         self._exception = False
+        self._streaming = False
+
+        if transport is None:
+            from .Transport import UrllibTransport
+
+            transport = UrllibTransport()
+        self._transport = transport
+        self._parser = parser if parser is not None else Parser()
+        self._extractor = Extractor()
+        self._url_canonicalizer = default_url_canonicalizer
+        self._date_normalizer = default_date_normalizer
+        self._cache = None
+        self._deduplicator = None
+        self._rate_limiter = None
+        self._watch_store = None
+        self._metrics = None
 
     @property
     def _headers(self):
+        return self._headers_for(self._lang)
+
+    def _headers_for(self, lang: str):
         headers = {"User-Agent": self._user_agent}
 
-        if "-" in self._lang:
-            lang, region = self._lang.split("-")
+        if "-" in lang:
+            lang, region = lang.split("-")
             headers["Accept-Language"] = f"{lang}-{region},{lang};q=0.9"
 
         return headers
@@ -88,6 +173,101 @@ class GoogleNews:
     def enable_exception(self, enable: bool = True):
         self._exception = enable
 
+    def set_streaming(self, enable: bool = True):
+        """
+        Parses the pages while they download: the body is handed over chunk
+        after chunk to an incremental parser, which builds each result as soon
+        as it is complete and drops the earlier parts of the page, instead of
+        holding the whole page and its tree. Lowers the peak memory per page
+        and overlaps parsing with the download. Blocking client only.
+        """
+        self._streaming = enable
+
+    def set_transport(self, transport: "Transport"):
+        """
+        Replaces the transport used to download pages, e.g. with a
+        `PooledTransport` shared by several instances.
+        """
+        self._transport = transport
+
+    def set_parser(self, parser: Parser):
+        """
+        Replaces the HTML parser backend, e.g. `Parser("html.parser", selective=False)`
+        to build the whole page tree like older versions did.
+        """
+        self._parser = parser
+
+    def set_extractor(self, extractor: Extractor):
+        """
+        Replaces the field extractor of the google.com results, e.g. with an
+        `Extractor` built on a layout matching a new page structure.
+        """
+        self._extractor = extractor
+
+    def set_url_canonicalizer(self, url_canonicalizer: UrlCanonicalizer):
+        """
+        Replaces the cleaner of the result links, e.g. with
+        `UrlCanonicalizer(GOOGLE_PARAMS + TRACKING_PARAMS)` to also drop utm_*
+        and click id parameters.
+        """
+        self._url_canonicalizer = url_canonicalizer
+
+    def set_date_normalizer(self, date_normalizer: DateNormalizer):
+        """
+        Replaces the date parser, by default a process wide `DateNormalizer`
+        whose cache is shared by every instance.
+        """
+        self._date_normalizer = date_normalizer
+
+    def set_cache(self, cache: "ResponseCache | None"):
+        """
+        Serves repeated requests from a `ResponseCache`, which can be shared by
+        several instances. None disables caching again.
+        """
+        self._cache = cache
+
+    def set_deduplicator(self, deduplicator: Deduplicator | None):
+        """
+        Drops the results repeating an earlier one, on this instance or on any
+        other instance sharing the same `Deduplicator`, before they reach
+        __results. None keeps every result again.
+        """
+        self._deduplicator = deduplicator
+
+    def set_rate_limiter(self, rate_limiter: RateLimiter | None):
+        """
+        Paces the requests with a `RateLimiter`, which retries throttled ones
+        with backoff. Share `RateLimiter.shared()` between instances so they
+        coordinate. None sends requests as fast as they come again.
+        """
+        self._rate_limiter = rate_limiter
+
+    def set_watch_store(self, watch_store: "WatchStore | None"):
+        """
+        Keeps the watermarks of `poll_new` and `poll_new_news` in a
+        `WatchStore`, e.g. `WatchStore("watch.sqlite")` to survive restarts.
+        """
+        self._watch_store = watch_store
+
+    def set_metrics(self, metrics: Metrics | None):
+        """
+        Reports stage timings and counters to a `Metrics`, which can be shared
+        by several instances. None turns instrumentation off again.
+        """
+        self._metrics = metrics
+
+    def set_sink(self, sink: "Sink | None", keep_results: bool = True):
+        """
+        Writes the results to a `Sink` (`NdjsonSink`, `ParquetSink`,
+        `SqliteSink`) as get_page() and get_news() collect them, in batches.
+        Close the sink once done to write its last batch.
+        Parameters:
+        sink = destination of the results, None stops writing them
+        keep_results = also keep them in __results, False only streams them to the sink
+        """
+        self._sink = sink
+        self._keep_results = keep_results or sink is None
+
     def set_lang(self, lang: str):
         self._lang = lang
 
@@ -95,6 +275,12 @@ class GoogleNews:
         self._period = period
 
     def set_time_range(self, start: str, end: str):
+        """
+        Restricts the results to a date range, instead of a period.
+        Parameters:
+        start, end = dates as mm/dd/yyyy, anything else raises ValueError
+        """
+        check_time_range(start, end)
         self._start = start
         self._end = end
 
@@ -104,6 +290,16 @@ class GoogleNews:
     def set_topic_section(self, topic_section: str):
         self._topic_section = topic_section
 
+    def set_news_backend(self, backend: str):
+        """
+        Chooses how `get_news` reads news.google.com: "html" scrapes the page,
+        "rss" reads the much smaller RSS feed of the same search, topic or section.
+        """
+        if backend not in ("html", "rss"):
+            raise ValueError(f"Unknown news backend {backend!r}, use 'html' or 'rss'")
+
+        self._news_backend = backend
+
     def search(self, search_key: str):
         """
         Searches for a term in google.com in the news section and retrieves the first page into __results.
@@ -125,61 +321,54 @@ class GoogleNews:
         Parameter:
         page = number of the page to be retrieved
         """
-        results: list[NewsResult] = []
-        try:
-            if self._start != "" and self._end != "":
-                url = "https://www.google.com/search?q={}&lr=lang_{}&biw=1920&bih=976&source=lnt&&tbs=lr:lang_1{},cdr:1,cd_min:{},cd_max:{},sbd:1&tbm=nws&start={}".format(self._search_key,self._lang,self._lang,self._start,self._end,(10 * (page - 1)))
-            elif self._period != "":
-                url = "https://www.google.com/search?q={}&lr=lang_{}&biw=1920&bih=976&source=lnt&&tbs=lr:lang_1{},qdr:{},,sbd:1&tbm=nws&start={}".format(self._search_key,self._lang,self._lang,self._period,(10 * (page - 1)))
-            else:
-                url = "https://www.google.com/search?q={}&lr=lang_{}&biw=1920&bih=976&source=lnt&&tbs=lr:lang_1{},sbd:1&tbm=nws&start={}".format(self._search_key,self._lang,self._lang,(10 * (page - 1)))
-        except AttributeError as error:
-            raise AttributeError("You need to run a search() before using get_page().") from error
+        query = self._query(self._search_key)
 
         try:
-            result = self._build_response(url)
-            for item in result:
-                title = ""
-                title_el = item.find("h3")
-                if title_el:
-                    title = title_el.get_text().replace("\n", "")
-
-                try:
-                    link = item.get("href").replace('/url?esrc=s&q=&rct=j&sa=U&url=','')
-                except Exception:
-                    link = ''
-                try:
-                    media = item.find('div').find('div').find('div').find_next_sibling('div').text
-                except Exception:
-                    media = ''
-                try:
-                    tmp_date = item.find('div').find_next_sibling('div').find('span').text
-                except Exception:
-                    tmp_date = ''
-                try:
-                    desc = self.remove_after_last_fullstop(item.find('div').find_next_sibling('div').find('div').find_next_sibling('div').find('div').find('div').find('div').text).replace('\n','')
-                except Exception:
-                    desc = ''
-                try:
-                    img = item.find("img").get("src")
-                except Exception:
-                    img = ''
+            result_page = self.fetch(query, page)
+            self._total_count = result_page.total_count
 
-                results.append({
-                    'title': title,
-                    'media': media,
-                    'date': tmp_date.strip(),
-                    'datetime': dateparser.parse(tmp_date),
-                    'desc': desc,
-                    'link': GoogleNews.fix_url(link),
-                    'img': img
-                })
+            return result_page.results
         except Exception as e_parser:
+            self._count("errors", error=type(e_parser).__name__)
             print(e_parser)
             if self._exception:
                 raise
 
-        return results
+        return []
+
+    def fetch(self, query: Query, page: int = 1):
+        """
+        Retrieves a page of the google.com news search `query` as a
+        `ResultPage`. Unlike page_at(), it neither reads nor changes the
+        settings and __results of the instance, so one instance, with its
+        transport, caches and rate limiter, can serve many threads. Errors
+        are raised.
+        Parameters:
+        query = the `Query` to run
+        page = number of the page to be retrieved
+        """
+        url = query.search_url(page)
+        headers = self._headers_for(query.lang)
+
+        cached = self._cached_page(url, headers)
+        if cached is not None:
+            results, total_count = cached
+        else:
+            results, total_count = self._search_page(
+                query.search_url(page, localized=True), query.lang, headers
+            )
+            self._cache_results(url, results, total_count, headers)
+
+        return ResultPage(query, page, results, total_count)
+
+    def fetch_news(self, query: Query, deamplify: bool = False):
+        """ `fetch` for news.google.com searches, topics and sections. """
+
+        url, cache_url = self._news_urls(deamplify=deamplify, query=query)
+
+        results = self._news_at(url, cache_url, deamplify, query.lang)
+
+        return ResultPage(query, 1, results)
 
     def get_page(self, page: int = 1):
         """
@@ -187,164 +376,220 @@ class GoogleNews:
         Parameter:
         page = number of the page to be retrieved
         """
-        try:
-            if self._start != "" and self._end != "":
-                url = "https://www.google.com/search?q={}&lr=lang_{}&biw=1920&bih=976&source=lnt&&tbs=lr:lang_1{},cdr:1,cd_min:{},cd_max:{},sbd:1&tbm=nws&start={}".format(self._search_key,self._lang,self._lang,self._start,self._end,(10 * (page - 1)))
-            elif self._period != "":
-                url = "https://www.google.com/search?q={}&lr=lang_{}&biw=1920&bih=976&source=lnt&&tbs=lr:lang_1{},qdr:{},,sbd:1&tbm=nws&start={}".format(self._search_key,self._lang,self._lang,self._period,(10 * (page - 1)))
+        self._add_results(self.page_at(page))
+
+    def iter_results(
+        self,
+        search_key: str | None = None,
+        max_pages: int | None = None,
+        stop_when_older_than: datetime | timedelta | None = None,
+    ) -> Iterator[NewsResult]:
+        """
+        Yields the results of the search page after page, without keeping them
+        in __results. The next page is only fetched once the previous one has
+        been consumed.
+        Parameters:
+        search_key = the search term, defaults to the one given to search()
+        max_pages = maximum number of pages to retrieve
+        stop_when_older_than = datetime, or age as a timedelta; older results are
+                               skipped and paging stops at the first page only
+                               holding older results
+        """
+        step = self._result_pager(search_key, stop_when_older_than)
+
+        for page in self._page_numbers(max_pages):
+            results, last_page = step(self.page_at(page))
+            yield from results
+
+            if last_page:
+                return
+
+    def batch(
+        self,
+        queries: Iterable[str | dict[str, Any]],
+        pages: int = 1,
+        workers: int = 8,
+        parse_processes: int | None = None,
+    ):
+        """
+        Runs many searches at once and returns a BatchResult per query, in the
+        order of `queries`, without touching __results.
+        Pages are downloaded by `workers` threads. With `parse_processes` they
+        are parsed in a pool of that many processes while the next pages
+        download, instead of in the downloading threads.
+        A failing query records its exception in BatchResult.error and does not
+        stop the other ones.
+        Parameters:
+        queries = search terms, or dicts of a search term ("key") and of "lang",
+                  "period", "start" and "end" overriding this instance's settings
+        pages = number of pages to retrieve per query
+        """
+        from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+        from .Batch import BatchResult, parse_search_page
+
+        batch = [BatchResult(query) for query in queries]
+        process_pool = ProcessPoolExecutor(parse_processes) if parse_processes else None
+
+        def run(item: BatchResult):
+            started = perf_counter()
+            try:
+                search(item)
+            finally:
+                item.seconds = perf_counter() - started
+
+        def search(item: BatchResult):
+            if isinstance(item.query, str):
+                options = {"key": item.query}
             else:
-                url = "https://www.google.com/search?q={}&lr=lang_{}&biw=1920&bih=976&source=lnt&&tbs=lr:lang_1{},sbd:1&tbm=nws&start={}".format(self._search_key,self._lang,self._lang,(10 * (page - 1)))
-        except AttributeError as error:
-            raise AttributeError("You need to run a search() before using get_page().") from error
+                options = dict(item.query)
+            search_key = quote(options.pop("key"))
+            client = self._copy(**options)
+
+            # (url, future) of the pages parsed in the process pool,
+            # (None, parsed) otherwise
+            pages_done = []
+            query = client._query(search_key)
+            urls = query.search_urls(range(1, pages + 1))
+            localized_urls = query.search_urls(range(1, pages + 1), localized=True)
+            try:
+                for url, localized_url in zip(urls, localized_urls, strict=True):
+                    results = client._cached_results(url)
+                    if results is not None:
+                        pages_done.append((None, (results, client._total_count)))
+                        continue
+
+                    content = client._fetch(localized_url)
+                    if process_pool is not None:
+                        pages_done.append((url, process_pool.submit(
+                            parse_search_page,
+                            content,
+                            client._lang,
+                            client._parser.backend,
+                            client._parser.selective,
+                            client._extractor,
+                            client._url_canonicalizer,
+                        )))
+                        continue
+
+                    results = client._parse_items(client._parse_response(content))
+                    client._cache_results(url, results, client._total_count)
+                    pages_done.append((None, (results, client._total_count)))
+            except Exception as error:
+                item.error = error
+            finally:
+                for url, outcome in pages_done:
+                    if url is not None:
+                        try:
+                            outcome = outcome.result()
+                        except Exception as error:
+                            item.error = item.error or error
+                            break
+                        client._cache_results(url, *outcome)
+
+                    item.results.extend(outcome[0])
+                    item.total_count = outcome[1]
 
         try:
-            result = self._build_response(url)
-            for item in result:
-                try:
-                    text = item.find("h3").text.replace("\n","")
-                except Exception:
-                    text = ''
-                try:
-                    link = item.get("href").replace('/url?esrc=s&q=&rct=j&sa=U&url=','')
-                except Exception:
-                    link = ''
-                try:
-                    media = item.find('div').find('div').find('div').find_next_sibling('div').text
-                except Exception:
-                    media = ''
-                try:
-                    tmp_date = item.find('div').find_next_sibling('div').find('span').text
-                except Exception:
-                    tmp_date = ''
-                try:
-                    desc = self.remove_after_last_fullstop(item.find('div').find_next_sibling('div').find('div').find_next_sibling('div').find('div').find('div').find('div').text).replace('\n','')
-                except Exception:
-                    desc = ''
-                try:
-                    tmp_img = item.find("img").get("src")
-                except Exception:
-                    tmp_img = ''
+            with ThreadPoolExecutor(workers) as thread_pool:
+                list(thread_pool.map(run, batch))
+        finally:
+            if process_pool is not None:
+                process_pool.shutdown()
 
-                self._results.append({
-                    'title': text,
-                    'media': media,
-                    'date': tmp_date.strip(),
-                    'datetime': dateparser.parse(tmp_date),
-                    'desc': desc,
-                    'link': GoogleNews.fix_url(link),
-                    'img': tmp_img
-                })
-        except Exception as e_parser:
-            print(e_parser)
-            if self._exception:
-                raise
+        if self._deduplicator is not None:
+            for item in batch:
+                item.results = self._deduplicator.filter(item.results)
 
-    def get_news(self, key: str = "", deamplify: bool = False):
-        if self._period != "":
-            key += f"when:{self._period}"
+        return batch
 
-        key = quote(key)
+    def search_languages(
+        self,
+        search_key: str,
+        langs: Iterable[str],
+        pages: int = 1,
+        workers: int = 8,
+    ):
+        """
+        Runs the search `search_key` in every language of `langs` at once and
+        returns a LanguageResults, without touching __results. The date
+        parsers of the languages are loaded before the searches start, and
+        shared by them with the transport and caches of this instance.
+        A failing language records its exception in its BatchResult and does
+        not stop the other ones.
+        Parameters:
+        search_key = the search term
+        langs = languages of the results, e.g. ["en", "it", "ru"]
+        pages = number of pages to retrieve per language
+        workers = number of languages searched at the same time
+        """
+        from concurrent.futures import ThreadPoolExecutor
 
-        if self._start and self._end:
-            start = f'{self._start[-4:]}-{self._start[:2]}-{self._start[3:5]}'
-            end = f'{self._end[-4:]}-{self._end[:2]}-{self._end[3:5]}'
+        searched, queries = self._language_search(search_key, langs)
 
-            url = f"https://news.google.com/search?q={key}+before:{end}+after:{start}&hl={self._lang}"
-        else:
-            url = f"https://news.google.com/search?q={key}&hl={self._lang}"
+        def run(lang: str):
+            item = searched.languages[lang]
+            started = perf_counter()
+            try:
+                for page in range(1, pages + 1):
+                    self._add_language_page(item, self.fetch(queries[lang], page))
+            except Exception as error:
+                self._count("errors", error=type(error).__name__)
+                item.error = error
+            finally:
+                item.seconds = perf_counter() - started
+
+        with ThreadPoolExecutor(workers) as thread_pool:
+            list(thread_pool.map(run, queries))
 
-        if self._topic:
-            url = f"https://news.google.com/topics/{self._topic}"
+        return self._merge_languages(searched)
 
-            if self._topic_section:
-                url += f"/sections/{self._topic_section}"
+    def poll_new(
+        self,
+        search_key: str | None = None,
+        max_pages: int | None = None,
+    ):
+        """
+        Returns the results of the search that were not returned by a previous
+        poll, without adding them to __results. Paging stops at the first page
+        reaching results seen before, or older than the newest one seen.
+        Parameters:
+        search_key = the search term, defaults to the one given to search()
+        max_pages = maximum number of pages to retrieve, e.g. for the first poll
+        """
+        step, done = self._result_poller(search_key)
+
+        for page in self._page_numbers(max_pages):
+            if step(self.page_at(page)):
+                break
+
+        return done()
+
+    def poll_new_news(self, key: str = "", deamplify: bool = False):
+        """
+        `poll_new` for news.google.com searches, topics and sections: the
+        articles of the page that were not returned by a previous poll.
+        """
+        url, cache_url, done = self._news_poller(key, deamplify)
 
         try:
-            request = Request(url, headers=self._headers)
-            with urlopen(request) as response:
-                page = response.read()
+            results = self._news_at(url, cache_url, deamplify)
+        except Exception as e_parser:
+            self._count("errors", error=type(e_parser).__name__)
+            print(e_parser)
+            if self._exception:
+                raise
+            return []
 
-            soup = BeautifulSoup(page, "html.parser")
-            articles = soup.select('article')
-            for article in articles:
-                try:
-                    # title
-                    try:
-                        title=article.findAll('div')[2].findAll('a')[0].text
-                    except:
-                        try:
-                            title=article.findAll('a')[1].text
-                        except:
-                            title=None
-                    # description
-                    try:
-                        desc=None
-                    except:
-                        desc=None
-                    # date
-                    try:
-                        date = article.find("time").text
-                        # date,datetime_tmp = lexial_date_parser(date)
-                    except:
-                        date = None
-                    # datetime
-                    try:
-                        datetime_chars=article.find('time').get('datetime')
-                        datetime_obj = parse(datetime_chars).replace(tzinfo=None)
-                    except:
-                        datetime_obj=None
-                    # link
-                    if deamplify:
-                        try:
-                            link = 'https://news.google.com/' + article.find('div').find("a").get("href")[2:]
-                        except Exception as deamp_e:
-                            print(deamp_e)
-                            link = article.find("article").get("jslog").split('2:')[1].split(';')[0]
-                    else:
-                        try:
-                            link = 'https://news.google.com/' + article.find('div').find("a").get("href")[2:]
-                        except Exception as deamp_e:
-                            print(deamp_e)
-                            link = None
-                    if link.startswith('https://www.youtube.com/watch?v='):
-                        desc = 'video'
-                    # image
-                    try:
-                        img = 'https://news.google.com'+article.find("figure").find("img").get("src")
-                    except:
-                        img = None
-                    # site
-                    try:
-                        site=article.find("time").parent.find("a").text
-                    except:
-                        site=None
-                    try:
-                        media=article.find("div").findAll("div")[1].find("div").find("div").find("div").text
-                    except:
-                        try:
-                            media=article.findAll("div")[1].find("div").find("div").find("div").text
-                        except:
-                            media=None
-                    # reporter
-                    try:
-                        reporter = article.findAll('span')[2].text
-                    except:
-                        reporter = None
-                    # collection
-                    self._results.append({
-                        'title': title,
-                        'desc': desc,
-                        'date': date,
-                        'datetime': dateparser.parse(date),
-                        'link': GoogleNews.fix_url(link),
-                        'img': img,
-                        'media': media,
-                        'site': site,
-                        'reporter': reporter
-                    })
-                except Exception as e_article:
-                    print(e_article)
+        return done(results)
+
+    def get_news(self, key: str = "", deamplify: bool = False):
+        url, cache_url = self._news_urls(key, deamplify)
+
+        try:
+            self._add_results(self._news_at(url, cache_url, deamplify))
         except Exception as e_parser:
+            self._count("errors", error=type(e_parser).__name__)
             print(e_parser)
             if self._exception:
                 raise
@@ -355,14 +600,32 @@ class GoogleNews:
     def results(self, sort: bool = False):
         """
         Returns the __results.
-        New feature: include datatime and sort the articles in decreasing order
+        New feature: include datatime and sort the articles in decreasing order,
+        the results without datetime last
         """
 
         if sort:
-            self._results.sort(key=lambda r: r["datetime"], reverse=True)
+            # The index keeps them ordered as pages are added, no sort needed
+            self._results[:] = self._index.results()
 
         return self._results
 
+    def results_index(self):
+        """
+        Returns the __results as a `ResultIndex` ordered by datetime, for
+        `top_k(n)`, `between(start, end)` and `by_media()`.
+        """
+
+        return self._index
+
+    def results_batch(self):
+        """
+        Returns the __results as a column-wise `NewsBatch`, to export them
+        to Arrow, pandas or NumPy.
+        """
+
+        return NewsBatch(self._results)
+
     def get_texts(self):
         """ Returns only the __texts of the __results. """
 
@@ -375,51 +638,703 @@ class GoogleNews:
 
     def clear(self):
         self._results = []
+        self._index = ResultIndex()
         self._total_count = 0
 
-    def _build_response(self, url: str):
-        request = Request(
-            url.replace("search?", f"search?hl={self._lang}&gl={self._lang}&"),
-            headers=self._headers
+    def _search_url(self, page: int = 1, search_key: str | None = None):
+        if search_key is None:
+            search_key = self._search_key
+
+        return self._query(search_key).search_url(page)
+
+    def _news_url(self, key: str = ""):
+        return self._query(quote(key)).news_url()
+
+    def _query(self, search_key: str | None):
+        """ `Query` of the settings of the instance, for the quoted `search_key`. """
+
+        # Pages asked for before any search() keep querying "None", as they always did
+        return Query(
+            key=unquote(str(search_key)),
+            lang=self._lang,
+            period=self._period,
+            start=self._start,
+            end=self._end,
+            topic=self._topic,
+            topic_section=self._topic_section,
         )
-        with urlopen(request) as response:
-            page = response.read()
 
-        soup = BeautifulSoup(page, "html.parser")
+    def _news_urls(
+        self,
+        key: str = "",
+        deamplify: bool = False,
+        query: Query | None = None,
+    ):
+        """ URL of the news.google.com page or feed, and its cache key. """
+
+        url = query.news_url() if query is not None else self._news_url(key)
+        if self._news_backend == "rss":
+            from .Feed import feed_url
+
+            return feed_url(url), feed_url(url)
+
+        return url, url + "#deamplify" if deamplify else url
+
+    def _news_at(
+        self,
+        url: str,
+        cache_url: str,
+        deamplify: bool = False,
+        lang: str | None = None,
+    ):
+        lang = lang if lang is not None else self._lang
+        headers = self._headers_for(lang)
+
+        cached = self._cached_page(cache_url, headers)
+        if cached is not None:
+            return cached[0]
+
+        if self._streaming:
+            page = self._fetch_stream(url, headers)
+        else:
+            page = self._fetch(url, headers)
+        results = self._parse_news_page(page, deamplify, lang)
+        self._cache_results(cache_url, results, headers=headers)
+
+        return results
+
+    def _copy(
+        self,
+        lang: str | None = None,
+        period: str | None = None,
+        start: str | None = None,
+        end: str | None = None,
+    ):
+        """
+        New instance with the settings of this one, sharing its transport and
+        caches.
+        """
+
+        client = GoogleNews(
+            lang=self._lang if lang is None else lang,
+            period=self._period if period is None else period,
+            start=self._start if start is None else start,
+            end=self._end if end is None else end,
+            transport=self._transport,
+            parser=self._parser,
+        )
+        client._user_agent = self._user_agent
+        client._topic = self._topic
+        client._topic_section = self._topic_section
+        client._news_backend = self._news_backend
+        client._exception = self._exception
+        client._streaming = self._streaming
+        client._extractor = self._extractor
+        client._url_canonicalizer = self._url_canonicalizer
+        client._date_normalizer = self._date_normalizer
+        client._cache = self._cache
+        client._rate_limiter = self._rate_limiter
+        client._watch_store = self._watch_store
+        client._metrics = self._metrics
+
+        return client
+
+    @staticmethod
+    def _page_numbers(max_pages: int | None):
+        return count(1) if max_pages is None else range(1, max_pages + 1)
+
+    def _result_pager(
+        self,
+        search_key: str | None,
+        stop_when_older_than: datetime | timedelta | None,
+    ):
+        """
+        Body of the `iter_results` loop, shared with AsyncGoogleNews: returns
+        a function called with the results of every page in turn, returning
+        the ones to yield and whether that page was the last one.
+        """
+        if search_key is not None:
+            self._search_key = quote(search_key)
+
+        cutoff = self._cutoff(stop_when_older_than)
+        previous_links: set[str] = set()
+
+        def step(results: list[NewsResult]):
+            nonlocal previous_links
+
+            results, previous_links, last_page = self._page_window(
+                results, cutoff, previous_links
+            )
+            if self._deduplicator is not None:
+                results = self._deduplicator.filter(results)
+
+            return results, last_page
+
+        return step
+
+    @staticmethod
+    def _cutoff(older_than: datetime | timedelta | None):
+        if isinstance(older_than, timedelta):
+            return datetime.now() - older_than
+
+        return older_than
+
+    @staticmethod
+    def _page_window(
+        results: list[NewsResult],
+        cutoff: datetime | None,
+        previous_links: set[str],
+    ):
+        """
+        Drops the results older than `cutoff` from a page, and tells whether
+        paging should stop: the page is empty, only holds older results or
+        repeats the previous page, as google does past the last page.
+        """
+        links = {result["link"] for result in results}
+        if not results or links == previous_links:
+            return [], links, True
+
+        if cutoff is None:
+            return results, links, False
+
+        kept = [
+            result for result in results
+            if result["datetime"] is None or result["datetime"] >= cutoff
+        ]
+        dated = [
+            result["datetime"] for result in results if result["datetime"] is not None
+        ]
+
+        return kept, links, bool(dated) and all(value < cutoff for value in dated)
+
+    def _stage(self, name: str, **attributes: Any):
+        if self._metrics is None:
+            return NO_STAGE
+
+        return self._metrics.stage(name, **attributes)
+
+    def _count(self, name: str, value: float = 1, **labels: str):
+        if self._metrics is not None:
+            self._metrics.count(name, value, **labels)
+
+    def _count_missing(
+        self, fields: dict[str, Any], names: Iterable[str] | None = None
+    ):
+        for name in fields if names is None else names:
+            value = fields[name]
+            if value is None or value == '':
+                self._metrics.count("parse_failures", field=name)
+
+    def _result_poller(self, search_key: str | None):
+        """
+        State of a `poll_new` run, shared with AsyncGoogleNews: `step` is
+        called with the results of every page in turn and tells whether
+        paging should stop, `done` records the new results in the watch store
+        and returns them.
+        """
+        if search_key is not None:
+            self._search_key = quote(search_key)
+
+        query = self._search_url(1)
+        watermark = self._watermark(query)
+        new: list[NewsResult] = []
+        polled: set[str] = set()
+        previous_links: set[str] = set()
+
+        def step(results: list[NewsResult]):
+            nonlocal previous_links
+
+            results, previous_links, last_page = self._page_window(
+                results, None, previous_links
+            )
+            unseen, caught_up = self._unseen(results, watermark, polled)
+            new.extend(unseen)
+
+            return last_page or caught_up
+
+        def done():
+            self._watch_store.update(query, new)
+            return new
+
+        return step, done
+
+    def _news_poller(self, key: str, deamplify: bool):
+        """
+        URL and cache key of a `poll_new_news` run, shared with
+        AsyncGoogleNews, and the function recording the new results of its
+        page in the watch store and returning them.
+        """
+        url, cache_url = self._news_urls(key, deamplify)
+        watermark = self._watermark(cache_url)
+
+        def done(results: list[NewsResult]):
+            new, _ = self._unseen(results, watermark, set())
+            self._watch_store.update(cache_url, new)
+            return new
+
+        return url, cache_url, done
+
+    def _language_search(self, search_key: str, langs: Iterable[str]):
+        """
+        The empty LanguageResults of `search_languages` and the Query of each
+        language, once the date parsers of the languages are loaded.
+        """
+        from .Batch import BatchResult, LanguageResults
+
+        queries = {
+            lang: Query(search_key, lang, self._period, self._start, self._end)
+            for lang in dict.fromkeys(langs)
+        }
+        searched = LanguageResults(
+            languages={
+                lang: BatchResult({"key": search_key, "lang": lang})
+                for lang in queries
+            }
+        )
+
+        started = perf_counter()
+        self._date_normalizer.warm(queries)
+        searched.warmup_seconds = perf_counter() - started
+
+        return searched, queries
+
+    @staticmethod
+    def _add_language_page(item: "BatchResult", result_page: ResultPage):
+        # Copies, the cache may hold the results of fetch
+        lang = item.query["lang"]
+        item.results.extend({**result, "lang": lang} for result in result_page.results)
+        item.total_count = result_page.total_count
+
+    def _merge_languages(self, searched: "LanguageResults"):
+        index = ResultIndex()
+        for item in searched.languages.values():
+            if self._deduplicator is not None:
+                item.results = self._deduplicator.filter(item.results)
+            index.add(item.results)
+        searched.results = index.results()
+
+        return searched
+
+    def _watermark(self, query: str):
+        if self._watch_store is None:
+            raise AttributeError("You need to set_watch_store() before polling.")
+
+        return self._watch_store.load(query)
+
+    @staticmethod
+    def _unseen(
+        results: list[NewsResult], watermark: "Watermark", polled: set[str]
+    ):
+        """
+        The results of a page missing from `watermark` and from the `polled`
+        links of the current poll, which records them, and whether the page
+        reached the results of the previous poll.
+        """
+        unseen = []
+        caught_up = False
+        for result in results:
+            link = canonical_url(result["link"] or "")
+            if link in watermark.links:
+                caught_up = True
+            elif link not in polled:
+                polled.add(link)
+                unseen.append(result)
+
+        dated = [result for result in results if result["datetime"] is not None]
+        if dated and all(watermark.is_older(result) for result in dated):
+            caught_up = True
+
+        return unseen, caught_up
+
+    def _add_results(self, results: list[NewsResult]):
+        if self._deduplicator is not None:
+            results = self._deduplicator.filter(results)
+
+        if self._sink is not None:
+            self._sink.write(results)
+        if self._keep_results:
+            self._results.extend(results)
+            self._index.add(results)
+
+    def _fetch(self, url: str, headers: dict[str, str] | None = None):
+        if headers is None:
+            headers = self._headers
+
+        if self._cache is not None:
+            page = self._cache.get_page(url, headers)
+            if page is not None:
+                self._count("cache_hits")
+                return page
+
+        attempts = 0
+
+        def download():
+            nonlocal attempts
+            attempts += 1
+            if attempts > 1:
+                self._count("retries")
+
+            with self._stage("download", url=url):
+                page = self._transport.fetch(url, headers)
+
+            self._count("requests")
+            self._count("bytes_downloaded", len(page))
+            return page
+
+        if self._rate_limiter is not None:
+            page = self._rate_limiter.call(url, download)
+        else:
+            page = download()
+            # A CAPTCHA or consent page would otherwise parse as an empty page
+            raise_if_blocked(url, page)
+
+        if self._cache is not None:
+            self._cache.set_page(url, headers, page)
+
+        return page
+
+    def _fetch_stream(self, url: str, headers: dict[str, str] | None = None):
+        """
+        `_fetch` handing the page over in chunks as they download. Only the
+        first chunk is read here, to raise errors and blocked pages right away.
+        """
+        if headers is None:
+            headers = self._headers
+
+        if self._cache is not None:
+            page = self._cache.get_page(url, headers)
+            if page is not None:
+                self._count("cache_hits")
+                return iter((page,))
+
+        attempts = 0
+        chunks = None
+
+        def download():
+            nonlocal attempts, chunks
+            attempts += 1
+            if attempts > 1:
+                self._count("retries")
+                if chunks is not None:
+                    chunks.close()
+
+            with self._stage("download", url=url):
+                chunks = self._transport.stream(url, headers)
+                first = next(chunks, b"")
+
+            self._count("requests")
+            return first
+
+        if self._rate_limiter is not None:
+            first = self._rate_limiter.call(url, download)
+        else:
+            first = download()
+            raise_if_blocked(url, first)
+
+        return self._downloaded(url, headers, first, chunks)
+
+    def _downloaded(
+        self,
+        url: str,
+        headers: dict[str, str],
+        first: bytes,
+        chunks: Iterator[bytes],
+    ):
+        """ The chunks of a streamed page, cached once the page is complete. """
+
+        size = 0
+        page = [] if self._cache is not None else None
+        try:
+            with closing(chunks):
+                for chunk in chain((first,), chunks):
+                    size += len(chunk)
+                    if page is not None:
+                        page.append(chunk)
+                    yield chunk
+        finally:
+            self._count("bytes_downloaded", size)
+
+        if page is not None:
+            self._cache.set_page(url, headers, b"".join(page))
+
+    def _cached_results(self, url: str):
+        """ Parsed results of `url` if the cache holds them, None otherwise. """
+
+        cached = self._cached_page(url, self._headers)
+        if cached is None:
+            return None
+
+        results, total_count = cached
+        if total_count is not None:
+            self._total_count = total_count
+
+        return results
+
+    def _cached_page(self, url: str, headers: dict[str, str]):
+        """ Parsed results and result count of `url` if the cache holds them. """
+
+        if self._cache is None:
+            return None
+
+        return self._cache.get_results(url, headers)
+
+    def _cache_results(
+        self,
+        url: str,
+        results: list[NewsResult],
+        total_count: int | None = None,
+        headers: dict[str, str] | None = None,
+    ):
+        if self._cache is not None:
+            if headers is None:
+                headers = self._headers
+            self._cache.set_results(url, headers, (results, total_count))
+
+    def _search_page(self, url: str, lang: str, headers: dict[str, str]):
+        """
+        Downloads and extracts the google.com result page `url`, localized,
+        returning its results and result count without touching the state of
+        the instance.
+        """
+        if not self._streaming:
+            items, total_count = self._parse_search(self._fetch(url, headers))
+            return self._parse_items(items, lang), total_count
+
+        counts = []
+
+        def items():
+            # The result stats come before the results
+            for tag in self._parser.search_stream(self._fetch_stream(url, headers)):
+                if tag.name == "div":
+                    counts.append(self._stats_count(tag.text))
+                else:
+                    yield tag
+
+        results = self._parse_items(items(), lang)
+        return results, counts[-1] if counts else 0
+
+    @staticmethod
+    def _stats_count(stats: str):
+        # "About 1,230,000 results (0.45 seconds)", "Page 2 of about 12 results",
+        # "Результатов: примерно 1 230 000": without the time in parentheses,
+        # the count is the last number
+        stats = re.sub(r"\([^)]*\)|（[^）]*）", "", stats)
+        numbers = re.findall(r"\d[\d,.\s]*\d|\d", stats)
+
+        return int(re.sub(r"\D", "", numbers[-1])) if numbers else 0
+
+    def _parse_response(self, page: bytes):
+        result, self._total_count = self._parse_search(page)
+        return result
+
+    def _parse_search(self, page: bytes):
+        """ The `<a data-ved>` nodes of a google.com page, and its result count. """
+
+        with self._stage("parse"):
+            soup = self._parser.search_soup(page)
         stats = soup.find_all("div", id="result-stats")
         if stats:
-            stats = re.search(r"[\d,]+", stats[0].text)
-            self._total_count = int(stats.group(0).replace(',', '') if stats else 0)
+            total_count = self._stats_count(stats[0].text)
         else:
             #TODO might want to add output for user to know no data was found
-            self._total_count = 0
+            total_count = 0
             logging.debug('Total count is not available when sort by date')
 
         result = soup.find_all("a", attrs={'data-ved': True})
-        return result
+        return result, total_count
+
+    def _parse_items(self, items, lang: str | None = None):
+        """ Extracts the results of the `<a data-ved>` nodes of a google.com page. """
+
+        if lang is None:
+            lang = self._lang
+
+        results: list[NewsResult] = []
+        with self._stage("extract"):
+            for item in items:
+                fields = self._extractor.extract(item)
+                if self._metrics is not None:
+                    self._count_missing(fields)
+
+                title = fields["title"] or ''
+                link = fields["link"] or ''
+                tmp_date = fields["date"] or ''
+                desc = fields["desc"] or ''
+                with self._stage("dates"):
+                    parsed_date = self._date_normalizer.parse(tmp_date, lang)
+                with self._stage("urls"):
+                    link = self._url_canonicalizer.canonicalize(
+                        link.replace('/url?esrc=s&q=&rct=j&sa=U&url=', '')
+                    )
+
+                results.append({
+                    'title': title.replace("\n",""),
+                    'media': fields["media"] or '',
+                    'date': tmp_date.strip(),
+                    'datetime': parsed_date,
+                    'desc': self.remove_after_last_fullstop(desc).replace('\n',''),
+                    'link': link,
+                    'img': fields["img"] or ''
+                })
+
+        self._count("items_parsed", len(results))
+        return results
+
+    def _parse_news_page(
+        self,
+        page: bytes | Iterable[bytes],
+        deamplify: bool = False,
+        lang: str | None = None,
+    ):
+        if self._news_backend == "rss":
+            return self._parse_feed(page)
+
+        return self._parse_news(page, deamplify, lang)
+
+    def _parse_feed(self, page: bytes | Iterable[bytes]):
+        """ Extracts the items of a news.google.com RSS feed. """
+        from .Feed import parse_feed
+
+        with self._stage("parse"):
+            results = parse_feed(page)
+
+        with self._stage("urls"):
+            for result in results:
+                if result["link"]:
+                    result["link"] = self._url_canonicalizer.canonicalize(
+                        result["link"]
+                    )
+
+        if self._metrics is not None:
+            for result in results:
+                self._count_missing(result, FEED_FIELDS)
+        self._count("items_parsed", len(results))
+        return results
+
+    def _parse_news(
+        self,
+        page: bytes | Iterable[bytes],
+        deamplify: bool = False,
+        lang: str | None = None,
+    ):
+        """ Extracts the articles of a news.google.com page, or of its chunks. """
+
+        if isinstance(page, bytes):
+            with self._stage("parse"):
+                articles = self._parser.news_soup(page).select('article')
+        else:
+            articles = self._parser.news_stream(page)
+        with self._stage("extract"):
+            results = self._parse_articles(articles, deamplify, lang)
+
+        if self._metrics is not None:
+            for result in results:
+                self._count_missing(result, NEWS_FIELDS)
+        self._count("items_parsed", len(results))
+        return results
+
+    def _parse_articles(
+        self,
+        articles,
+        deamplify: bool = False,
+        lang: str | None = None,
+    ):
+        if lang is None:
+            lang = self._lang
+        results: list[NewsResult] = []
+
+        for article in articles:
+            try:
+                # title
+                try:
+                    title=article.findAll('div')[2].findAll('a')[0].text
+                except:
+                    try:
+                        title=article.findAll('a')[1].text
+                    except:
+                        title=None
+                # description
+                try:
+                    desc=None
+                except:
+                    desc=None
+                # date
+                try:
+                    date = article.find("time").text
+                    # date,datetime_tmp = lexial_date_parser(date)
+                except:
+                    date = None
+                # datetime
+                try:
+                    datetime_chars=article.find('time').get('datetime')
+                    datetime_obj = self._date_normalizer.parse(datetime_chars, lang)
+                except:
+                    datetime_obj=None
+                # link
+                if deamplify:
+                    try:
+                        link = 'https://news.google.com/' + article.find('div').find("a").get("href")[2:]
+                    except Exception as deamp_e:
+                        print(deamp_e)
+                        link = article.find("article").get("jslog").split('2:')[1].split(';')[0]
+                else:
+                    try:
+                        link = 'https://news.google.com/' + article.find('div').find("a").get("href")[2:]
+                    except Exception as deamp_e:
+                        print(deamp_e)
+                        link = None
+                if link.startswith('https://www.youtube.com/watch?v='):
+                    desc = 'video'
+                # image
+                try:
+                    img = 'https://news.google.com'+article.find("figure").find("img").get("src")
+                except:
+                    img = None
+                # site
+                try:
+                    site=article.find("time").parent.find("a").text
+                except:
+                    site=None
+                try:
+                    media=article.find("div").findAll("div")[1].find("div").find("div").find("div").text
+                except:
+                    try:
+                        media=article.findAll("div")[1].find("div").find("div").find("div").text
+                    except:
+                        media=None
+                # reporter
+                try:
+                    reporter = article.findAll('span')[2].text
+                except:
+                    reporter = None
+                # collection
+                results.append({
+                    'title': title,
+                    'desc': desc,
+                    'date': date,
+                    'datetime': datetime_obj or self._date_normalizer.parse(date, lang),
+                    'link': self._url_canonicalizer.canonicalize(link),
+                    'img': img,
+                    'media': media,
+                    'site': site,
+                    'reporter': reporter
+                })
+            except Exception as e_article:
+                print(e_article)
+
+        return results
 
     @classmethod
     def fix_url(cls, url: str):
-        url = url.removeprefix("/url?q=")
+        """ Article URL of a result link, see `UrlCanonicalizer`. """
 
-        return cls.remove_query_params_from_url(
-            cls.fix_malformed_query_string(url)
-        )
+        return default_url_canonicalizer.canonicalize(url)
 
     @staticmethod
     def fix_malformed_query_string(url: str):
-        url = unquote(unquote(url))
         """ Sometimes the url comes double url encoded """
 
-        if "?" not in url and "&" in url:
-            position_of_first_ampersand = url.find("&")
-            url = (
-                url[:position_of_first_ampersand]
-                + "?"
-                + url[position_of_first_ampersand + 1 :]
-            )
-
-        return url
+        return UrlCanonicalizer.fix_query_string(url)
 
     @staticmethod
     def remove_query_params_from_url(url: str):
@@ -428,17 +1343,5 @@ class GoogleNews:
         those parameters break opening the article
         """
 
-        parsed_url = urlparse(url)
-
-        # Parse the query string into a dictionary
-        query_params = parse_qs(parsed_url.query)
-        query_params.pop("sa", None)
-        query_params.pop("usg", None)
-        query_params.pop("ved", None)
-
-        # Reconstruct the query string
-        new_query = urlencode(query_params, doseq=True)
-
-        # Reconstruct the URL
-        return urlunparse(parsed_url._replace(query=new_query))
+        return default_url_canonicalizer.strip_params(url)
 
@@ -0,0 +1,199 @@
+import threading
+from collections.abc import Callable
+from contextlib import nullcontext
+from time import perf_counter
+from typing import Any
+
+
+# What instances without metrics time their stages with
+NO_STAGE = nullcontext()
+
+Labels = tuple[tuple[str, str], ...]
+Hook = Callable[[str, str, float, dict[str, str]], None]
+
+
+class Stage:
+    """ Times one run of a stage, inside a tracing span when a tracer is set. """
+
+    __slots__ = (
+        "_metrics",
+        "_name",
+        "_attributes",
+        "_span",
+        "_start",
+    )
+
+    _metrics: "Metrics"
+    _name: str
+    _attributes: dict[str, Any]
+    _span: Any
+    _start: float
+
+    def __init__(self, metrics: "Metrics", name: str, attributes: dict[str, Any]):
+        self._metrics = metrics
+        self._name = name
+        self._attributes = attributes
+        self._span = None
+
+    def __enter__(self):
+        tracer = self._metrics.tracer
+        if tracer is not None:
+            self._span = tracer.start_as_current_span(
+                f"googlenews.{self._name}", attributes=self._attributes
+            )
+            self._span.__enter__()
+
+        self._start = perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        elapsed = perf_counter() - self._start
+
+        if self._span is not None:
+            self._span.__exit__(*exc_info)
+        if exc_info[0] is not None:
+            self._metrics.count("stage_errors", stage=self._name)
+        self._metrics.observe(self._name, elapsed)
+
+        return False
+
+
+class Metrics:
+    """
+    Collects what `GoogleNews` instances spend their time on: per stage timers
+    ("connect", "download", "parse", "extract", "dates", "urls"), and counters
+    (requests, bytes downloaded, cache hits, items parsed, parse failures per
+    field, retries, errors).
+    Every measure is also given to the hooks, and stages run inside spans of
+    `tracer`, e.g. `opentelemetry.trace.get_tracer("GoogleNews")` or any object
+    with a compatible `start_as_current_span`. Instances without metrics skip
+    all of it.
+    Parameters:
+    tracer = OpenTelemetry style tracer opening a span per stage
+    """
+
+    __slots__ = (
+        "_tracer",
+        "_hooks",
+        "_lock",
+        "_counters",
+        "_stages",
+    )
+
+    _tracer: Any
+    _hooks: list[Hook]
+    _lock: threading.Lock
+    _counters: dict[tuple[str, Labels], float]
+    _stages: dict[str, list[float]]
+
+    def __init__(self, tracer: Any = None):
+        self._tracer = tracer
+        self._hooks = []
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._stages = {}
+
+    @property
+    def tracer(self):
+        return self._tracer
+
+    def add_hook(self, hook: Hook):
+        """
+        Calls `hook(kind, name, value, labels)` on every measure: kind is
+        "stage" with the seconds spent, or "count" with the increment.
+        """
+        self._hooks.append(hook)
+
+    def stage(self, name: str, **attributes: Any):
+        """ Context manager timing a run of the stage `name`. """
+
+        return Stage(self, name, attributes)
+
+    def observe(self, name: str, seconds: float):
+        with self._lock:
+            stage = self._stages.get(name)
+            if stage is None:
+                self._stages[name] = [1, seconds, seconds]
+            else:
+                stage[0] += 1
+                stage[1] += seconds
+                stage[2] = max(stage[2], seconds)
+
+        for hook in self._hooks:
+            hook("stage", name, seconds, {})
+
+    def count(self, name: str, value: float = 1, **labels: str):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+        for hook in self._hooks:
+            hook("count", name, value, labels)
+
+    def snapshot(self):
+        """
+        Current counters, keyed like "parse_failures{field=\"img\"}" when they
+        have labels, and per stage run count, total and maximum seconds.
+        """
+
+        with self._lock:
+            return {
+                "counters": {
+                    self._series(name, labels): value
+                    for (name, labels), value in sorted(self._counters.items())
+                },
+                "stages": {
+                    name: {"count": count, "seconds": total, "max_seconds": longest}
+                    for name, (count, total, longest) in sorted(self._stages.items())
+                },
+            }
+
+    def prometheus(self, prefix: str = "googlenews"):
+        """ The snapshot in the Prometheus text exposition format. """
+
+        lines = []
+        with self._lock:
+            counters = sorted(self._counters.items())
+            stages = sorted(self._stages.items())
+
+        declared = set()
+        for (name, labels), value in counters:
+            metric = f"{prefix}_{name}_total"
+            if metric not in declared:
+                declared.add(metric)
+                lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{self._series(metric, labels)} {value:g}")
+
+        if stages:
+            metric = f"{prefix}_stage_seconds"
+            lines.append(f"# TYPE {metric} summary")
+            for name, (count, total, _) in stages:
+                labels = (("stage", name),)
+                lines.append(f"{self._series(metric + '_sum', labels)} {total:.9g}")
+                lines.append(f"{self._series(metric + '_count', labels)} {count}")
+
+            lines.append(f"# TYPE {metric}_max gauge")
+            for name, (_, _, longest) in stages:
+                labels = (("stage", name),)
+                lines.append(f"{self._series(metric + '_max', labels)} {longest:.9g}")
+
+        return "\n".join(lines) + "\n"
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+            self._stages.clear()
+
+    @staticmethod
+    def _series(name: str, labels: Labels):
+        if not labels:
+            return name
+
+        values = ",".join(
+            '{}="{}"'.format(
+                label,
+                value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"),
+            )
+            for label, value in labels
+        )
+        return f"{name}{{{values}}}"
@@ -0,0 +1,107 @@
+import sys
+from collections.abc import Iterable, Iterator
+
+from .NewsRecord import FIELDS, NewsRecord
+from .NewsResult import NewsResult
+
+
+# Columns holding few distinct values, their strings are interned
+INTERNED = ("media", "site", "reporter")
+
+
+class NewsBatch:
+    """
+    Column-wise container of results: one list per field instead of one
+    dict per result. Exports to Arrow, pandas and NumPy straight from the
+    columns, without building a dict per row.
+    """
+
+    __slots__ = ("_columns",)
+
+    _columns: dict[str, list]
+
+    def __init__(self, results: Iterable[NewsResult | NewsRecord] = ()):
+        self._columns = {name: [] for name in FIELDS}
+        self.extend(results)
+
+    def __len__(self):
+        return len(self._columns["link"])
+
+    def __iter__(self) -> Iterator[NewsRecord]:
+        return (NewsRecord(*row) for row in zip(*self._columns.values(), strict=True))
+
+    def __getitem__(self, index: int):
+        return NewsRecord(*(column[index] for column in self._columns.values()))
+
+    def append(self, result: NewsResult | NewsRecord):
+        if isinstance(result, NewsRecord):
+            values = (getattr(result, name) for name in FIELDS)
+        else:
+            values = (result.get(name) for name in FIELDS)
+
+        for name, value in zip(FIELDS, values, strict=True):
+            if name in INTERNED and value is not None:
+                value = sys.intern(value)
+            self._columns[name].append(value)
+
+    def extend(self, results: Iterable[NewsResult | NewsRecord]):
+        for result in results:
+            self.append(result)
+
+    def column(self, name: str):
+        """ Values of a single field, e.g. batch.column("link"). """
+
+        return self._columns[name]
+
+    def records(self):
+        return list(self)
+
+    def results(self) -> list[NewsResult]:
+        """ The dict-per-row representation returned by GoogleNews.results(). """
+
+        return [record.to_result() for record in self]
+
+    def to_arrow(self):
+        """ pyarrow.Table with one column per field. """
+
+        try:
+            import pyarrow
+        except ImportError as error:
+            raise ImportError(
+                "to_arrow() requires pyarrow: pip install GoogleNews[arrow]"
+            ) from error
+
+        return pyarrow.table(self._columns)
+
+    def to_pandas(self):
+        """ pandas.DataFrame with one column per field. """
+
+        try:
+            import pandas
+        except ImportError as error:
+            raise ImportError(
+                "to_pandas() requires pandas: pip install GoogleNews[pandas]"
+            ) from error
+
+        return pandas.DataFrame(self._columns, columns=list(FIELDS))
+
+    def to_numpy(self):
+        """ Dict of NumPy arrays, datetimes as datetime64[us] (NaT when unknown). """
+
+        try:
+            import numpy
+        except ImportError as error:
+            raise ImportError(
+                "to_numpy() requires numpy: pip install GoogleNews[numpy]"
+            ) from error
+
+        arrays = {
+            name: numpy.array(column, dtype=object)
+            for name, column in self._columns.items()
+        }
+        arrays["datetime"] = numpy.array(
+            ["NaT" if value is None else value for value in self._columns["datetime"]],
+            dtype="datetime64[us]",
+        )
+
+        return arrays
@@ -0,0 +1,42 @@
+from dataclasses import dataclass, fields
+from datetime import datetime
+
+from .NewsResult import NewsResult
+
+
+@dataclass(slots=True)
+class NewsRecord:
+    """
+    Compact, slotted counterpart of the `NewsResult` dicts, for callers
+    holding many results in memory.
+    """
+
+    title: str
+    media: str
+    date: str
+    datetime: datetime | None
+    desc: str
+    link: str
+    img: str
+    site: str | None = None
+    reporter: str | None = None
+
+    @classmethod
+    def from_result(cls, result: NewsResult):
+        return cls(
+            result.get("title"),
+            result.get("media"),
+            result.get("date"),
+            result.get("datetime"),
+            result.get("desc"),
+            result.get("link"),
+            result.get("img"),
+            result.get("site"),
+            result.get("reporter"),
+        )
+
+    def to_result(self) -> NewsResult:
+        return {field.name: getattr(self, field.name) for field in fields(self)}
+
+
+FIELDS: tuple[str, ...] = tuple(field.name for field in fields(NewsRecord))
@@ -0,0 +1,320 @@
+import codecs
+import re
+from collections.abc import Iterable, Iterator
+from functools import cache
+from html.parser import HTMLParser
+from importlib.util import find_spec
+from typing import Any
+
+
+TagRule = tuple[str, str | None, str | None]
+
+SEARCH_RULES: tuple[TagRule, ...] = (
+    ("a", "data-ved", None),
+    ("div", "id", "result-stats"),
+)
+NEWS_RULES: tuple[TagRule, ...] = (("article", None, None),)
+
+CHARSET = re.compile(rb"""<meta[^>]+charset=["']?([\w-]+)""", re.IGNORECASE)
+
+
+def default_backend():
+    """ lxml when it is installed, the standard library parser otherwise. """
+
+    return "lxml" if find_spec("lxml") is not None else "html.parser"
+
+
+def matches(name: str, attrs: dict[str, str | None], rules: tuple[TagRule, ...]):
+    """ Whether a tag called `name` with `attrs` is matched by one of `rules`. """
+
+    for tag, attribute, value in rules:
+        if name != tag:
+            continue
+        if attribute is None:
+            return True
+        if attribute in attrs and (value is None or attrs[attribute] == value):
+            return True
+
+    return False
+
+
+@cache
+def tag_filter(rules: tuple[TagRule, ...]):
+    """
+    bs4 filter only letting the matching tags, and everything inside them,
+    into the tree. Every rule is a (tag name, attribute, attribute value)
+    triple, where the attribute and its value may be None to match on
+    presence only. Built on first use so that bs4 is not imported with the
+    package.
+    """
+
+    from bs4.filter import ElementFilter
+
+    class TagFilter(ElementFilter):
+
+        @property
+        def includes_everything(self):
+            return False
+
+        def allow_tag_creation(self, nsprefix, name, attrs):
+            return matches(name, attrs or {}, rules)
+
+        def allow_string_creation(self, string):
+            return False
+
+    return TagFilter()
+
+
+class FragmentCollector(HTMLParser):
+    """
+    Standard library tokenizer keeping the markup of the subtrees matching
+    `rules`, and nothing else, in `fragments`.
+    """
+
+    def __init__(self, rules: tuple[TagRule, ...]):
+        # Character references are kept as they are, the fragments are parsed again
+        super().__init__(convert_charrefs=False)
+        self.rules = rules
+        self.fragments: list[str] = []
+        self._parts: list[str] = []
+        self._root: str | None = None
+        self._depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if self._depth:
+            self._parts.append(self.get_starttag_text())
+            if tag == self._root:
+                self._depth += 1
+        elif matches(tag, dict(attrs), self.rules):
+            self._parts = [self.get_starttag_text()]
+            self._root = tag
+            self._depth = 1
+
+    def handle_startendtag(self, tag, attrs):
+        if self._depth:
+            self._parts.append(self.get_starttag_text())
+        elif matches(tag, dict(attrs), self.rules):
+            self.fragments.append(self.get_starttag_text())
+
+    def handle_endtag(self, tag):
+        if not self._depth:
+            return
+
+        self._parts.append(f"</{tag}>")
+        if tag == self._root:
+            self._depth -= 1
+            if not self._depth:
+                self.fragments.append("".join(self._parts))
+                self._parts = []
+
+    def handle_data(self, data):
+        if self._depth:
+            self._parts.append(data)
+
+    def handle_entityref(self, name):
+        if self._depth:
+            self._parts.append(f"&{name};")
+
+    def handle_charref(self, name):
+        if self._depth:
+            self._parts.append(f"&#{name};")
+
+
+class TagStream:
+    """
+    Incremental parser of a page read chunk after chunk: every subtree matching
+    `rules` is returned as a soup tag as soon as its closing tag is fed. Only
+    the subtree being read is held, the earlier parts of the page are released
+    as the parsing goes. The page encoding is taken from the `<meta charset>`
+    of the first chunk, utf-8 by default.
+    Parameters:
+    rules = (tag name, attribute, attribute value) triples of the wanted subtrees
+    backend = BeautifulSoup tree builder of the returned tags; "lxml" also
+              tokenizes the page with lxml, the others with `html.parser`
+    """
+
+    __slots__ = (
+        "_rules",
+        "_backend",
+        "_pull_parser",
+        "_collector",
+        "_decoder",
+        "_depth",
+    )
+
+    _rules: tuple[TagRule, ...]
+    _backend: str
+    _pull_parser: Any
+    _collector: FragmentCollector | None
+    _decoder: Any
+    _depth: int
+
+    def __init__(self, rules: tuple[TagRule, ...], backend: str | None = None):
+        self._rules = rules
+        self._backend = backend or default_backend()
+        self._pull_parser = None
+        self._collector = None
+        self._decoder = None
+        self._depth = 0
+
+    def feed(self, chunk: bytes):
+        """ Tags completed by `chunk`, in document order. """
+
+        if self._pull_parser is None and self._collector is None:
+            self._start(chunk)
+
+        if self._pull_parser is not None:
+            self._pull_parser.feed(chunk)
+            return self._tags(self._pulled_fragments())
+
+        self._collector.feed(self._decoder.decode(chunk))
+        return self._tags(self._collected_fragments())
+
+    def close(self):
+        """ Tags completed by the end of the page. """
+
+        if self._pull_parser is not None:
+            self._pull_parser.close()
+            return self._tags(self._pulled_fragments())
+
+        if self._collector is not None:
+            self._collector.feed(self._decoder.decode(b"", final=True))
+            self._collector.close()
+            return self._tags(self._collected_fragments())
+
+        return []
+
+    def _start(self, head: bytes):
+        charset = CHARSET.search(head[:4096])
+        encoding = charset.group(1).decode("ascii") if charset else "utf-8"
+        try:
+            codecs.lookup(encoding)
+        except LookupError:
+            encoding = "utf-8"
+
+        if self._backend == "lxml":
+            from lxml import etree
+
+            self._pull_parser = etree.HTMLPullParser(
+                events=("start", "end"), encoding=encoding
+            )
+        else:
+            self._collector = FragmentCollector(self._rules)
+            self._decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+
+    def _pulled_fragments(self):
+        from lxml import etree
+
+        fragments = []
+        for event, element in self._pull_parser.read_events():
+            if event == "start":
+                if self._depth:
+                    self._depth += 1
+                elif matches(element.tag, element.attrib, self._rules):
+                    self._depth = 1
+                continue
+
+            if self._depth:
+                self._depth -= 1
+                if self._depth:
+                    continue
+
+                fragments.append(
+                    etree.tostring(
+                        element, method="html", encoding="unicode", with_tail=False
+                    )
+                )
+
+            # Everything before this element has been read, drop it from the tree
+            element.clear()
+            parent = element.getparent()
+            while element.getprevious() is not None:
+                del parent[0]
+
+        return fragments
+
+    def _collected_fragments(self):
+        fragments = self._collector.fragments
+        self._collector.fragments = []
+        return fragments
+
+    def _tags(self, fragments: list[str]):
+        if not fragments:
+            return []
+
+        from bs4 import BeautifulSoup
+
+        # One soup for all the subtrees completed by the chunk
+        soup = BeautifulSoup(
+            "".join(fragments), self._backend, parse_only=tag_filter(self._rules)
+        )
+        return soup.find_all(lambda tag: matches(tag.name, tag.attrs, self._rules))
+
+
+class Parser:
+    """
+    Builds the soups `GoogleNews` extracts its results from.
+    Parameters:
+    backend = BeautifulSoup tree builder ("lxml", "html.parser", ...), defaults to
+              lxml when it is installed
+    selective = only build the `<a data-ved>` / `<article>` subtrees instead of
+                the whole page
+    """
+
+    __slots__ = (
+        "_backend",
+        "_selective",
+    )
+
+    _backend: str
+    _selective: bool
+
+    def __init__(self, backend: str | None = None, selective: bool = True):
+        self._backend = backend or default_backend()
+        self._selective = selective
+
+    @property
+    def backend(self):
+        return self._backend
+
+    @property
+    def selective(self):
+        return self._selective
+
+    def search_soup(self, page: bytes | str):
+        """ Soup of a google.com result page. """
+
+        return self._soup(page, SEARCH_RULES)
+
+    def news_soup(self, page: bytes | str):
+        """ Soup of a news.google.com page. """
+
+        return self._soup(page, NEWS_RULES)
+
+    def search_stream(self, chunks: Iterable[bytes]) -> Iterator[Any]:
+        """
+        `<a data-ved>` and result stats tags of a google.com page, yielded as
+        its chunks are read.
+        """
+
+        return self._stream(chunks, SEARCH_RULES)
+
+    def news_stream(self, chunks: Iterable[bytes]) -> Iterator[Any]:
+        """ `<article>` tags of a news.google.com page, yielded as it is read. """
+
+        return self._stream(chunks, NEWS_RULES)
+
+    def _stream(self, chunks: Iterable[bytes], rules: tuple[TagRule, ...]):
+        stream = TagStream(rules, self._backend)
+        for chunk in chunks:
+            yield from stream.feed(chunk)
+
+        yield from stream.close()
+
+    def _soup(self, page: bytes | str, rules: tuple[TagRule, ...]):
+        from bs4 import BeautifulSoup
+
+        if self._selective:
+            return BeautifulSoup(page, self._backend, parse_only=tag_filter(rules))
+
+        return BeautifulSoup(page, self._backend)
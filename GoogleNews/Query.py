@@ -0,0 +1,90 @@
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from urllib.parse import quote
+
+from .NewsResult import NewsResult
+from .QueryBuilder import UrlTemplate, page_urls, url_template
+
+
+@dataclass(frozen=True, slots=True)
+class Query:
+    """
+    Immutable description of a search: what `search`, `set_lang`,
+    `set_period`, `set_time_range` and `set_topic` configure on a
+    `GoogleNews` instance, as a value that can be shared between threads and
+    given to `GoogleNews.fetch`. The URLs are built once, on creation, from
+    the `UrlTemplate` of its language and dates: invalid dates raise
+    ValueError there.
+    Parameters:
+    key = the search term
+    lang = language of the results, e.g. "en" or "it"
+    period = relative period, e.g. "7d"
+    start, end = date range as mm/dd/yyyy, instead of a period
+    topic, topic_section = news.google.com topic and section ids
+    """
+
+    key: str = ""
+    lang: str = "en"
+    period: str = ""
+    start: str = ""
+    end: str = ""
+    topic: str | None = None
+    topic_section: str | None = None
+
+    _search_prefix: str = field(init=False, repr=False, compare=False)
+    _localized_prefix: str = field(init=False, repr=False, compare=False)
+    _news_url: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Shared by the queries of the same language and dates, which it validates
+        template = url_template(self.lang, self.period, self.start, self.end)
+        key = quote(self.key)
+
+        object.__setattr__(self, "_search_prefix", template.search_prefix(key))
+        object.__setattr__(
+            self, "_localized_prefix", template.search_prefix(key, localized=True)
+        )
+        object.__setattr__(self, "_news_url", self._build_news_url(template, key))
+
+    def search_url(self, page: int = 1, localized: bool = False):
+        """
+        google.com news search URL of the result page `page`. The localized
+        one also sets hl and gl, it is the URL actually downloaded.
+        """
+
+        prefix = self._localized_prefix if localized else self._search_prefix
+        return prefix + str(10 * (page - 1))
+
+    def search_urls(self, pages: Iterable[int], localized: bool = False):
+        """ `search_url` of every page of `pages`, e.g. range(1, 101). """
+
+        prefix = self._localized_prefix if localized else self._search_prefix
+        return page_urls(prefix, pages)
+
+    def news_url(self):
+        """ news.google.com search, topic or section URL. """
+
+        return self._news_url
+
+    def _build_news_url(self, template: UrlTemplate, key: str):
+        if not self.topic:
+            return template.news_url(key)
+
+        url = f"https://news.google.com/topics/{self.topic}"
+        if self.topic_section:
+            url += f"/sections/{self.topic_section}"
+
+        return url
+
+
+@dataclass(frozen=True, slots=True)
+class ResultPage:
+    """
+    One page of results returned by `GoogleNews.fetch`, with the query and
+    page number it answers.
+    """
+
+    query: Query
+    page: int
+    results: list[NewsResult]
+    total_count: int = 0
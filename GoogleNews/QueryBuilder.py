@@ -0,0 +1,107 @@
+from collections.abc import Iterable
+from datetime import date, datetime
+from functools import lru_cache
+from urllib.parse import quote
+
+
+DATE_FORMAT = "%m/%d/%Y"
+
+SEARCH_HEAD = "https://www.google.com/search?q="
+NEWS_HEAD = "https://news.google.com/search?q="
+
+
+def check_date(text: str) -> date:
+    """ The date of a mm/dd/yyyy string, raising ValueError on any other format. """
+
+    try:
+        return datetime.strptime(text, DATE_FORMAT).date()
+    except ValueError:
+        raise ValueError(f"Invalid date {text!r}, expected mm/dd/yyyy") from None
+
+
+def check_time_range(start: str, end: str):
+    """ Validates the non empty bounds of a date range. """
+
+    if start:
+        check_date(start)
+    if end:
+        check_date(end)
+
+
+class UrlTemplate:
+    """
+    The parts of the google.com and news.google.com URLs shared by every
+    search in a language and period or date range, built and validated once,
+    see `url_template`. A search URL is then the head, the quoted search term,
+    the tail and the `start=` offset of the page.
+    Parameters:
+    lang = language of the results
+    period = relative period, e.g. "7d"
+    start, end = date range as mm/dd/yyyy, instead of a period
+    """
+
+    __slots__ = (
+        "_localized_head",
+        "_search_tail",
+        "_news_tail",
+    )
+
+    _localized_head: str
+    _search_tail: str
+    _news_tail: str
+
+    def __init__(
+        self,
+        lang: str = "en",
+        period: str = "",
+        start: str = "",
+        end: str = "",
+    ):
+        check_time_range(start, end)
+
+        if start != "" and end != "":
+            dates = f",cdr:1,cd_min:{start},cd_max:{end}"
+        elif period != "":
+            dates = f",qdr:{period},"
+        else:
+            dates = ""
+
+        self._localized_head = (
+            f"https://www.google.com/search?hl={lang}&gl={lang}&q="
+        )
+        self._search_tail = (
+            f"&lr=lang_{lang}&biw=1920&bih=976&source=lnt&&tbs=lr:lang_1{lang}"
+            f"{dates},sbd:1&tbm=nws&start="
+        )
+
+        news_tail = quote(f"when:{period}") if period != "" else ""
+        if start and end:
+            news_tail += f"+before:{check_date(end)}+after:{check_date(start)}"
+        self._news_tail = f"{news_tail}&hl={lang}"
+
+    def search_prefix(self, key: str, localized: bool = False):
+        """
+        Search URL of the quoted `key` without the page offset. The localized
+        one also sets hl and gl, it is the URL actually downloaded.
+        """
+
+        head = self._localized_head if localized else SEARCH_HEAD
+        return head + key + self._search_tail
+
+    def news_url(self, key: str):
+        """ news.google.com search URL of the quoted `key`. """
+
+        return NEWS_HEAD + key + self._news_tail
+
+
+@lru_cache(maxsize=256)
+def url_template(lang: str = "en", period: str = "", start: str = "", end: str = ""):
+    """ The shared `UrlTemplate` of a language and period or date range. """
+
+    return UrlTemplate(lang, period, start, end)
+
+
+def page_urls(prefix: str, pages: Iterable[int]):
+    """ URLs of the result pages `pages` of a search prefix. """
+
+    return [prefix + str(10 * (page - 1)) for page in pages]
@@ -0,0 +1,329 @@
+import random
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from email.utils import parsedate_to_datetime
+from itertools import count
+from typing import Any
+from urllib.error import HTTPError
+from urllib.parse import urlsplit
+
+
+RETRY_STATUSES = frozenset((429, 503))
+
+CAPTCHA_MARKERS = (
+    b"/sorry/index",
+    b"g-recaptcha",
+    b'id="captcha-form"',
+    b"unusual traffic from your computer network",
+)
+CONSENT_MARKERS = (
+    b'action="https://consent.google.com/save"',
+    b"consent.google.com/ml?",
+)
+
+
+class BlockedError(Exception):
+    """
+    google answered with a CAPTCHA or a cookie consent page instead of results.
+    `reason` is "captcha" or "consent".
+    """
+
+    def __init__(self, url: str, reason: str):
+        super().__init__(f"google served a {reason} page for {url}")
+        self.url = url
+        self.reason = reason
+
+
+def detect_block(page: bytes):
+    """ "captcha" or "consent" when `page` is such an interstitial, None otherwise. """
+
+    if any(marker in page for marker in CAPTCHA_MARKERS):
+        return "captcha"
+    if any(marker in page for marker in CONSENT_MARKERS):
+        return "consent"
+
+    return None
+
+
+def raise_if_blocked(url: str, page: bytes):
+    reason = detect_block(page)
+    if reason is not None:
+        raise BlockedError(url, reason)
+
+
+def retry_after(headers: Any):
+    """ Seconds asked for by a Retry-After header (delay or HTTP date), if any. """
+
+    value = headers.get("Retry-After") if headers is not None else None
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class HostState:
+    """ Token bucket and backoff state of one host. """
+
+    __slots__ = (
+        "rate",
+        "tokens",
+        "updated",
+        "paused_until",
+        "failures",
+    )
+
+    rate: float
+    tokens: float
+    updated: float
+    paused_until: float
+    failures: int
+
+    def __init__(self, rate: float, burst: float, now: float):
+        self.rate = rate
+        self.tokens = burst
+        self.updated = now
+        self.paused_until = 0.0
+        self.failures = 0
+
+
+class RateLimiter:
+    """
+    Paces the requests sent to each host and backs off when google pushes back.
+    Every host gets a token bucket refilled at `rate` requests per second.
+    A 429/503 answer or a CAPTCHA page halves the rate of the host (down to
+    `min_rate`) and pauses it for the Retry-After delay, or for an exponential
+    backoff with full jitter, before the request is retried; every success
+    then wins back a tenth of the configured rate. Consent pages are not
+    retried, they need a cookie rather than patience.
+    One limiter is meant to be shared by every `GoogleNews` instance and
+    thread talking to the same host, see `shared`.
+    Parameters:
+    rate = requests per second allowed to a host
+    burst = requests a host can receive at once after being idle
+    rates = per host rates, e.g. {"news.google.com": 2.0}
+    max_retries = retries of a throttled or blocked request before giving up
+    backoff = first backoff delay in seconds, doubled on every consecutive failure
+    max_backoff = cap of the backoff delay
+    min_rate = floor of the adaptive rate
+    """
+
+    __slots__ = (
+        "_rate",
+        "_burst",
+        "_rates",
+        "_max_retries",
+        "_backoff",
+        "_max_backoff",
+        "_min_rate",
+
+        "_lock",
+        "_hosts",
+    )
+
+    _shared: "RateLimiter | None" = None
+    _shared_lock = threading.Lock()
+
+    _rate: float
+    _burst: float
+    _rates: dict[str, float]
+    _max_retries: int
+    _backoff: float
+    _max_backoff: float
+    _min_rate: float
+
+    _lock: threading.Lock
+    _hosts: dict[str, HostState]
+
+    def __init__(
+        self,
+        rate: float = 1.0,
+        burst: float = 5,
+        rates: dict[str, float] | None = None,
+        max_retries: int = 3,
+        backoff: float = 2.0,
+        max_backoff: float = 120.0,
+        min_rate: float = 0.05,
+    ):
+        self._rate = rate
+        self._burst = burst
+        self._rates = dict(rates or {})
+        self._max_retries = max_retries
+        self._backoff = backoff
+        self._max_backoff = max_backoff
+        self._min_rate = min_rate
+
+        self._lock = threading.Lock()
+        self._hosts = {}
+
+    @classmethod
+    def shared(cls):
+        """ Process wide limiter, created on first use. """
+
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+
+            return cls._shared
+
+    def current_rate(self, url: str):
+        """ Requests per second currently allowed to the host of `url`. """
+
+        host = self._host(url)
+        with self._lock:
+            state = self._hosts.get(host)
+            if state is None:
+                return self._rates.get(host, self._rate)
+
+            return state.rate
+
+    def reserve(self, url: str):
+        """
+        Takes a token of the host of `url` and returns the seconds to wait
+        before sending the request. Never blocks, so that both threads and
+        coroutines can sleep on the answer.
+        """
+
+        now = time.monotonic()
+        with self._lock:
+            state = self._state(self._host(url), now)
+            state.tokens = min(
+                self._burst, state.tokens + (now - state.updated) * state.rate
+            )
+            state.updated = now
+            state.tokens -= 1
+
+            wait = -state.tokens / state.rate if state.tokens < 0 else 0.0
+            return max(wait, state.paused_until - now)
+
+    def acquire(self, url: str):
+        """ Blocks until a request to the host of `url` may be sent. """
+
+        delay = self.reserve(url)
+        if delay > 0:
+            time.sleep(delay)
+
+    def success(self, url: str):
+        host = self._host(url)
+        with self._lock:
+            state = self._state(host, time.monotonic())
+            state.failures = 0
+            state.rate = min(
+                self._rates.get(host, self._rate),
+                state.rate + self._rates.get(host, self._rate) / 10,
+            )
+
+    def failure(self, url: str, delay: float | None = None):
+        """
+        Slows the host of `url` down and pauses it for `delay` seconds (the
+        Retry-After value), or for a jittered exponential backoff.
+        Returns the pause.
+        """
+
+        now = time.monotonic()
+        with self._lock:
+            state = self._state(self._host(url), now)
+            state.failures += 1
+            state.rate = max(self._min_rate, state.rate / 2)
+
+            backoff = min(self._max_backoff, self._backoff * 2 ** (state.failures - 1))
+            if delay is None:
+                delay = random.uniform(0, backoff)
+            else:
+                # Spread the threads waiting on the same Retry-After
+                delay += random.uniform(0, min(backoff, self._backoff))
+
+            state.paused_until = max(state.paused_until, now + delay)
+            return delay
+
+    def call(self, url: str, fetch: Callable[[], bytes]):
+        """
+        Sends `fetch()` at the pace of the host of `url`, retrying it when it is
+        throttled, and returns the page.
+        """
+
+        for attempt in count():
+            self.acquire(url)
+            try:
+                page = fetch()
+            except Exception as error:
+                self._check(url, attempt, error=error)
+                continue
+
+            if self._check(url, attempt, page=page):
+                return page
+
+    async def async_call(self, url: str, fetch: Callable[[], Awaitable[bytes]]):
+        """ `call` for coroutines, waiting with asyncio.sleep. """
+
+        import asyncio
+
+        for attempt in count():
+            delay = self.reserve(url)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            try:
+                page = await fetch()
+            except Exception as error:
+                self._check(url, attempt, error=error)
+                continue
+
+            if self._check(url, attempt, page=page):
+                return page
+
+    def _check(
+        self,
+        url: str,
+        attempt: int,
+        page: bytes | None = None,
+        error: Exception | None = None,
+    ):
+        """
+        True when `page` can be used. Otherwise records the failure, so that the
+        next reservation waits for the backoff, or raises when the request is
+        not worth retrying.
+        """
+
+        if error is not None:
+            # urllib's HTTPError has `code`, aiohttp's ClientResponseError `status`
+            # and a deprecated `code`, which warns when it is read
+            if isinstance(error, HTTPError):
+                status = error.code
+            else:
+                status = getattr(error, "status", None) or getattr(error, "code", None)
+            if status not in RETRY_STATUSES or attempt >= self._max_retries:
+                raise error
+
+            self.failure(url, retry_after(getattr(error, "headers", None)))
+            return False
+
+        reason = detect_block(page)
+        if reason is None:
+            self.success(url)
+            return True
+
+        if reason != "captcha" or attempt >= self._max_retries:
+            raise BlockedError(url, reason)
+
+        self.failure(url)
+        return False
+
+    @staticmethod
+    def _host(url: str):
+        return (urlsplit(url).hostname or "").lower()
+
+    def _state(self, host: str, now: float):
+        state = self._hosts.get(host)
+        if state is None:
+            state = self._hosts[host] = HostState(
+                self._rates.get(host, self._rate), self._burst, now
+            )
+
+        return state
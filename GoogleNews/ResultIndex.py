@@ -0,0 +1,134 @@
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timedelta, timezone
+from operator import itemgetter
+
+from .NewsResult import NewsResult
+
+
+EPOCH = datetime(1970, 1, 1)
+MICROSECOND = timedelta(microseconds=1)
+# Results without a datetime sort after every dated one
+UNDATED = float("inf")
+
+first = itemgetter(0)
+
+
+def sort_key(value: datetime | None):
+    """
+    Ascending key ordering datetimes newest first and None last. Aware
+    datetimes are compared in UTC with the naive ones.
+    """
+
+    if value is None:
+        return UNDATED
+
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+
+    return -((value - EPOCH) // MICROSECOND)
+
+
+class ResultIndex:
+    """
+    Results kept ordered by datetime, newest first, results without a
+    datetime last and equal datetimes in the order they were added.
+    Every added page is sorted on its own, as a run, and the pending runs are
+    merged into the ordered results when they are read, instead of sorting
+    everything again: a few results are inserted in place with `bisect`,
+    larger runs are merged by timsort, which only gallops through the
+    already ordered results.
+    """
+
+    __slots__ = (
+        "_keys",
+        "_results",
+        "_runs",
+    )
+
+    _keys: list[float]
+    _results: list[NewsResult]
+    _runs: list[list[tuple[float, NewsResult]]]
+
+    def __init__(self, results: Iterable[NewsResult] = ()):
+        self._keys = []
+        self._results = []
+        self._runs = []
+        self.add(results)
+
+    def __len__(self):
+        return len(self._results) + sum(len(run) for run in self._runs)
+
+    def __iter__(self) -> Iterator[NewsResult]:
+        return iter(self.results())
+
+    def add(self, results: Iterable[NewsResult]):
+        run = sorted(
+            ((sort_key(result["datetime"]), result) for result in results), key=first
+        )
+        if run:
+            self._runs.append(run)
+
+    def results(self):
+        """ Every result, newest first. """
+
+        self._merge()
+        return self._results
+
+    def top_k(self, k: int):
+        """ The `k` newest results. """
+
+        return self.results()[:k]
+
+    def between(self, start: datetime | None = None, end: datetime | None = None):
+        """
+        The results dated from `start` to `end` included, newest first. Either
+        bound may be None to leave that side open; undated results are left out.
+        """
+
+        self._merge()
+        low = 0 if end is None else bisect_left(self._keys, sort_key(end))
+        if start is None:
+            high = bisect_left(self._keys, UNDATED)
+        else:
+            high = bisect_right(self._keys, sort_key(start))
+
+        return self._results[low:high]
+
+    def by_media(self):
+        """ Results grouped by their media, each group newest first. """
+
+        groups: dict[str | None, list[NewsResult]] = {}
+        for result in self.results():
+            groups.setdefault(result.get("media"), []).append(result)
+
+        return groups
+
+    def clear(self):
+        self._keys = []
+        self._results = []
+        self._runs = []
+
+    def _merge(self):
+        if not self._runs:
+            return
+
+        keys = self._keys
+        results = self._results
+        pending = [pair for run in self._runs for pair in run]
+        self._runs = []
+
+        if len(pending) * 16 <= len(keys):
+            for key, result in pending:
+                # After the equal keys, so that ties keep the order they were added in
+                position = bisect_right(keys, key)
+                keys.insert(position, key)
+                results.insert(position, result)
+            return
+
+        # Timsort is stable and merges the ordered results and runs it finds
+        merged = list(zip(keys, results, strict=True))
+        merged.extend(pending)
+        merged.sort(key=first)
+        self._keys = [key for key, _ in merged]
+        self._results = [result for _, result in merged]
@@ -0,0 +1,267 @@
+import json
+import threading
+from collections.abc import Iterable
+from datetime import datetime
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any
+
+from .Deduplicator import canonical_url
+from .NewsRecord import FIELDS
+from .NewsResult import NewsResult
+
+
+if TYPE_CHECKING:
+    import sqlite3
+
+
+DATETIME = FIELDS.index("datetime")
+LINK = FIELDS.index("link")
+
+
+class Sink:
+    """
+    Destination the results are written to as `GoogleNews` collects them,
+    see `GoogleNews.set_sink`. Results are buffered and handed to
+    `_write_batch` `batch_size` at a time, so memory stays bounded whatever
+    the number of pages. Sinks are thread-safe and can be shared by several
+    instances; use them as context managers, or `close()` them to write the
+    last batch.
+    Subclasses only need to implement `_write_batch`, and `_close`.
+    Parameters:
+    batch_size = number of results buffered before they are written
+    """
+
+    __slots__ = (
+        "_batch_size",
+        "_lock",
+        "_buffer",
+        "_written",
+    )
+
+    _batch_size: int
+    _lock: threading.Lock
+    _buffer: list[NewsResult]
+    _written: int
+
+    def __init__(self, batch_size: int = 1000):
+        self._batch_size = batch_size
+        self._lock = threading.Lock()
+        self._buffer = []
+        self._written = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def written(self):
+        """ Number of results handed to the destination so far. """
+
+        return self._written
+
+    def write(self, results: Iterable[NewsResult]):
+        with self._lock:
+            self._buffer.extend(results)
+            while len(self._buffer) >= self._batch_size:
+                batch = self._buffer[: self._batch_size]
+                del self._buffer[: self._batch_size]
+                self._write(batch)
+
+    def flush(self):
+        """ Writes the buffered results now, even if they do not fill a batch. """
+
+        with self._lock:
+            if self._buffer:
+                batch, self._buffer = self._buffer, []
+                self._write(batch)
+
+    def close(self):
+        self.flush()
+        with self._lock:
+            self._close()
+
+    def _write(self, batch: list[NewsResult]):
+        self._write_batch(batch)
+        self._written += len(batch)
+
+    def _write_batch(self, batch: list[NewsResult]):
+        raise NotImplementedError
+
+    def _close(self):
+        pass
+
+
+class NdjsonSink(Sink):
+    """
+    Writes one JSON object per line, datetimes as ISO 8601 strings.
+    Parameters:
+    path = file written to, or an already open text file
+    append = add to an existing file instead of truncating it
+    """
+
+    __slots__ = (
+        "_file",
+        "_owns_file",
+        "_encoder",
+    )
+
+    _file: IO[str]
+    _owns_file: bool
+    _encoder: json.JSONEncoder
+
+    def __init__(
+        self,
+        path: str | Path | IO[str],
+        batch_size: int = 1000,
+        append: bool = False,
+    ):
+        super().__init__(batch_size)
+        if isinstance(path, (str, Path)):
+            self._file = open(path, "a" if append else "w", encoding="utf-8")  # noqa: SIM115
+            self._owns_file = True
+        else:
+            self._file = path
+            self._owns_file = False
+        self._encoder = json.JSONEncoder(ensure_ascii=False, default=json_default)
+
+    def _write_batch(self, batch: list[NewsResult]):
+        encode = self._encoder.encode
+        self._file.write("".join(encode(result) + "\n" for result in batch))
+        self._file.flush()
+
+    def _close(self):
+        if self._owns_file:
+            self._file.close()
+
+
+class ParquetSink(Sink):
+    """
+    Writes a Parquet file with one row group per batch, requires pyarrow
+    (`pip install GoogleNews[arrow]`). Every result has the `NewsRecord`
+    columns, datetimes as timestamp[us].
+    Parameters:
+    path = file written to
+    batch_size = number of rows per row group
+    compression = Parquet codec ("snappy", "zstd", "gzip", "none", ...)
+    """
+
+    __slots__ = (
+        "_writer",
+        "_schema",
+    )
+
+    _writer: Any
+    _schema: Any
+
+    def __init__(
+        self,
+        path: str | Path,
+        batch_size: int = 10000,
+        compression: str = "snappy",
+    ):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError as error:
+            raise ImportError(
+                "ParquetSink requires pyarrow: pip install GoogleNews[arrow]"
+            ) from error
+
+        super().__init__(batch_size)
+        self._schema = pyarrow.schema([
+            (name, pyarrow.timestamp("us") if name == "datetime" else pyarrow.string())
+            for name in FIELDS
+        ])
+        self._writer = pyarrow.parquet.ParquetWriter(
+            str(path), self._schema, compression=compression
+        )
+
+    def _write_batch(self, batch: list[NewsResult]):
+        import pyarrow
+
+        columns = {name: [result.get(name) for result in batch] for name in FIELDS}
+        self._writer.write_table(pyarrow.table(columns, schema=self._schema))
+
+    def _close(self):
+        self._writer.close()
+
+
+class SqliteSink(Sink):
+    """
+    Inserts the results in a sqlite table, one transaction and `executemany`
+    per batch. A unique index on the canonical link (see `canonical_url`)
+    skips the articles the table already holds, across runs; results without
+    a link are always inserted.
+    Parameters:
+    path = sqlite file, or ":memory:"
+    table = name of the table, created if needed
+    """
+
+    __slots__ = (
+        "_table",
+        "_connection",
+        "_insert",
+    )
+
+    _table: str
+    _connection: "sqlite3.Connection"
+    _insert: str
+
+    def __init__(
+        self,
+        path: str | Path,
+        table: str = "news",
+        batch_size: int = 1000,
+    ):
+        import sqlite3
+
+        if not table.isidentifier():
+            raise ValueError(f"Invalid table name {table!r}")
+
+        super().__init__(batch_size)
+        self._table = table
+        self._connection = sqlite3.connect(str(path), check_same_thread=False)
+
+        columns = ", ".join(f"{name} TEXT" for name in FIELDS)
+        with self._connection:
+            self._connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {table}"
+                f" ({columns}, canonical_link TEXT)"
+            )
+            self._connection.execute(
+                f"CREATE UNIQUE INDEX IF NOT EXISTS {table}_canonical_link"
+                f" ON {table} (canonical_link)"
+            )
+
+        self._insert = (
+            f"INSERT OR IGNORE INTO {table} ({', '.join(FIELDS)}, canonical_link)"
+            f" VALUES ({', '.join('?' * (len(FIELDS) + 1))})"
+        )
+
+    @property
+    def connection(self):
+        return self._connection
+
+    def _write_batch(self, batch: list[NewsResult]):
+        rows = []
+        for result in batch:
+            row = [result.get(name) for name in FIELDS]
+            if row[DATETIME] is not None:
+                row[DATETIME] = row[DATETIME].isoformat()
+            row.append(canonical_url(row[LINK]) if row[LINK] else None)
+            rows.append(row)
+
+        with self._connection:
+            self._connection.executemany(self._insert, rows)
+
+    def _close(self):
+        self._connection.close()
+
+
+def json_default(value: Any):
+    if isinstance(value, datetime):
+        return value.isoformat()
+
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
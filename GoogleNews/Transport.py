@@ -0,0 +1,385 @@
+import gzip
+import io
+import threading
+import zlib
+from collections import defaultdict
+from collections.abc import Callable, Iterator
+from typing import TYPE_CHECKING
+from urllib.error import HTTPError
+from urllib.parse import urljoin, urlsplit
+
+from .Metrics import NO_STAGE, Metrics
+
+
+if TYPE_CHECKING:
+    from http.client import HTTPConnection, HTTPResponse
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is optional
+    brotli = None
+
+
+# Bytes read from the socket at a time by `stream`
+CHUNK_SIZE = 64 * 1024
+
+
+class Transport:
+    """
+    Fetches the raw pages scraped by `GoogleNews`.
+    Subclasses only need to implement `fetch`.
+    """
+
+    __slots__ = ()
+
+    def fetch(self, url: str, headers: dict[str, str]) -> bytes:
+        raise NotImplementedError
+
+    def stream(self, url: str, headers: dict[str, str]) -> Iterator[bytes]:
+        """
+        Generator yielding the page in chunks as they arrive, for
+        `GoogleNews.set_streaming`. Defaults to the whole page in one chunk.
+        """
+        yield self.fetch(url, headers)
+
+    def close(self):
+        pass
+
+
+class UrllibTransport(Transport):
+    """ Opens a new `urlopen` connection for every page, honouring proxy settings. """
+
+    __slots__ = ("_timeout",)
+
+    _timeout: float | None
+
+    def __init__(self, timeout: float | None = None):
+        self._timeout = timeout
+
+    def fetch(self, url: str, headers: dict[str, str]) -> bytes:
+        from urllib.request import Request, urlopen
+
+        request = Request(url, headers=headers)
+        with urlopen(request, timeout=self._timeout) as response:
+            return response.read()
+
+    def stream(self, url: str, headers: dict[str, str]) -> Iterator[bytes]:
+        from urllib.request import Request, urlopen
+
+        request = Request(url, headers=headers)
+        with urlopen(request, timeout=self._timeout) as response:
+            while chunk := response.read1(CHUNK_SIZE):
+                yield chunk
+
+
+class PooledTransport(Transport):
+    """
+    Keep-alive HTTP transport.
+    Idle connections are pooled per (scheme, host, port) and reused by every
+    `GoogleNews` instance sharing the transport, so consecutive pages skip the
+    TCP and TLS handshakes. Responses are gzip/deflate (and brotli, when the
+    `brotli` package is installed) decoded.
+    Parameters:
+    max_per_host = maximum number of connections open to a single host
+    timeout = socket timeout in seconds
+    max_redirects = number of redirects followed before giving up
+    metrics = `Metrics` timing the TCP and TLS handshakes ("connect" stage)
+    """
+
+    __slots__ = (
+        "_max_per_host",
+        "_timeout",
+        "_max_redirects",
+        "_metrics",
+
+        "_lock",
+        "_idle",
+        "_slots",
+
+        "_connections_opened",
+    )
+
+    _shared: "PooledTransport | None" = None
+    _shared_lock = threading.Lock()
+
+    _max_per_host: int
+    _timeout: float
+    _max_redirects: int
+    _metrics: Metrics | None
+
+    _lock: threading.Lock
+    _idle: dict[tuple[str, str, int], list["HTTPConnection"]]
+    _slots: dict[tuple[str, str, int], threading.BoundedSemaphore]
+
+    _connections_opened: int
+
+    def __init__(
+        self,
+        max_per_host: int = 10,
+        timeout: float = 10.0,
+        max_redirects: int = 5,
+        metrics: Metrics | None = None,
+    ):
+        self._max_per_host = max_per_host
+        self._timeout = timeout
+        self._max_redirects = max_redirects
+        self._metrics = metrics
+
+        self._lock = threading.Lock()
+        self._idle = defaultdict(list)
+        self._slots = {}
+
+        self._connections_opened = 0
+
+    @classmethod
+    def shared(cls):
+        """ Process wide transport, created on first use. """
+
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+
+            return cls._shared
+
+    @property
+    def connections_opened(self):
+        """ Number of connections opened since the transport was created. """
+
+        return self._connections_opened
+
+    @staticmethod
+    def accept_encoding():
+        return "gzip, deflate, br" if brotli is not None else "gzip, deflate"
+
+    def fetch(self, url: str, headers: dict[str, str]) -> bytes:
+        headers = {"Accept-Encoding": self.accept_encoding(), **headers}
+
+        for _ in range(self._max_redirects + 1):
+            response, body = self._request(url, headers)
+
+            location = response.getheader("Location")
+            if response.status in (301, 302, 303, 307, 308) and location:
+                url = urljoin(url, location)
+                continue
+
+            if response.status >= 400:
+                raise HTTPError(
+                    url,
+                    response.status,
+                    response.reason,
+                    response.headers,
+                    io.BytesIO(body),
+                )
+
+            return self._decode(body, response.getheader("Content-Encoding", ""))
+
+        raise HTTPError(
+            url, response.status, "Too many redirects", response.headers, None
+        )
+
+    def stream(self, url: str, headers: dict[str, str]) -> Iterator[bytes]:
+        """
+        `fetch` yielding the decoded body as it is read from the socket. The
+        connection goes back to the pool once the body has been read, and is
+        closed if the generator is dropped before.
+        """
+        headers = {"Accept-Encoding": self.accept_encoding(), **headers}
+
+        for _ in range(self._max_redirects + 1):
+            key, path = self._target(url)
+            with self._host_slot(key):
+                conn, response = self._send(key, path, headers)
+
+                location = response.getheader("Location")
+                redirect = response.status in (301, 302, 303, 307, 308) and location
+                if redirect or response.status >= 400:
+                    body = self._read(conn, response)
+                    self._checkin(key, conn, response)
+                    if redirect:
+                        url = urljoin(url, location)
+                        continue
+
+                    raise HTTPError(
+                        url,
+                        response.status,
+                        response.reason,
+                        response.headers,
+                        io.BytesIO(body),
+                    )
+
+                decompress, flush = self._decoder(
+                    response.getheader("Content-Encoding", "")
+                )
+                try:
+                    while chunk := response.read1(CHUNK_SIZE):
+                        if data := decompress(chunk):
+                            yield data
+                    if data := flush():
+                        yield data
+                    # read1 does not close the response at the end of the body,
+                    # and the connection only sends a new request once it is
+                    response.close()
+                except BaseException:
+                    conn.close()
+                    raise
+
+                self._checkin(key, conn, response)
+                return
+
+        raise HTTPError(
+            url, response.status, "Too many redirects", response.headers, None
+        )
+
+    def close(self):
+        """ Closes every idle connection. """
+
+        with self._lock:
+            idle = [conn for conns in self._idle.values() for conn in conns]
+            self._idle.clear()
+
+        for conn in idle:
+            conn.close()
+
+    def _request(
+        self, url: str, headers: dict[str, str]
+    ) -> tuple["HTTPResponse", bytes]:
+        key, path = self._target(url)
+
+        with self._host_slot(key):
+            conn, response = self._send(key, path, headers)
+            body = self._read(conn, response)
+            self._checkin(key, conn, response)
+
+        return response, body
+
+    @staticmethod
+    def _target(url: str):
+        parts = urlsplit(url)
+        default_port = 443 if parts.scheme == "https" else 80
+        key = (parts.scheme, parts.hostname or "", parts.port or default_port)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+
+        return key, path
+
+    def _send(self, key: tuple[str, str, int], path: str, headers: dict[str, str]):
+        """ Sends the request on a pooled connection, returned with the response. """
+        from http.client import HTTPException
+
+        conn, reused = self._checkout(key)
+        try:
+            conn.request("GET", path, headers=headers)
+            return conn, conn.getresponse()
+        except (HTTPException, ConnectionError):
+            conn.close()
+            if not reused:
+                raise
+        except Exception:
+            conn.close()
+            raise
+
+        # The server dropped an idle keep-alive connection, retry on a fresh one
+        conn, _ = self._checkout(key, fresh=True)
+        try:
+            conn.request("GET", path, headers=headers)
+            return conn, conn.getresponse()
+        except Exception:
+            conn.close()
+            raise
+
+    @staticmethod
+    def _read(conn: "HTTPConnection", response: "HTTPResponse"):
+        try:
+            return response.read()
+        except Exception:
+            conn.close()
+            raise
+
+    def _checkin(
+        self,
+        key: tuple[str, str, int],
+        conn: "HTTPConnection",
+        response: "HTTPResponse",
+    ):
+        if response.will_close:
+            conn.close()
+        else:
+            with self._lock:
+                self._idle[key].append(conn)
+
+    def _host_slot(self, key: tuple[str, str, int]):
+        with self._lock:
+            slot = self._slots.get(key)
+            if slot is None:
+                slot = self._slots[key] = threading.BoundedSemaphore(self._max_per_host)
+
+        return slot
+
+    def _checkout(self, key: tuple[str, str, int], fresh: bool = False):
+        from http.client import HTTPConnection, HTTPSConnection
+
+        if not fresh:
+            with self._lock:
+                if self._idle[key]:
+                    return self._idle[key].pop(), True
+
+        scheme, host, port = key
+        connection_class = HTTPSConnection if scheme == "https" else HTTPConnection
+        conn = connection_class(host, port, timeout=self._timeout)
+        # Connect now rather than on the first request, to time the handshakes
+        with self._metrics.stage("connect", host=host) if self._metrics else NO_STAGE:
+            conn.connect()
+
+        with self._lock:
+            self._connections_opened += 1
+
+        return conn, False
+
+    @staticmethod
+    def _decoder(encoding: str) -> tuple[Callable[[bytes], bytes], Callable[[], bytes]]:
+        """ Incremental `_decode`: decompress and flush functions of a body. """
+
+        encoding = encoding.strip().lower()
+
+        if encoding == "gzip":
+            decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            return decompressor.decompress, decompressor.flush
+        if encoding == "deflate":
+            decompressor = None
+
+            def inflate(chunk: bytes):
+                nonlocal decompressor
+                if decompressor is not None:
+                    return decompressor.decompress(chunk)
+
+                # Servers send either zlib wrapped or raw deflate data
+                decompressor = zlib.decompressobj()
+                try:
+                    return decompressor.decompress(chunk)
+                except zlib.error:
+                    decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+                    return decompressor.decompress(chunk)
+
+            return inflate, lambda: decompressor.flush() if decompressor else b""
+        if encoding == "br" and brotli is not None:
+            decompressor = brotli.Decompressor()
+            return decompressor.process, lambda: b""
+
+        return lambda chunk: chunk, lambda: b""
+
+    @staticmethod
+    def _decode(body: bytes, encoding: str):
+        encoding = encoding.strip().lower()
+
+        if encoding == "gzip":
+            return gzip.decompress(body)
+        if encoding == "deflate":
+            try:
+                return zlib.decompress(body)
+            except zlib.error:
+                return zlib.decompress(body, -zlib.MAX_WBITS)
+        if encoding == "br" and brotli is not None:
+            return brotli.decompress(body)
+
+        return body
@@ -0,0 +1,133 @@
+from collections.abc import Iterable
+from functools import lru_cache
+from urllib.parse import parse_qs, unquote, urlencode, urlparse, urlunparse
+
+
+# google's redirect parameters, they break opening the article
+GOOGLE_PARAMS = ("sa", "usg", "ved")
+# Click tracking parameters added by publishers and ad networks, "*" ends a prefix
+TRACKING_PARAMS = (
+    "utm_*",
+    "fbclid",
+    "gclid",
+    "dclid",
+    "msclkid",
+    "mc_cid",
+    "mc_eid",
+    "igshid",
+    "_ga",
+    "_gl",
+)
+
+
+class UrlCanonicalizer:
+    """
+    Turns the links found in the result pages into the article URLs, like
+    `GoogleNews.fix_url`: the "/url?q=" redirect prefix is dropped, the link
+    is unquoted and the `strip` parameters are removed from its query string,
+    which is then encoded again. Links without any "%" nor parameter to strip
+    are returned untouched, without re-encoding their query string.
+    Results are memoized in an LRU cache.
+    Parameters:
+    strip = names of the query parameters to remove, a trailing "*" matching
+            every name with that prefix (e.g. GOOGLE_PARAMS + TRACKING_PARAMS)
+    maxsize = number of canonicalized links kept in the LRU cache
+    """
+
+    __slots__ = (
+        "_strip",
+        "_maxsize",
+        "_names",
+        "_prefixes",
+        "_cached_canonicalize",
+    )
+
+    _strip: tuple[str, ...]
+    _maxsize: int
+    _names: frozenset[str]
+    _prefixes: tuple[str, ...]
+
+    def __init__(self, strip: Iterable[str] = GOOGLE_PARAMS, maxsize: int = 65536):
+        self._strip = tuple(strip)
+        self._maxsize = maxsize
+        self._names = frozenset(name for name in self._strip if not name.endswith("*"))
+        self._prefixes = tuple(
+            name[:-1] for name in self._strip if name.endswith("*")
+        )
+        self._cached_canonicalize = lru_cache(maxsize=maxsize)(self._canonicalize)
+
+    def __reduce__(self):
+        # The LRU cache is not picklable, rebuild an empty one
+        return type(self), (self._strip, self._maxsize)
+
+    @property
+    def strip(self):
+        return self._strip
+
+    def canonicalize(self, url: str) -> str:
+        return self._cached_canonicalize(url)
+
+    def canonicalize_many(self, urls: Iterable[str]):
+        """ Canonical form of every link of `urls`, in order. """
+
+        canonicalize = self._cached_canonicalize
+
+        return [canonicalize(url) for url in urls]
+
+    def cache_info(self):
+        return self._cached_canonicalize.cache_info()
+
+    def cache_clear(self):
+        self._cached_canonicalize.cache_clear()
+
+    @staticmethod
+    def fix_query_string(url: str):
+        """
+        Unquotes a link that comes double url encoded, and gives back the "?"
+        its query string lost when it was unquoted.
+        """
+
+        if "%" in url:
+            url = unquote(unquote(url))
+
+        if "?" not in url and "&" in url:
+            url = url.replace("&", "?", 1)
+
+        return url
+
+    def strip_params(self, url: str, requote: bool = True):
+        """
+        `url` without the `strip` parameters, its query string encoded again
+        by urlencode. Without `requote`, a link with no parameter to strip is
+        returned as it is.
+        """
+
+        if not requote:
+            query = url.partition("#")[0].partition("?")[2]
+            if not any(self._stripped(param) for param in query.split("&") if param):
+                return url
+
+        parsed_url = urlparse(url)
+        params = {
+            name: values
+            for name, values in parse_qs(parsed_url.query).items()
+            if not self._stripped(name)
+        }
+
+        return urlunparse(parsed_url._replace(query=urlencode(params, doseq=True)))
+
+    def _canonicalize(self, url: str):
+        url = url.removeprefix("/url?q=")
+
+        # The values unquoted by fix_query_string are quoted again
+        return self.strip_params(self.fix_query_string(url), requote="%" in url)
+
+    def _stripped(self, param: str):
+        name = param.partition("=")[0]
+
+        return name in self._names or (
+            bool(self._prefixes) and name.startswith(self._prefixes)
+        )
+
+
+default_url_canonicalizer = UrlCanonicalizer()
@@ -0,0 +1,127 @@
+import threading
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from .Deduplicator import canonical_url
+from .NewsResult import NewsResult
+
+
+if TYPE_CHECKING:
+    import sqlite3
+
+
+@dataclass(slots=True)
+class Watermark:
+    """
+    What a watched query returned so far: the newest result datetime and the
+    canonical links of the latest results.
+    """
+
+    newest: datetime | None = None
+    links: set[str] = field(default_factory=set)
+
+    def is_older(self, result: NewsResult):
+        return (
+            self.newest is not None
+            and result["datetime"] is not None
+            and result["datetime"] < self.newest
+        )
+
+
+class WatchStore:
+    """
+    sqlite file keeping a `Watermark` per watched query, so that `poll_new`
+    only returns the results that appeared since the previous poll, across
+    restarts.
+    Parameters:
+    path = sqlite file, None keeps the watermarks in memory only
+    max_links = number of links remembered per query, the oldest are forgotten
+    """
+
+    __slots__ = (
+        "_max_links",
+        "_lock",
+        "_connection",
+    )
+
+    _max_links: int
+    _lock: threading.Lock
+    _connection: "sqlite3.Connection"
+
+    def __init__(self, path: str | None = None, max_links: int = 2000):
+        import sqlite3
+
+        self._max_links = max_links
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            path if path is not None else ":memory:", check_same_thread=False
+        )
+
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS watermarks"
+                " (query TEXT PRIMARY KEY, newest TEXT)"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS seen (query TEXT NOT NULL,"
+                " link TEXT NOT NULL, seen REAL NOT NULL, PRIMARY KEY (query, link))"
+            )
+
+    def load(self, query: str):
+        """ Watermark of `query`, empty if it was never polled. """
+
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT newest FROM watermarks WHERE query = ?", (query,)
+            ).fetchone()
+            links = self._connection.execute(
+                "SELECT link FROM seen WHERE query = ?", (query,)
+            ).fetchall()
+
+        return Watermark(
+            datetime.fromisoformat(row[0]) if row is not None and row[0] else None,
+            {link for link, in links},
+        )
+
+    def update(self, query: str, results: Iterable[NewsResult]):
+        """ Records `results` as seen and moves the watermark of `query` forward. """
+
+        results = list(results)
+        dates = [result["datetime"] for result in results if result["datetime"]]
+        newest = max(dates, default=None)
+        now = time.time()
+
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO seen (query, link, seen) VALUES (?, ?, ?)",
+                # Oldest first, so that trimming on rowid forgets the oldest links
+                [
+                    (query, canonical_url(result["link"]), now)
+                    for result in reversed(results) if result["link"]
+                ],
+            )
+            self._connection.execute(
+                "DELETE FROM seen WHERE query = ? AND rowid NOT IN"
+                " (SELECT rowid FROM seen WHERE query = ?"
+                " ORDER BY seen DESC, rowid DESC LIMIT ?)",
+                (query, query, self._max_links),
+            )
+
+            if newest is not None:
+                self._connection.execute(
+                    "INSERT INTO watermarks (query, newest) VALUES (?, ?)"
+                    " ON CONFLICT (query) DO UPDATE"
+                    " SET newest = max(ifnull(newest, ''), excluded.newest)",
+                    (query, newest.isoformat()),
+                )
+
+    def forget(self, query: str):
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM watermarks WHERE query = ?", (query,))
+            self._connection.execute("DELETE FROM seen WHERE query = ?", (query,))
+
+    def close(self):
+        self._connection.close()
@@ -1,5 +1,79 @@
+from typing import TYPE_CHECKING
+
+from .AsyncGoogleNews import AsyncGoogleNews
+from .DateNormalizer import DateNormalizer
+from .Deduplicator import BloomFilter, Deduplicator
+from .Extractor import Extractor
 from .GoogleNews import GoogleNews
+from .Metrics import Metrics
+from .NewsBatch import NewsBatch
+from .NewsRecord import NewsRecord
 from .NewsResult import NewsResult
+from .Parser import Parser
+from .Query import Query, ResultPage
+from .RateLimiter import BlockedError, RateLimiter
+from .ResultIndex import ResultIndex
+from .Sink import NdjsonSink, ParquetSink, Sink, SqliteSink
+from .Transport import PooledTransport, Transport, UrllibTransport
+from .UrlCanonicalizer import UrlCanonicalizer
+from .WatchStore import WatchStore, Watermark
+
+
+__all__ = [
+    "AsyncGoogleNews",
+    "BatchResult",
+    "BlockedError",
+    "BloomFilter",
+    "DateNormalizer",
+    "Deduplicator",
+    "Extractor",
+    "GoogleNews",
+    "LanguageResults",
+    "Metrics",
+    "NdjsonSink",
+    "NewsBatch",
+    "NewsRecord",
+    "NewsResult",
+    "ParquetSink",
+    "Parser",
+    "PooledTransport",
+    "Query",
+    "RateLimiter",
+    "ResponseCache",
+    "ResultPage",
+    "ResultIndex",
+    "Sink",
+    "SqliteSink",
+    "Transport",
+    "UrlCanonicalizer",
+    "UrllibTransport",
+    "WatchStore",
+    "Watermark",
+]
+
+
+# Optional components, imported when they are first asked for, with the
+# module holding them: they pull in pickle and sqlite3. The modules named
+# after their class (AsyncGoogleNews, Sink, Transport, WatchStore) are
+# imported above instead, importing a submodule binds its name on the
+# package, which would hide the class from __getattr__
+LAZY = {
+    "BatchResult": "Batch",
+    "LanguageResults": "Batch",
+    "ResponseCache": "Cache",
+}
+
+
+if TYPE_CHECKING:
+    from .Batch import BatchResult, LanguageResults
+    from .Cache import ResponseCache
+
 
+def __getattr__(name: str):
+    module = LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-__all__ = ["GoogleNews", "NewsResult"]
+    value = getattr(__import__(f"{__name__}.{module}", fromlist=[name]), name)
+    globals()[name] = value
+    return value
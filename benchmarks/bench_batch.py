@@ -0,0 +1,49 @@
+"""
+Queries/sec of `GoogleNews.batch` against the saved search page, served with
+a simulated network latency, for several sizes of the parsing process pool.
+Run with `python -m benchmarks.bench_batch`.
+"""
+
+import os
+import time
+from pathlib import Path
+
+from GoogleNews import GoogleNews, Transport
+
+
+FIXTURES = Path(__file__).parent.parent / "tests" / "fixtures"
+
+
+class SlowTransport(Transport):
+
+    __slots__ = ("_page", "_latency")
+
+    def __init__(self, latency: float):
+        self._page = (FIXTURES / "search.html").read_bytes()
+        self._latency = latency
+
+    def fetch(self, url, headers):
+        time.sleep(self._latency)
+        return self._page
+
+
+def main(queries: int = 64, pages: int = 2, latency: float = 0.05):
+    googlenews = GoogleNews(transport=SlowTransport(latency))
+    keys = [f"query {i}" for i in range(queries)]
+
+    print(
+        f"{os.cpu_count()} CPUs, {queries} queries x {pages} pages,"
+        f" {latency}s latency"
+    )
+    print(f"{'parse processes':<16} {'queries/s':>10}")
+    for processes in (None, 1, 2, 4):
+        start = time.perf_counter()
+        batch = googlenews.batch(keys, pages=pages, parse_processes=processes)
+        elapsed = time.perf_counter() - start
+
+        assert all(item.ok for item in batch)
+        print(f"{processes!s:<16} {queries / elapsed:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+Rows/sec of the date parsing done for every result.
+Run with `python -m benchmarks.bench_dates`.
+"""
+
+import time
+
+import dateparser
+
+from GoogleNews import DateNormalizer
+
+
+ROWS = [
+    "3 hours ago", "1 day ago", "5 mins ago", "2 days ago", "Oct 12, 2026",
+    "1 week ago", "45 minutes ago", "4 hours ago", "Sep 30, 2026", "6 days ago",
+    "2026-10-18T09:15:00Z", "3 ore fa",
+] * 50
+
+
+def rows_per_second(parse):
+    started = time.perf_counter()
+    for row in ROWS:
+        parse(row)
+    return len(ROWS) / (time.perf_counter() - started)
+
+
+def main():
+    dateparser.parse("warm up")
+
+    cold = DateNormalizer(maxsize=0)
+    warm = DateNormalizer()
+
+    for name, parse in (
+        ("dateparser.parse", dateparser.parse),
+        ("DateNormalizer (no cache)", cold.parse),
+        ("DateNormalizer (cached)", warm.parse),
+    ):
+        print(f"{name:<28} {rows_per_second(parse):>10.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Node visits and items/sec of the result field extraction on the saved search
+page: the trie walk of `Extractor` against resolving every field on its own,
+as the chained `find` calls used to.
+Run with `python -m benchmarks.bench_extract`.
+"""
+
+import timeit
+from pathlib import Path
+
+from GoogleNews import Extractor, Parser
+from GoogleNews.Extractor import SEARCH_LAYOUT
+
+
+FIXTURES = Path(__file__).parent.parent / "tests" / "fixtures"
+
+
+def chained(item):
+    """ Field extraction of the former `_parse_items`. """
+
+    fields = {}
+    try:
+        fields["title"] = item.find("h3").text
+    except Exception:
+        fields["title"] = None
+    fields["link"] = item.get("href")
+    try:
+        fields["media"] = (
+            item.find("div").find("div").find("div").find_next_sibling("div").text
+        )
+    except Exception:
+        fields["media"] = None
+    try:
+        fields["date"] = item.find("div").find_next_sibling("div").find("span").text
+    except Exception:
+        fields["date"] = None
+    try:
+        fields["desc"] = (
+            item.find("div").find_next_sibling("div").find("div")
+            .find_next_sibling("div").find("div").find("div").find("div").text
+        )
+    except Exception:
+        fields["desc"] = None
+    try:
+        fields["img"] = item.find("img").get("src")
+    except Exception:
+        fields["img"] = None
+
+    return fields
+
+
+def main(number: int = 2000):
+    page = (FIXTURES / "search.html").read_bytes()
+    soup = Parser("html.parser").search_soup(page)
+    items = soup.find_all("a", attrs={"data-ved": True})
+
+    extractor = Extractor()
+    separate = [Extractor({name: rule}) for name, rule in SEARCH_LAYOUT.items()]
+
+    shared_visits = sum(extractor.node_visits(item) for item in items)
+    separate_visits = sum(
+        single.node_visits(item) for item in items for single in separate
+    )
+    print(f"node visits per item: {separate_visits / len(items):.1f} separate paths,"
+          f" {shared_visits / len(items):.1f} shared trie")
+
+    for name, extract in (("chained find", chained), ("Extractor", extractor.extract)):
+        elapsed = min(timeit.repeat(
+            lambda: [extract(item) for item in items],  # noqa: B023
+            number=number // 10,
+            repeat=3,
+        ))
+        print(f"{name:<13} {number // 10 * len(items) / elapsed:>10.0f} items/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Seconds spent paging through a search and reading the sorted results after
+every page: sorting the whole list again each time, as `results(sort=True)`
+did, against the runs merged by `ResultIndex`.
+Run with `python -m benchmarks.bench_index`.
+"""
+
+import random
+import time
+from datetime import datetime, timedelta
+
+from GoogleNews import ResultIndex
+
+
+def pages(count: int, size: int = 10):
+    rng = random.Random(0)
+    start = datetime(2026, 10, 18)
+    for page in range(count):
+        yield [
+            {
+                "title": f"Story number {page * size + i}",
+                "media": f"Media {i % 4}",
+                # google mostly pages backwards in time, with a few undated results
+                "datetime": None if i == 9 else start - timedelta(
+                    hours=page * size + rng.randint(-30, 30)
+                ),
+            }
+            for i in range(size)
+        ]
+
+
+def resort(count: int):
+    results = []
+    for page in pages(count):
+        results.extend(page)
+        results.sort(
+            key=lambda r: (r["datetime"] is not None, r["datetime"] or datetime.min),
+            reverse=True,
+        )
+        results[:3]
+
+
+def index(count: int):
+    results = ResultIndex()
+    for page in pages(count):
+        results.add(page)
+        results.top_k(3)
+
+
+def main():
+    for count in (100, 1000):
+        for name, run in (
+            ("sort after every page", resort),
+            ("ResultIndex", index),
+        ):
+            start = time.perf_counter()
+            run(count)
+            elapsed = time.perf_counter() - start
+            print(f"{count:>5} pages  {name:<24} {elapsed:>8.3f}s")
+
+
+if __name__ == "__main__":
+    main()
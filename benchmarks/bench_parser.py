@@ -0,0 +1,47 @@
+"""
+Pages/sec of the parser backends on the saved fixtures.
+Run with `python -m benchmarks.bench_parser`.
+"""
+
+import timeit
+from importlib.util import find_spec
+from pathlib import Path
+
+from GoogleNews import GoogleNews, Parser
+
+
+FIXTURES = Path(__file__).parent.parent / "tests" / "fixtures"
+
+
+def main(number: int = 50):
+    search_page = (FIXTURES / "search.html").read_bytes()
+    news_page = (FIXTURES / "news.html").read_bytes()
+
+    backends = ["html.parser"] + (["lxml"] if find_spec("lxml") else [])
+
+    print(
+        f"{'backend':<12} {'selective':<10} {'search pages/s':>15} {'news pages/s':>13}"
+    )
+    for backend in backends:
+        for selective in (False, True):
+            googlenews = GoogleNews(parser=Parser(backend, selective))
+
+            search = min(timeit.repeat(
+                lambda: googlenews._parse_response(search_page),  # noqa: B023
+                number=number,
+                repeat=3,
+            ))
+            news = min(timeit.repeat(
+                lambda: googlenews._parser.news_soup(news_page).select("article"),  # noqa: B023
+                number=number,
+                repeat=3,
+            ))
+
+            print(
+                f"{backend:<12} {selective!s:<10} "
+                f"{number / search:>15.1f} {number / news:>13.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+URLs/sec of the page URLs of a deep paginated batch: building the whole
+search URL and localizing it for every page, as `page_at` used to, against
+`Query.search_urls` on the shared `UrlTemplate`.
+Run with `python -m benchmarks.bench_query`.
+"""
+
+# The former builder is kept as it was, with str.format
+# ruff: noqa: UP032
+
+import timeit
+from urllib.parse import quote
+
+from GoogleNews import Query
+
+
+def legacy_search_url(
+    key: str, lang: str, period: str, start: str, end: str, page: int
+):
+    """ The search URL of `page`, built like `GoogleNews._search_url` used to. """
+
+    if start != "" and end != "":
+        url = (
+            "https://www.google.com/search?q={}&lr=lang_{}&biw=1920&bih=976&source=lnt"
+            "&&tbs=lr:lang_1{},cdr:1,cd_min:{},cd_max:{},sbd:1&tbm=nws&start={}"
+        ).format(key, lang, lang, start, end, 10 * (page - 1))
+    elif period != "":
+        url = (
+            "https://www.google.com/search?q={}&lr=lang_{}&biw=1920&bih=976&source=lnt"
+            "&&tbs=lr:lang_1{},qdr:{},,sbd:1&tbm=nws&start={}"
+        ).format(key, lang, lang, period, 10 * (page - 1))
+    else:
+        url = (
+            "https://www.google.com/search?q={}&lr=lang_{}&biw=1920&bih=976&source=lnt"
+            "&&tbs=lr:lang_1{},sbd:1&tbm=nws&start={}"
+        ).format(key, lang, lang, 10 * (page - 1))
+
+    return url, url.replace("search?", f"search?hl={lang}&gl={lang}&")
+
+
+def main(queries: int = 200, pages: int = 100):
+    searches = [
+        (f"company {i}", ("en", "it", "ru", "de")[i % 4], "7d", "", "")
+        for i in range(queries)
+    ]
+    urls = queries * pages
+
+    def legacy():
+        return [
+            legacy_search_url(quote(key), lang, period, start, end, page)
+            for key, lang, period, start, end in searches
+            for page in range(1, pages + 1)
+        ]
+
+    def templated():
+        built = []
+        for search in searches:
+            query = Query(*search)
+            built.extend(zip(
+                query.search_urls(range(1, pages + 1)),
+                query.search_urls(range(1, pages + 1), localized=True),
+                strict=True,
+            ))
+        return built
+
+    assert legacy() == templated()
+
+    for name, run in (("format per page", legacy), ("Query.search_urls", templated)):
+        elapsed = min(timeit.repeat(run, number=1, repeat=5))
+        print(f"{name:<20} {urls / elapsed:>12.0f} urls/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Rows/sec written to disk: collecting every result in `results()` and
+serializing the list afterwards, against the sinks writing batches as the
+results come. Run with `python -m benchmarks.bench_sinks`.
+"""
+
+import json
+import sqlite3
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from GoogleNews import NdjsonSink, NewsBatch, ParquetSink, SqliteSink
+from GoogleNews.Deduplicator import canonical_url
+from GoogleNews.NewsRecord import FIELDS
+
+
+def pages(count: int, size: int = 10):
+    """ `count` pages of `size` results, as get_page would add them. """
+
+    start = datetime(2026, 10, 18)
+    for page in range(count):
+        yield [
+            {
+                "title": f"Story number {page * size + i}",
+                "media": f"Media {i}",
+                "date": f"{i} hours ago",
+                "datetime": start - timedelta(hours=page * size + i),
+                "desc": "Lorem ipsum dolor sit amet. " * 4,
+                "link": f"https://www.example{i}.com/news/{page * size + i}",
+                "img": "data:image/gif;base64,R0lGODlhAQABAIAAAP",
+                "site": None,
+                "reporter": None,
+            }
+            for i in range(size)
+        ]
+
+
+def json_list(path: Path, count: int):
+    results = []
+    for page in pages(count):
+        results.extend(page)
+
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(results, file, default=str)
+
+
+def parquet_list(path: Path, count: int):
+    results = []
+    for page in pages(count):
+        results.extend(page)
+
+    NewsBatch(results).to_pandas().to_parquet(path)
+
+
+def sqlite_list(path: Path, count: int):
+    results = []
+    for page in pages(count):
+        results.extend(page)
+
+    # Same table as SqliteSink, unique canonical links included
+    connection = sqlite3.connect(path)
+    with connection:
+        connection.execute(f"CREATE TABLE news ({', '.join(FIELDS)}, canonical_link)")
+        connection.execute("CREATE UNIQUE INDEX news_link ON news (canonical_link)")
+        connection.executemany(
+            f"INSERT OR IGNORE INTO news VALUES ({', '.join('?' * (len(FIELDS) + 1))})",
+            [
+                [str(result[name]) for name in FIELDS] + [canonical_url(result["link"])]
+                for result in results
+            ],
+        )
+    connection.close()
+
+
+def sink(factory):
+    def run(path: Path, count: int):
+        with factory(path) as destination:
+            for page in pages(count):
+                destination.write(page)
+
+    return run
+
+
+def main(count: int = 5_000):
+    candidates = (
+        ("json, dict list", json_list),
+        ("NdjsonSink", sink(NdjsonSink)),
+        ("parquet, dict list", parquet_list),
+        ("ParquetSink", sink(ParquetSink)),
+        ("sqlite, dict list", sqlite_list),
+        ("SqliteSink", sink(SqliteSink)),
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        for number, (name, run) in enumerate(candidates):
+            path = Path(directory) / f"{number}.out"
+            start = time.perf_counter()
+            run(path, count)
+            elapsed = time.perf_counter() - start
+            print(f"{name:<24} {count * 10 / elapsed:>12.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Links/sec of the result link cleanup: the former parse_qs/urlencode round
+trip against `UrlCanonicalizer`, with and without its LRU cache.
+Run with `python -m benchmarks.bench_urls`.
+"""
+
+import timeit
+from urllib.parse import parse_qs, unquote, urlencode, urlparse, urlunparse
+
+from GoogleNews import UrlCanonicalizer
+
+
+def legacy_fix_url(url: str):
+    """ `GoogleNews.fix_url` before the canonicalizer. """
+
+    url = unquote(unquote(url.removeprefix("/url?q=")))
+    if "?" not in url and "&" in url:
+        url = url.replace("&", "?", 1)
+
+    parsed_url = urlparse(url)
+    query_params = parse_qs(parsed_url.query)
+    query_params.pop("sa", None)
+    query_params.pop("usg", None)
+    query_params.pop("ved", None)
+
+    return urlunparse(parsed_url._replace(query=urlencode(query_params, doseq=True)))
+
+
+def links(count: int):
+    # Mix of google redirects, article links with a query and bare links
+    for i in range(count):
+        if i % 3 == 0:
+            yield f"/url?q=https://www.example{i}.com/news/{i}%3Fref%3Dfeed&sa=U&ved=2a{i}"
+        elif i % 3 == 1:
+            yield f"https://news.google.com/articles/CBMi{i}?hl=en-US&gl=US&ceid=US:en"
+        else:
+            yield f"https://www.example{i}.com/2026/10/18/story-{i}"
+
+
+def main(count: int = 10_000, repeat_share: int = 4):
+    unique = list(links(count))
+    # Pages of a crawl repeat the same links over and over
+    workload = unique[: count // repeat_share] * repeat_share
+
+    uncached = UrlCanonicalizer(maxsize=0)
+    cached = UrlCanonicalizer()
+
+    candidates = (
+        ("legacy fix_url", lambda: [legacy_fix_url(url) for url in workload]),
+        ("canonicalizer, no cache", lambda: uncached.canonicalize_many(workload)),
+        ("canonicalizer, cached", lambda: cached.canonicalize_many(workload)),
+    )
+    for name, run in candidates:
+        elapsed = min(timeit.repeat(run, number=1, repeat=5))
+        print(f"{name:<24} {len(workload) / elapsed:>12.0f} links/s")
+
+
+if __name__ == "__main__":
+    main()
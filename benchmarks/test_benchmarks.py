@@ -0,0 +1,119 @@
+"""
+pytest-benchmark suite over the recorded fixtures, no network involved.
+Run with `pytest benchmarks`, add `--benchmark-autosave` to keep the results
+in .benchmarks/ and `--benchmark-compare --benchmark-compare-fail=mean:15%`
+to fail on a regression against the last saved run.
+"""
+
+from importlib.util import find_spec
+
+import pytest
+
+
+pytest.importorskip("pytest_benchmark")
+
+from GoogleNews import (  # noqa: E402
+    DateNormalizer,
+    GoogleNews,
+    Parser,
+    UrlCanonicalizer,
+)
+from tests.harness import FixtureTransport, fixture  # noqa: E402
+
+
+BACKENDS = ["html.parser"] + (["lxml"] if find_spec("lxml") else [])
+
+ENGLISH_DATES = [
+    "3 hours ago", "1 day ago", "5 mins ago", "2 days ago", "Oct 12, 2026",
+    "1 week ago", "45 minutes ago", "4 hours ago", "Sep 30, 2026", "6 days ago",
+]
+ITALIAN_DATES = ["3 ore fa", "1 giorno fa", "12 ott 2026", "30 set 2026"]
+
+
+@pytest.mark.benchmark(group="end to end")
+def test_search_two_pages(benchmark):
+    transport = FixtureTransport()
+
+    def run():
+        googlenews = GoogleNews(transport=transport)
+        googlenews.search("Apple")
+        googlenews.get_page(2)
+        return googlenews.results()
+
+    assert len(benchmark(run)) == 22
+
+
+@pytest.mark.benchmark(group="end to end")
+@pytest.mark.parametrize("backend", ["html", "rss"])
+def test_get_news(benchmark, backend):
+    transport = FixtureTransport()
+
+    def run():
+        googlenews = GoogleNews(transport=transport)
+        googlenews.set_news_backend(backend)
+        googlenews.get_news("Markets")
+        return googlenews.results()
+
+    assert len(benchmark(run)) == 12
+
+
+@pytest.mark.benchmark(group="parse")
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("selective", [True, False])
+def test_parse_search_page(benchmark, backend, selective):
+    googlenews = GoogleNews(parser=Parser(backend, selective))
+    page = fixture("search.html")
+
+    assert len(benchmark(googlenews._parse_response, page)) == 11
+
+
+@pytest.mark.benchmark(group="parse")
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_stream_search_page(benchmark, backend):
+    parser = Parser(backend)
+    page = fixture("search.html")
+    chunks = [page[start:start + 16384] for start in range(0, len(page), 16384)]
+
+    assert len(benchmark(lambda: list(parser.search_stream(chunks)))) == 12
+
+
+@pytest.mark.benchmark(group="parse")
+def test_extract_items(benchmark):
+    googlenews = GoogleNews()
+    items = googlenews._parse_response(fixture("search.html"))
+
+    assert len(benchmark(googlenews._parse_items, items)) == 11
+
+
+@pytest.mark.benchmark(group="dates")
+@pytest.mark.parametrize(
+    "lang, dates", [("en", ENGLISH_DATES), ("it", ITALIAN_DATES)], ids=["en", "it"]
+)
+def test_dates_uncached(benchmark, lang, dates):
+    normalizer = DateNormalizer(maxsize=0)
+
+    def run():
+        return [normalizer.parse(date, lang) for date in dates]
+
+    assert all(benchmark(run))
+
+
+@pytest.mark.benchmark(group="dates")
+def test_dates_cached(benchmark):
+    normalizer = DateNormalizer()
+
+    def run():
+        return [normalizer.parse(date) for date in ENGLISH_DATES]
+
+    assert all(benchmark(run))
+
+
+@pytest.mark.benchmark(group="urls")
+@pytest.mark.parametrize("maxsize", [0, 65536], ids=["uncached", "cached"])
+def test_fix_urls(benchmark, maxsize):
+    canonicalizer = UrlCanonicalizer(maxsize=maxsize)
+    googlenews = GoogleNews()
+    items = googlenews._parse_response(fixture("search.html"))
+    links = [item.get("href") for item in items] * 10
+
+    assert len(benchmark(canonicalizer.canonicalize_many, links)) == len(links)
@@ -0,0 +1,160 @@
+"""
+Offline stand-in for google.com and news.google.com, serving the recorded
+pages of tests/fixtures. Inject it with `GoogleNews(transport=FixtureTransport())`,
+or set GOOGLENEWS_LIVE=1 to let `client` hit the real sites.
+"""
+
+import asyncio
+import os
+import re
+import time
+from collections.abc import Callable, Iterable
+from pathlib import Path
+
+from GoogleNews import AsyncGoogleNews, GoogleNews, Transport
+
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+LIVE = os.environ.get("GOOGLENEWS_LIVE", "") not in ("", "0")
+
+
+def fixture(name: str):
+    return (FIXTURES / name).read_bytes()
+
+
+class FixtureTransport(Transport):
+    """
+    Answers every URL with the matching recorded page and keeps the list of
+    requested URLs.
+    Parameters:
+    latency = seconds slept before every answer, to mimic the network
+    chunk_size = size of the chunks `stream` cuts the pages in
+    answers = pages, or exceptions to raise, answering the first requests
+              before the recorded pages
+    rewrite = called with every URL and its recorded page, returns the page
+              to answer instead; it can raise to fail the request
+    """
+
+    __slots__ = (
+        "urls",
+        "answers",
+        "_latency",
+        "_chunk_size",
+        "_rewrite",
+        "_pages",
+    )
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        chunk_size: int = 4096,
+        answers: Iterable[bytes | Exception] = (),
+        rewrite: Callable[[str, bytes], bytes] | None = None,
+    ):
+        self.urls = []
+        self.answers = list(answers)
+        self._latency = latency
+        self._chunk_size = chunk_size
+        self._rewrite = rewrite
+        self._pages = {}
+
+    def fetch(self, url, headers):
+        self.urls.append(url)
+        if self._latency:
+            time.sleep(self._latency)
+
+        if self.answers:
+            answer = self.answers.pop(0)
+            if isinstance(answer, Exception):
+                raise answer
+            return answer
+
+        name = self.route(url)
+        page = self._pages.get(name)
+        if page is None:
+            page = self._pages[name] = fixture(name)
+
+        if self._rewrite is not None:
+            return self._rewrite(url, page)
+
+        return page
+
+    def stream(self, url, headers):
+        page = self.fetch(url, headers)
+        for start in range(0, len(page), self._chunk_size):
+            yield page[start:start + self._chunk_size]
+
+    @staticmethod
+    def route(url: str):
+        """ Name of the fixture answering `url`. """
+
+        if url.startswith("https://news.google.com/rss/"):
+            return "news.rss"
+        if url.startswith("https://news.google.com/topics/"):
+            return "topics.html"
+        if url.startswith("https://news.google.com/"):
+            return "news.html"
+
+        lang = re.search(r"lr=lang_(\w+)", url)
+        if lang is not None and lang.group(1) in ("it", "ru"):
+            return f"search_{lang.group(1)}.html"
+
+        start = re.search(r"start=(\d+)", url)
+        if start is not None and int(start.group(1)) >= 10:
+            # google keeps answering the last page past the end
+            return "search_page2.html"
+
+        return "search.html"
+
+
+def client(**kwargs):
+    """ `GoogleNews` answered by the fixtures, or by google when LIVE. """
+
+    if LIVE:
+        return GoogleNews(**kwargs)
+
+    return GoogleNews(transport=FixtureTransport(), **kwargs)
+
+
+class FixtureAsyncGoogleNews(AsyncGoogleNews):
+    """
+    `AsyncGoogleNews` downloading through a `FixtureTransport` instead of
+    aiohttp, within the concurrency limit of the instance, and recording the
+    peak number of requests in flight.
+    Parameters:
+    transport = answers the requests, a `FixtureTransport` by default
+    latency = seconds awaited before every answer, to mimic the network
+    """
+
+    __slots__ = (
+        "latency",
+        "active",
+        "peak",
+    )
+
+    def __init__(
+        self,
+        transport: Transport | None = None,
+        latency: float = 0.0,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.set_transport(transport if transport is not None else FixtureTransport())
+        self.latency = latency
+        self.active = 0
+        self.peak = 0
+
+    @property
+    def urls(self):
+        return self._transport.urls
+
+    async def _fetch(self, url, headers=None):
+        async with self._limiter():
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            # Let the other requests start, like a download would
+            await asyncio.sleep(self.latency)
+            self.active -= 1
+
+            return self._transport.fetch(url, headers or self._headers)
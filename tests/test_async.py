@@ -0,0 +1,74 @@
+import asyncio
+import unittest
+
+from GoogleNews import Query
+from tests.harness import FixtureAsyncGoogleNews
+
+
+class AsyncGoogleNewsTest(unittest.TestCase):
+
+    def testSearch(self):
+        googlenews = FixtureAsyncGoogleNews()
+        asyncio.run(googlenews.search("Apple"))
+        self.assertNotEqual(len(googlenews.results()), 0)
+        self.assertIn("hl=en&gl=en&", googlenews.urls[0])
+        self.assertEqual(googlenews.total_count(), 1230000)
+
+    def testGatherPagesKeepsPageOrder(self):
+        googlenews = FixtureAsyncGoogleNews(latency=0.01, concurrency=3)
+        asyncio.run(googlenews.search("Apple"))
+        per_page = len(googlenews.results())
+        asyncio.run(googlenews.gather_pages(range(2, 11)))
+        self.assertEqual(len(googlenews.urls), 10)
+        self.assertEqual(len(googlenews.results()), 10 * per_page)
+        self.assertLessEqual(googlenews.peak, 3)
+        self.assertGreater(googlenews.peak, 1)
+
+    def testSearchMany(self):
+        googlenews = FixtureAsyncGoogleNews(latency=0.01, concurrency=4)
+        queries = ["Apple", "Моцарт", "Tesla"]
+        results = asyncio.run(googlenews.search_many(queries, pages=range(1, 3)))
+        self.assertEqual(list(results), queries)
+        self.assertTrue(all(results.values()))
+        self.assertEqual(googlenews.results(), [])
+        self.assertTrue(any("q=%D0%9C" in url for url in googlenews.urls))
+        self.assertLessEqual(googlenews.peak, 4)
+
+    def testGetNews(self):
+        googlenews = FixtureAsyncGoogleNews()
+        asyncio.run(googlenews.get_news("Apple"))
+        self.assertEqual(len(googlenews.results()), 12)
+        self.assertTrue(googlenews.results()[0]["link"].startswith("https://news.google.com/read/"))
+
+
+    def testFetch(self):
+        googlenews = FixtureAsyncGoogleNews(latency=0.01, concurrency=4)
+        queries = [Query("Apple", lang) for lang in ("en", "it", "ru")]
+
+        async def fetch_all():
+            return await asyncio.gather(*(
+                googlenews.fetch(query, page) for query in queries for page in (1, 2)
+            ))
+
+        pages = asyncio.run(fetch_all())
+        self.assertEqual(len(pages), 6)
+        self.assertEqual([result_page.page for result_page in pages], [1, 2] * 3)
+        self.assertEqual(
+            pages[2].results[0]["title"], "Apple presenta il prodotto numero 1"
+        )
+        self.assertEqual({result_page.total_count for result_page in pages}, {1230000})
+        self.assertTrue(any("hl=ru&gl=ru&" in url for url in googlenews.urls))
+        # Nothing was stored on the instance
+        self.assertEqual(googlenews.results(), [])
+        self.assertEqual(googlenews.total_count(), 0)
+
+    def testFetchNews(self):
+        googlenews = FixtureAsyncGoogleNews()
+        result_page = asyncio.run(googlenews.fetch_news(Query("Markets", lang="it")))
+        self.assertEqual(len(result_page.results), 12)
+        self.assertEqual(googlenews.urls, ["https://news.google.com/search?q=Markets&hl=it"])
+        self.assertEqual(googlenews.results(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
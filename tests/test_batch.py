@@ -0,0 +1,75 @@
+import sys
+import unittest
+from importlib.util import find_spec
+
+from GoogleNews import GoogleNews, NewsBatch, NewsRecord
+from tests.harness import fixture
+
+
+def fixture_results():
+    googlenews = GoogleNews()
+    page = fixture("search.html")
+    results = googlenews._parse_items(googlenews._parse_response(page))
+    results += googlenews._parse_news(fixture("news.html"))
+    return results
+
+
+class NewsRecordTest(unittest.TestCase):
+
+    def testRoundTrip(self):
+        for result in fixture_results():
+            record = NewsRecord.from_result(result)
+            self.assertFalse(hasattr(record, "__dict__"))
+            self.assertEqual({**record.to_result(), **result}, record.to_result())
+
+    def testSmallerThanDict(self):
+        result = fixture_results()[0]
+        record = NewsRecord.from_result(result)
+        self.assertLess(sys.getsizeof(record), sys.getsizeof(result))
+
+
+class NewsBatchTest(unittest.TestCase):
+
+    def setUp(self):
+        self.results = fixture_results()
+        self.batch = NewsBatch(self.results)
+
+    def testColumns(self):
+        self.assertEqual(len(self.batch), 23)
+        self.assertEqual(self.batch.column("link"), [r["link"] for r in self.results])
+        self.assertEqual(self.batch[0], NewsRecord.from_result(self.results[0]))
+        self.assertEqual(len(self.batch.records()), 23)
+
+    def testResultsStayCompatible(self):
+        googlenews = GoogleNews()
+        googlenews._results.extend(self.results)
+        batch = googlenews.results_batch()
+        for result, original in zip(batch.results(), self.results, strict=True):
+            self.assertEqual({**result, **original}, result)
+
+    def testMediaIsInterned(self):
+        batch = NewsBatch(fixture_results() + fixture_results())
+        media = batch.column("media")
+        self.assertIs(media[1], media[1 + 23])
+
+    @unittest.skipUnless(find_spec("pyarrow"), "pyarrow is not installed")
+    def testToArrow(self):
+        table = self.batch.to_arrow()
+        self.assertEqual(table.num_rows, 23)
+        self.assertEqual(table.column("title").to_pylist(), self.batch.column("title"))
+
+    @unittest.skipUnless(find_spec("pandas"), "pandas is not installed")
+    def testToPandas(self):
+        frame = self.batch.to_pandas()
+        self.assertEqual(list(frame.columns)[:3], ["title", "media", "date"])
+        self.assertEqual(frame["link"].tolist(), self.batch.column("link"))
+
+    @unittest.skipUnless(find_spec("numpy"), "numpy is not installed")
+    def testToNumpy(self):
+        arrays = self.batch.to_numpy()
+        self.assertEqual(str(arrays["datetime"].dtype), "datetime64[us]")
+        self.assertEqual(len(arrays["title"]), 23)
+
+
+if __name__ == '__main__':
+    unittest.main()
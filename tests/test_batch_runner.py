@@ -0,0 +1,71 @@
+import unittest
+from urllib.error import HTTPError
+
+from GoogleNews import GoogleNews, ResponseCache
+from tests.harness import FixtureTransport
+
+
+def fail_queries(url: str, page: bytes):
+    """ A 429 for the queries containing "fail". """
+
+    if "fail" in url:
+        raise HTTPError(url, 429, "Too Many Requests", None, None)
+    return page
+
+
+def strip_datetimes(results):
+    return [{**result, "datetime": None} for result in results]
+
+
+class BatchTest(unittest.TestCase):
+
+    def testResultsPerQueryInOrder(self):
+        transport = FixtureTransport()
+        googlenews = GoogleNews(transport=transport)
+        queries = ["Apple", {"key": "Apple", "lang": "it", "period": "7d"}, "Tesla"]
+        batch = googlenews.batch(queries, pages=2, workers=3)
+
+        self.assertEqual([item.query for item in batch], queries)
+        self.assertTrue(all(item.ok for item in batch))
+        self.assertEqual([len(item.results) for item in batch], [22, 22, 22])
+        self.assertEqual(batch[0].total_count, 1230000)
+        self.assertEqual(len(transport.urls), 6)
+        self.assertTrue(
+            any("lr=lang_it" in url and "qdr:7d" in url for url in transport.urls)
+        )
+        self.assertEqual(googlenews.results(), [])
+
+    def testFailureDoesNotAbortTheBatch(self):
+        googlenews = GoogleNews(transport=FixtureTransport(rewrite=fail_queries))
+        batch = googlenews.batch(["Apple", "fail", "Tesla"])
+
+        self.assertEqual([item.ok for item in batch], [True, False, True])
+        self.assertIsInstance(batch[1].error, HTTPError)
+        self.assertEqual(batch[1].results, [])
+        self.assertEqual(len(batch[2].results), 11)
+
+    def testProcessPoolParsingMatchesThreads(self):
+        googlenews = GoogleNews(transport=FixtureTransport())
+        threaded = googlenews.batch(["Apple", "Tesla"], pages=2)
+        processes = googlenews.batch(["Apple", "Tesla"], pages=2, parse_processes=2)
+
+        for expected, item in zip(threaded, processes, strict=True):
+            self.assertTrue(item.ok)
+            self.assertEqual(
+                strip_datetimes(item.results), strip_datetimes(expected.results)
+            )
+            self.assertEqual(item.total_count, expected.total_count)
+
+    def testUsesTheCache(self):
+        transport = FixtureTransport()
+        googlenews = GoogleNews(transport=transport)
+        googlenews.set_cache(ResponseCache())
+        googlenews.batch(["Apple"], parse_processes=1)
+        batch = googlenews.batch(["Apple"])
+
+        self.assertEqual(len(transport.urls), 1)
+        self.assertEqual(len(batch[0].results), 11)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from GoogleNews import GoogleNews, ResponseCache
+from tests.harness import FixtureTransport
+
+
+class ResponseCacheTest(unittest.TestCase):
+
+    def testRepeatedRequestsAreServedFromCache(self):
+        transport = FixtureTransport()
+        cache = ResponseCache(ttl=60)
+
+        first = GoogleNews(transport=transport)
+        first.set_cache(cache)
+        first.search("Apple")
+        first.get_page(2)
+        first.get_news("Apple")
+
+        second = GoogleNews(transport=transport)
+        second.set_cache(cache)
+        second.search("Apple")
+        second.get_page(2)
+        second.get_news("Apple")
+
+        self.assertEqual(len(transport.urls), 3)
+        self.assertEqual(second.results(), first.results())
+        self.assertEqual(second.total_count(), 1230000)
+
+    def testCachedResultsAreCopies(self):
+        cache = ResponseCache()
+        googlenews = GoogleNews(transport=FixtureTransport())
+        googlenews.set_cache(cache)
+        googlenews.search("Apple")
+        googlenews.results()[0]["title"] = "changed"
+
+        googlenews.clear()
+        googlenews.search("Apple")
+        self.assertNotEqual(googlenews.results()[0]["title"], "changed")
+
+    def testPagesAreCachedWithoutParsedResults(self):
+        transport = FixtureTransport()
+        cache = ResponseCache()
+        googlenews = GoogleNews(transport=transport)
+        googlenews.set_cache(cache)
+
+        googlenews.get_news("Apple")
+        googlenews.get_news("Apple", deamplify=True)
+        self.assertEqual(len(transport.urls), 1)
+        self.assertEqual(len(googlenews.results()), 24)
+
+    def testPerEndpointTtl(self):
+        cache = ResponseCache(ttl=60, ttls={"news.google.com": 0.05})
+        self.assertEqual(cache.ttl_for("https://news.google.com/search?q=a"), 0.05)
+        self.assertEqual(cache.ttl_for("https://www.google.com/search?q=a"), 60)
+
+        cache.set_page("https://news.google.com/search?q=a", {}, b"news")
+        cache.set_page("https://www.google.com/search?q=a", {}, b"search")
+        time.sleep(0.1)
+        self.assertIsNone(cache.get_page("https://news.google.com/search?q=a", {}))
+        page = cache.get_page("https://www.google.com/search?q=a", {})
+        self.assertEqual(page, b"search")
+
+    def testHeadersArePartOfTheKey(self):
+        cache = ResponseCache()
+        cache.set_page("https://www.google.com/search?q=a", {"User-Agent": "a"}, b"a")
+        self.assertIsNone(cache.get_page("https://www.google.com/search?q=a", {}))
+
+    def testEquivalentUrlsShareTheirKey(self):
+        key = ResponseCache.key
+        url = "https://news.google.com/search?q=Apple+pie&hl=it"
+        for equivalent in (
+            " HTTPS://News.Google.com/search?hl=it&q=Apple%20pie",
+            "https://news.google.com/search?hl=it&q=Apple pie",
+        ):
+            self.assertEqual(key("page", equivalent, {}), key("page", url, {}))
+
+        self.assertNotEqual(key("page", url + "#deamplify", {}), key("page", url, {}))
+        self.assertNotEqual(
+            key("page", "https://news.google.com/search?q=a&q=b", {}),
+            key("page", "https://news.google.com/search?q=b&q=a", {}),
+        )
+
+    def testLruEviction(self):
+        cache = ResponseCache(maxsize=2)
+        for name in "abc":
+            cache.set_page(f"https://www.google.com/search?q={name}", {}, name.encode())
+        self.assertIsNone(cache.get_page("https://www.google.com/search?q=a", {}))
+        self.assertEqual(cache.get_page("https://www.google.com/search?q=c", {}), b"c")
+
+    def testDiskCacheIsSharedAcrossInstances(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = str(Path(directory) / "cache.sqlite")
+            transport = FixtureTransport()
+
+            for _ in range(2):
+                cache = ResponseCache(path=path)
+                googlenews = GoogleNews(transport=transport)
+                googlenews.set_cache(cache)
+                googlenews.search("Apple")
+                cache.close()
+
+            self.assertEqual(len(transport.urls), 1)
+            self.assertEqual(len(googlenews.results()), 11)
+
+
+if __name__ == '__main__':
+    unittest.main()
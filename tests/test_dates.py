@@ -0,0 +1,72 @@
+import unittest
+from datetime import datetime, timedelta
+
+from GoogleNews import DateNormalizer
+
+
+NOW = datetime(2026, 10, 18, 12, 30)
+
+
+class DateNormalizerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dates = DateNormalizer(granularity=60)
+
+    def testRelativeDates(self):
+        cases = {
+            "3 hours ago": timedelta(hours=3),
+            "1 day ago": timedelta(days=1),
+            "5 mins ago": timedelta(minutes=5),
+            "45 minutes ago": timedelta(minutes=45),
+            "an hour ago": timedelta(hours=1),
+            "2 weeks ago": timedelta(weeks=2),
+            " 10 secs ago ": timedelta(seconds=10),
+        }
+        for text, delta in cases.items():
+            with self.subTest(text=text):
+                self.assertEqual(self.dates.parse(text, now=NOW), NOW - delta)
+
+        self.assertEqual(
+            self.dates.parse("1 month ago", now=NOW), datetime(2026, 9, 18, 12, 30)
+        )
+        self.assertEqual(
+            self.dates.parse("2 years ago", now=NOW), datetime(2024, 10, 18, 12, 30)
+        )
+
+    def testAbsoluteAndIsoDates(self):
+        self.assertEqual(
+            self.dates.parse("Oct 12, 2026", now=NOW), datetime(2026, 10, 12)
+        )
+        self.assertEqual(
+            self.dates.parse("September 3, 2025", now=NOW), datetime(2025, 9, 3)
+        )
+        self.assertEqual(
+            self.dates.parse("2026-10-18T09:15:00Z", now=NOW),
+            datetime(2026, 10, 18, 9, 15),
+        )
+        self.assertIsNone(self.dates.parse("Feb 31, 2026", now=NOW))
+
+    def testFallsBackToDateparser(self):
+        self.assertEqual(
+            self.dates.parse("3 ore fa", "it", now=NOW), NOW - timedelta(hours=3)
+        )
+        self.assertEqual(
+            self.dates.parse("12 октября 2026", "ru", now=NOW), datetime(2026, 10, 12)
+        )
+
+    def testEmpty(self):
+        self.assertIsNone(self.dates.parse(None))
+        self.assertIsNone(self.dates.parse("   "))
+
+    def testCachedPerReferenceBucket(self):
+        self.dates.parse("3 hours ago", now=NOW)
+        self.dates.parse("3 hours ago", now=NOW + timedelta(seconds=30))
+        self.assertEqual(self.dates.cache_info().hits, 1)
+
+        later = self.dates.parse("3 hours ago", now=NOW + timedelta(minutes=5))
+        self.assertEqual(later, NOW + timedelta(minutes=5) - timedelta(hours=3))
+        self.assertEqual(self.dates.cache_info().misses, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import unittest
+
+from GoogleNews import BloomFilter, Deduplicator, GoogleNews
+from GoogleNews.Deduplicator import canonical_url, simhash
+from tests.harness import FixtureTransport
+
+
+def result(title, link):
+    return {"title": title, "link": link}
+
+
+class DeduplicatorTest(unittest.TestCase):
+
+    def testCanonicalUrl(self):
+        self.assertEqual(
+            canonical_url("HTTPS://WWW.Example.com/a/b/?x=1#top"),
+            "https://example.com/a/b?x=1",
+        )
+
+    def testDropsRepeatedLinks(self):
+        dedup = Deduplicator()
+        self.assertTrue(dedup.add(result("One", "https://example.com/a")))
+        self.assertFalse(dedup.add(result("Other title", "https://www.example.com/a/")))
+        self.assertEqual(
+            dedup.stats, {"kept": 1, "dropped_links": 1, "dropped_titles": 0}
+        )
+
+    def testDropsNearDuplicateTitles(self):
+        dedup = Deduplicator()
+        title = "Apple unveils the new iPhone with a faster chip and a better camera"
+        self.assertTrue(dedup.add(result(title, "https://a.example/1")))
+        self.assertFalse(dedup.add(result(title + "!", "https://b.example/2")))
+        self.assertTrue(dedup.add(
+            result("Tesla recalls cars over a braking problem", "https://c.example/3")
+        ))
+        self.assertEqual(dedup.stats["dropped_titles"], 1)
+
+    def testDistinctTitlesAreKept(self):
+        titles = [f"Apple announces product number {i}" for i in range(1, 11)]
+        self.assertEqual(len({simhash(title) for title in titles}), 10)
+
+        kept = Deduplicator().filter(
+            result(title, f"https://example.com/{i}") for i, title in enumerate(titles)
+        )
+        self.assertEqual(len(kept), 10)
+
+    def testTitleCheckCanBeDisabled(self):
+        dedup = Deduplicator(title_distance=0)
+        self.assertTrue(dedup.add(result("Same", "https://a.example/1")))
+        self.assertTrue(dedup.add(result("Same", "https://b.example/2")))
+
+    def testBloomFilter(self):
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        for i in range(1000):
+            bloom.add(f"https://example.com/{i}")
+        self.assertIn("https://example.com/10", bloom)
+        false_positives = sum(f"https://other.com/{i}" in bloom for i in range(1000))
+        self.assertLess(false_positives, 50)
+
+    def testBloomBackedDeduplicatorRotates(self):
+        dedup = Deduplicator(title_distance=0, bloom_capacity=100)
+        for i in range(250):
+            dedup.add(result("", f"https://example.com/{i}"))
+        self.assertFalse(dedup.add(result("", "https://example.com/249")))
+        self.assertTrue(dedup.add(result("", "https://example.com/0")))
+
+    def testGoogleNewsDropsRepeatsAcrossPagesAndQueries(self):
+        dedup = Deduplicator()
+        googlenews = GoogleNews(transport=FixtureTransport())
+        googlenews.set_deduplicator(dedup)
+        googlenews.search("Apple")
+        googlenews.get_page(2)
+        googlenews.search("Apple Inc")
+
+        # The second page only repeats the navigation link of the first one
+        self.assertEqual(len(googlenews.results()), 21)
+        self.assertEqual(dedup.stats["dropped_links"], 12)
+
+        other = GoogleNews(transport=FixtureTransport())
+        other.set_deduplicator(dedup)
+        other.get_news("Apple")
+        other.get_news("Apple")
+        self.assertEqual(len(other.results()), 12)
+
+    def testIterResultsIsDeduplicated(self):
+        googlenews = GoogleNews(transport=FixtureTransport())
+        googlenews.set_deduplicator(Deduplicator())
+        googlenews.search("Apple")
+
+        # Only the second page holds articles the search did not return
+        results = list(googlenews.iter_results(max_pages=3))
+        self.assertEqual(len(results), 10)
+        self.assertEqual(list(googlenews.iter_results(max_pages=3)), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+
+from GoogleNews import Extractor, GoogleNews, Parser
+from GoogleNews.Extractor import SEARCH_LAYOUT
+from tests.harness import fixture
+
+
+class ExtractorTest(unittest.TestCase):
+
+    def setUp(self):
+        page = fixture("search.html")
+        soup = Parser("html.parser").search_soup(page)
+        self.items = soup.find_all("a", attrs={"data-ved": True})
+
+    def testExtractsEveryField(self):
+        fields = Extractor().extract(self.items[0])
+
+        self.assertEqual(fields["title"], "Apple announces product number 1")
+        self.assertEqual(fields["media"], "Example Media 1")
+        self.assertEqual(fields["date"], "3 hours ago")
+        self.assertTrue(fields["desc"].startswith("Apple said on Monday"))
+        self.assertTrue(fields["link"].startswith("/url?q=https://www.example1.com/"))
+        self.assertTrue(fields["img"].startswith("data:image/png"))
+
+    def testMissingPathsAreNone(self):
+        fields = Extractor().extract(self.items[-1])
+
+        self.assertIsNone(fields["title"])
+        self.assertIsNone(fields["img"])
+
+    def testSharedPrefixesAreWalkedOnce(self):
+        shared = Extractor().node_visits(self.items[0])
+        separate = sum(
+            Extractor({name: rule}).node_visits(self.items[0])
+            for name, rule in SEARCH_LAYOUT.items()
+        )
+
+        self.assertLess(shared, separate)
+
+    def testSwapLayout(self):
+        # A layout where the date moved into the title block
+        layout = {**SEARCH_LAYOUT, "date": (("div", "~div", "div"), "text")}
+        googlenews = GoogleNews(parser=Parser("html.parser"))
+        googlenews.set_extractor(Extractor(layout))
+        results = googlenews._parse_items(self.items[:1])
+
+        self.assertEqual(results[0]["date"], "Apple announces product number 1")
+        self.assertEqual(results[0]["media"], "Example Media 1")
+
+
+if __name__ == '__main__':
+    unittest.main()
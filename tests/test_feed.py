@@ -0,0 +1,89 @@
+import unittest
+from datetime import datetime
+
+from GoogleNews import GoogleNews
+from GoogleNews.Feed import parse_feed
+from tests.harness import FixtureTransport
+
+
+ATOM = b"""<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>Example</title>
+  <entry>
+    <title>Atom headline</title>
+    <link rel="alternate" href="https://www.example.com/atom?utm_source=x&amp;sa=U"/>
+    <updated>2026-10-18T06:30:00+02:00</updated>
+    <summary>&lt;p&gt;Short &amp;amp; sweet&lt;/p&gt;</summary>
+    <author><name>Jane Doe</name></author>
+  </entry>
+</feed>
+"""
+
+
+class FeedTest(unittest.TestCase):
+
+    def testRssBackend(self):
+        transport = FixtureTransport()
+        googlenews = GoogleNews(transport=transport)
+        googlenews.set_news_backend("rss")
+        googlenews.enable_exception()
+        googlenews.get_news("Markets")
+
+        self.assertEqual(
+            transport.urls, ["https://news.google.com/rss/search?q=Markets&hl=en"]
+        )
+        results = googlenews.results()
+        self.assertEqual(len(results), 12)
+        self.assertEqual(results[0]["title"], "Markets react to story number 1")
+        self.assertEqual(results[0]["media"], "Daily Source 1")
+        self.assertEqual(results[0]["site"], "https://www.source1.com")
+        self.assertEqual(results[0]["datetime"], datetime(2026, 10, 18, 5, 0))
+        self.assertEqual(
+            results[0]["link"],
+            "https://news.google.com/rss/articles/CBMiQ2h0dHBz1?oc=5",
+        )
+
+    def testSameShapeAsHtml(self):
+        googlenews = GoogleNews(transport=FixtureTransport())
+        googlenews.get_news("Markets")
+        googlenews.set_news_backend("rss")
+        googlenews.get_news("Markets")
+
+        html, rss = googlenews.results()[0], googlenews.results()[-1]
+        self.assertEqual(set(html), set(rss))
+
+    def testTopicUrls(self):
+        transport = FixtureTransport()
+        googlenews = GoogleNews(transport=transport)
+        googlenews.set_news_backend("rss")
+        googlenews.set_topic("CAAqJggKIiBDQkFTRWdvSUwyMHZNRGx1YlY4U0FtVnVHZ0pWVXlnQVAB")
+        googlenews.set_topic_section("CAQiS0NCQVNNZ29J")
+        googlenews.get_news()
+
+        self.assertEqual(
+            transport.urls,
+            [
+                "https://news.google.com/rss/topics/"
+                "CAAqJggKIiBDQkFTRWdvSUwyMHZNRGx1YlY4U0FtVnVHZ0pWVXlnQVAB"
+                "/sections/CAQiS0NCQVNNZ29J"
+            ],
+        )
+
+    def testAtom(self):
+        result, = parse_feed(ATOM)
+
+        self.assertEqual(result["title"], "Atom headline")
+        self.assertEqual(result["desc"], "Short & sweet")
+        self.assertEqual(result["reporter"], "Jane Doe")
+        self.assertEqual(result["datetime"], datetime(2026, 10, 18, 4, 30))
+        self.assertEqual(
+            result["link"], "https://www.example.com/atom?utm_source=x&sa=U"
+        )
+
+    def testUnknownBackend(self):
+        with self.assertRaises(ValueError):
+            GoogleNews().set_news_backend("json")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+import subprocess
+import sys
+import unittest
+
+
+HEAVY_MODULES = ("dateparser", "bs4", "dateutil", "aiohttp", "lxml", "regex")
+
+
+def import_times(statement: str):
+    """ Runs `statement` under `python -X importtime`, returns {module: µs}. """
+
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = int(cumulative)
+
+    return times
+
+
+class ImportTimeTest(unittest.TestCase):
+
+    def testHeavyModulesAreNotImported(self):
+        times = import_times("import GoogleNews")
+        print(f"import GoogleNews: {times['GoogleNews'] / 1000:.1f}ms")
+
+        heavy = [name for name in times if name.split(".")[0] in HEAVY_MODULES]
+        self.assertEqual(heavy, [])
+
+    def testAsyncClientIsImportedOnDemand(self):
+        times = import_times("import GoogleNews")
+        self.assertNotIn("asyncio", times)
+
+        times = import_times(
+            "import asyncio; from GoogleNews import AsyncGoogleNews;"
+            "asyncio.run(AsyncGoogleNews().gather_pages([]))"
+        )
+        self.assertIn("asyncio", times)
+        self.assertNotIn("aiohttp", times)
+
+    def testOptionalComponentsAreImportedOnDemand(self):
+        times = import_times("import GoogleNews")
+        for name in ("sqlite3", "pickle", "ssl", "http.client", "concurrent.futures"):
+            self.assertNotIn(name, times)
+
+        times = import_times("from GoogleNews import SqliteSink, WatchStore")
+        self.assertNotIn("sqlite3", times)
+
+        times = import_times("from GoogleNews import WatchStore; WatchStore()")
+        self.assertIn("sqlite3", times)
+        self.assertNotIn("http.client", times)
+
+        times = import_times("from GoogleNews import ResponseCache")
+        self.assertIn("GoogleNews.Cache", times)
+        self.assertIn("pickle", times)
+
+    def testDateparserIsImportedOnFallbackOnly(self):
+        times = import_times(
+            "from GoogleNews import DateNormalizer;"
+            "DateNormalizer().parse('3 hours ago');"
+            "DateNormalizer().parse('2026-10-18T09:15:00Z')"
+        )
+        self.assertNotIn("dateparser", times)
+        self.assertNotIn("dateutil", times)
+
+
+class ExportsTest(unittest.TestCase):
+
+    def testClassesNamedAfterTheirModule(self):
+        # Once its submodule is loaded, e.g. by GoogleNews(), the name of a
+        # module bound on the package must still be the class
+        statements = (
+            "from GoogleNews import GoogleNews; GoogleNews();"
+            " from GoogleNews import Transport",
+            "from GoogleNews import Watermark; from GoogleNews import WatchStore",
+            "from GoogleNews import SqliteSink; from GoogleNews import Sink",
+            "import GoogleNews.AsyncGoogleNews; from GoogleNews import AsyncGoogleNews",
+            "import GoogleNews.Transport; from GoogleNews import Transport",
+        )
+        for statement in statements:
+            with self.subTest(statement=statement):
+                name = statement.rsplit(" ", 1)[-1]
+                process = subprocess.run(
+                    [sys.executable, "-c", f"{statement}; print(type({name}))"],
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                )
+                self.assertEqual(process.stdout.strip(), "<class 'type'>")
+
+
+if __name__ == '__main__':
+    unittest.main()
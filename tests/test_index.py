@@ -0,0 +1,68 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from GoogleNews import GoogleNews, ResultIndex
+from tests.harness import FixtureTransport
+
+
+def result(title, hours=None, media="Example"):
+    dated = None if hours is None else datetime(2026, 10, 18) - timedelta(hours=hours)
+    return {"title": title, "datetime": dated, "media": media, "link": title}
+
+
+class ResultIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        self.index = ResultIndex([result("a", 5), result("b"), result("c", 1, "Other")])
+        self.index.add([result("d", 3), result("e", 5, "Other"), result("f")])
+
+    def titles(self, results):
+        return [result["title"] for result in results]
+
+    def testOrder(self):
+        # Newest first, undated last, ties in the order they were added
+        self.assertEqual(self.titles(self.index), ["c", "d", "a", "e", "b", "f"])
+        self.assertEqual(len(self.index), 6)
+
+        self.index.add([result("g", 0), result("h", 4)])
+        self.assertEqual(self.titles(self.index.top_k(3)), ["g", "c", "d"])
+        self.assertEqual(len(self.index.results()), 8)
+
+    def testBetween(self):
+        start = datetime(2026, 10, 18) - timedelta(hours=5)
+        end = datetime(2026, 10, 18) - timedelta(hours=3)
+        self.assertEqual(self.titles(self.index.between(start, end)), ["d", "a", "e"])
+        self.assertEqual(self.titles(self.index.between(end=end)), ["d", "a", "e"])
+        self.assertEqual(self.titles(self.index.between(start=end)), ["c", "d"])
+        self.assertEqual(len(self.index.between()), 4)
+
+        # Aware bounds are compared in UTC
+        aware = datetime(2026, 10, 17, 22, tzinfo=timezone(timedelta(hours=-1)))
+        self.assertEqual(self.titles(self.index.between(start=aware)), ["c"])
+
+    def testByMedia(self):
+        groups = self.index.by_media()
+        self.assertEqual(self.titles(groups["Example"]), ["d", "a", "b", "f"])
+        self.assertEqual(self.titles(groups["Other"]), ["c", "e"])
+
+    def testSortedResults(self):
+        googlenews = GoogleNews(transport=FixtureTransport())
+        googlenews.search("Apple")
+        googlenews.get_news("Markets")
+        googlenews.get_page(2)
+
+        # Undated results used to make sort=True raise a TypeError
+        results = googlenews.results(sort=True)
+        self.assertEqual(len(results), 34)
+        dated = [result["datetime"] for result in results if result["datetime"]]
+        self.assertEqual(dated, sorted(dated, reverse=True))
+        self.assertIsNone(results[-1]["datetime"])
+        self.assertIs(googlenews.results(), results)
+
+        self.assertEqual(googlenews.results_index().top_k(1), results[:1])
+        googlenews.clear()
+        self.assertEqual(len(googlenews.results_index()), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
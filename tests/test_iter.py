@@ -0,0 +1,86 @@
+import asyncio
+import re
+import unittest
+from datetime import datetime
+from itertools import islice
+
+from GoogleNews import GoogleNews
+from tests.harness import FixtureAsyncGoogleNews, FixtureTransport, fixture
+
+
+def paged_transport(old_from: int | None = None, repeat: bool = False):
+    """
+    The search fixture on every page, with page specific links unless
+    `repeat`, and very old dates from the page `old_from`.
+    """
+
+    def rewrite(url: str, content: bytes):
+        page = int(re.search(r"start=(\d+)", url).group(1)) // 10 + 1
+        content = fixture("search.html")
+        if not repeat:
+            content = content.replace(b"apple-", b"apple-p%d-" % page)
+        if old_from is not None and page >= old_from:
+            content = re.sub(
+                rb'(class="OSrXXb"><span>)[^<]*', rb"\1Jan 1, 2020", content
+            )
+        return content
+
+    return FixtureTransport(rewrite=rewrite)
+
+
+class IterResultsTest(unittest.TestCase):
+
+    def testMaxPages(self):
+        transport = paged_transport()
+        googlenews = GoogleNews(transport=transport)
+        results = list(googlenews.iter_results("Apple", max_pages=3))
+
+        self.assertEqual(len(results), 33)
+        self.assertEqual(len(transport.urls), 3)
+        self.assertEqual(googlenews.results(), [])
+
+    def testPagesAreFetchedLazily(self):
+        transport = paged_transport()
+        googlenews = GoogleNews(transport=transport)
+        first = list(islice(googlenews.iter_results("Apple"), 5))
+
+        self.assertEqual(len(first), 5)
+        self.assertEqual(len(transport.urls), 1)
+
+    def testStopsWhenGoogleRepeatsThePage(self):
+        transport = paged_transport(repeat=True)
+        results = list(GoogleNews(transport=transport).iter_results("Apple"))
+
+        self.assertEqual(len(transport.urls), 2)
+        self.assertEqual(len(results), 11)
+
+    def testStopsAtFirstOlderPage(self):
+        transport = paged_transport(old_from=3)
+        googlenews = GoogleNews(transport=transport)
+        results = list(googlenews.iter_results(
+            "Apple", stop_when_older_than=datetime(2025, 1, 1)
+        ))
+
+        self.assertEqual(len(transport.urls), 3)
+        dated = [result for result in results if result["datetime"] is not None]
+        self.assertEqual(len(dated), 20)
+        self.assertTrue(all(r["datetime"] >= datetime(2025, 1, 1) for r in dated))
+
+    def testAsyncIterResults(self):
+        transport = paged_transport(old_from=3)
+        googlenews = FixtureAsyncGoogleNews(transport)
+
+        async def collect():
+            return [
+                result async for result in googlenews.iter_results(
+                    "Apple", max_pages=5, stop_when_older_than=datetime(2025, 1, 1)
+                )
+            ]
+
+        results = asyncio.run(collect())
+        self.assertEqual(len(transport.urls), 3)
+        self.assertEqual(len([r for r in results if r["datetime"] is not None]), 20)
+
+
+if __name__ == '__main__':
+    unittest.main()
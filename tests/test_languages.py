@@ -0,0 +1,126 @@
+import asyncio
+import unittest
+from datetime import datetime, timedelta
+from urllib.error import HTTPError
+
+from GoogleNews import DateNormalizer, GoogleNews, ResponseCache
+from GoogleNews.ResultIndex import sort_key
+from tests.harness import FixtureAsyncGoogleNews, FixtureTransport
+
+
+def failing_german(url, page):
+    """ The fixtures, and a 429 for the searches in german. """
+
+    if "lr=lang_de" in url:
+        raise HTTPError(url, 429, "Too Many Requests", None, None)
+    return page
+
+
+class SearchLanguagesTest(unittest.TestCase):
+
+    def testMergedAndTagged(self):
+        transport = FixtureTransport()
+        googlenews = GoogleNews(transport=transport, period="7d")
+        langs = ["en", "it", "ru", "it"]
+        searched = googlenews.search_languages("Apple", langs, pages=2)
+
+        self.assertTrue(searched.ok)
+        self.assertEqual(list(searched.languages), ["en", "it", "ru"])
+        self.assertEqual(len(transport.urls), 6)
+        self.assertTrue(all("qdr:7d" in url for url in transport.urls))
+
+        for lang, item in searched.languages.items():
+            self.assertEqual(item.query, {"key": "Apple", "lang": lang})
+            self.assertEqual(len(item.results), 22)
+            self.assertEqual(item.total_count, 1230000)
+            self.assertGreater(item.seconds, 0)
+            self.assertTrue(all(result["lang"] == lang for result in item.results))
+
+        self.assertEqual(
+            searched.languages["ru"].results[0]["title"], "Моцарт: концерт номер 1"
+        )
+        self.assertEqual(len(searched.results), 66)
+        keys = [sort_key(result["datetime"]) for result in searched.results]
+        self.assertEqual(keys, sorted(keys))
+        self.assertGreaterEqual(searched.warmup_seconds, 0)
+
+        # Nothing was stored on the instance
+        self.assertEqual(googlenews.results(), [])
+
+    def testCachedResultsAreNotTagged(self):
+        googlenews = GoogleNews(transport=FixtureTransport())
+        googlenews.set_cache(ResponseCache())
+        googlenews.search_languages("Apple", ["it"])
+        googlenews.search_languages("Apple", ["ru"])
+
+        googlenews.set_lang("it")
+        googlenews.search("Apple")
+        self.assertTrue(all("lang" not in result for result in googlenews.results()))
+
+    def testFailureDoesNotStopTheOtherLanguages(self):
+        googlenews = GoogleNews(transport=FixtureTransport(rewrite=failing_german))
+        searched = googlenews.search_languages("Apple", ["en", "de", "it"])
+
+        self.assertFalse(searched.ok)
+        self.assertIsInstance(searched.languages["de"].error, HTTPError)
+        self.assertEqual(searched.languages["de"].results, [])
+        self.assertEqual(
+            {result["lang"] for result in searched.results}, {"en", "it"}
+        )
+
+    def testAsync(self):
+        googlenews = FixtureAsyncGoogleNews(
+            FixtureTransport(rewrite=failing_german), latency=0.01, concurrency=2
+        )
+        searched = asyncio.run(
+            googlenews.search_languages("Apple", ["en", "de", "it", "ru"], pages=2)
+        )
+
+        self.assertFalse(searched.ok)
+        self.assertEqual(list(searched.languages), ["en", "de", "it", "ru"])
+        self.assertIsInstance(searched.languages["de"].error, HTTPError)
+        self.assertEqual(googlenews.peak, 2)
+
+        for lang in ("en", "it", "ru"):
+            item = searched.languages[lang]
+            self.assertIsNone(item.error)
+            self.assertEqual(len(item.results), 22)
+            self.assertEqual(item.total_count, 1230000)
+            self.assertTrue(all(result["lang"] == lang for result in item.results))
+
+        self.assertEqual(len(searched.results), 66)
+        keys = [sort_key(result["datetime"]) for result in searched.results]
+        self.assertEqual(keys, sorted(keys))
+        self.assertEqual(googlenews.results(), [])
+
+
+class DateParsersTest(unittest.TestCase):
+
+    def testWarmedDateParsers(self):
+        # One bucket, so that the warmed parsers are the ones used
+        dates = DateNormalizer(granularity=10 ** 9)
+        dates.warm(["it", "ru", "ru-RU", "xx"])
+        self.assertEqual(dates._cached_parser.cache_info().currsize, 3)
+
+        self.assertIsNotNone(dates.parse("12 октября 2026", "ru"))
+        self.assertIsNotNone(dates.parse("12 ottobre 2026", "it-IT"))
+        self.assertEqual(dates.cache_info().currsize, 2)
+        self.assertEqual(dates._cached_parser.cache_info().currsize, 3)
+
+    def testRelativeBasePerBucket(self):
+        dates = DateNormalizer()
+        for now in (datetime(2020, 1, 10), datetime(2024, 5, 5)):
+            self.assertEqual(
+                dates.parse("3 giorni fa", "it", now), now - timedelta(days=3)
+            )
+        self.assertEqual(dates._cached_parser.cache_info().currsize, 2)
+
+        self.assertEqual(
+            dates.parse("2 giorni fa", "it", datetime(2024, 5, 5, 0, 0, 30)),
+            datetime(2024, 5, 3),
+        )
+        self.assertEqual(dates._cached_parser.cache_info().currsize, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
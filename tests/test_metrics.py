@@ -0,0 +1,147 @@
+import asyncio
+import unittest
+from contextlib import contextmanager
+from urllib.error import HTTPError
+
+from GoogleNews import AsyncGoogleNews, GoogleNews, Metrics, RateLimiter
+from GoogleNews.Metrics import NO_STAGE
+from tests.harness import FixtureTransport, fixture
+
+
+def flaky_transport(failures: int = 0):
+    """ Throttles the first `failures` requests, then serves the fixtures. """
+
+    throttled = HTTPError(
+        "https://www.google.com/search", 429, "Too Many Requests",
+        {"Retry-After": "0"}, None,
+    )
+    return FixtureTransport(answers=[throttled] * failures)
+
+
+class RecordingTracer:
+
+    def __init__(self):
+        self.spans = []
+
+    @contextmanager
+    def start_as_current_span(self, name, attributes=None):
+        self.spans.append(name)
+        yield
+
+
+class MetricsTest(unittest.TestCase):
+
+    def testStagesAndCounters(self):
+        metrics = Metrics()
+        googlenews = GoogleNews(transport=FixtureTransport())
+        googlenews.set_metrics(metrics)
+        googlenews.search("Apple")
+
+        snapshot = metrics.snapshot()
+        counters = snapshot["counters"]
+        self.assertEqual(counters["requests"], 1)
+        self.assertEqual(counters["bytes_downloaded"], len(fixture("search.html")))
+        self.assertEqual(counters["items_parsed"], 11)
+        # The navigation link has no title, date, desc, media nor image
+        self.assertEqual(counters['parse_failures{field="title"}'], 1)
+        self.assertEqual(snapshot["stages"]["dates"]["count"], 11)
+        for stage in ("download", "parse", "extract"):
+            self.assertEqual(snapshot["stages"][stage]["count"], 1)
+
+    def testNewsParseFailures(self):
+        # Fields never extracted from news pages or feeds are not failures
+        for backend in ("html", "rss"):
+            with self.subTest(backend=backend):
+                metrics = Metrics()
+                googlenews = GoogleNews(transport=FixtureTransport())
+                googlenews.set_news_backend(backend)
+                googlenews.set_metrics(metrics)
+                googlenews.get_news("Apple")
+
+                counters = metrics.snapshot()["counters"]
+                self.assertEqual(counters["items_parsed"], 12)
+                self.assertEqual(
+                    [name for name in counters if name.startswith("parse_failures")],
+                    [],
+                )
+
+        undated = fixture("news.rss").replace(b"<pubDate>", b"<skipped>", 1)
+        undated = undated.replace(b"</pubDate>", b"</skipped>", 1)
+        metrics = Metrics()
+        googlenews = GoogleNews(transport=FixtureTransport(answers=[undated]))
+        googlenews.set_news_backend("rss")
+        googlenews.set_metrics(metrics)
+        googlenews.get_news("Apple")
+
+        counters = metrics.snapshot()["counters"]
+        self.assertEqual(counters['parse_failures{field="date"}'], 1)
+        self.assertEqual(counters['parse_failures{field="datetime"}'], 1)
+
+    def testRetriesAndErrors(self):
+        metrics = Metrics()
+        googlenews = GoogleNews(transport=flaky_transport(failures=2))
+        googlenews.set_metrics(metrics)
+        googlenews.set_rate_limiter(RateLimiter(backoff=0.01, max_retries=1))
+        googlenews.search("Apple")
+
+        counters = metrics.snapshot()["counters"]
+        self.assertEqual(counters["retries"], 1)
+        self.assertEqual(counters['errors{error="HTTPError"}'], 1)
+        self.assertEqual(counters['stage_errors{stage="download"}'], 2)
+        self.assertNotIn("requests", counters)
+
+    def testAsyncErrors(self):
+
+        class FailingAsyncGoogleNews(AsyncGoogleNews):
+
+            async def _fetch(self, url, headers=None):
+                raise HTTPError(url, 503, "Service Unavailable", None, None)
+
+        metrics = Metrics()
+        googlenews = FailingAsyncGoogleNews()
+        googlenews.set_metrics(metrics)
+        asyncio.run(googlenews.search("Apple"))
+        asyncio.run(googlenews.get_news("Apple"))
+
+        counters = metrics.snapshot()["counters"]
+        self.assertEqual(counters['errors{error="HTTPError"}'], 2)
+
+    def testHooksAndSpans(self):
+        tracer = RecordingTracer()
+        events = []
+        metrics = Metrics(tracer=tracer)
+        metrics.add_hook(lambda kind, name, value, labels: events.append((kind, name)))
+        googlenews = GoogleNews(transport=FixtureTransport())
+        googlenews.set_metrics(metrics)
+        googlenews.get_page()
+
+        self.assertEqual(tracer.spans[:3], [
+            "googlenews.download", "googlenews.parse", "googlenews.extract",
+        ])
+        self.assertIn(("stage", "download"), events)
+        self.assertIn(("count", "items_parsed"), events)
+
+    def testPrometheus(self):
+        metrics = Metrics()
+        metrics.count("items_parsed", 11)
+        metrics.count("parse_failures", field='ti"tle')
+        metrics.observe("download", 0.5)
+        metrics.observe("download", 0.25)
+
+        text = metrics.prometheus()
+        self.assertIn("# TYPE googlenews_items_parsed_total counter\n", text)
+        self.assertIn("googlenews_items_parsed_total 11\n", text)
+        self.assertIn('googlenews_parse_failures_total{field="ti\\"tle"} 1\n', text)
+        self.assertIn('googlenews_stage_seconds_sum{stage="download"} 0.75\n', text)
+        self.assertIn('googlenews_stage_seconds_count{stage="download"} 2\n', text)
+        self.assertIn('googlenews_stage_seconds_max{stage="download"} 0.5\n', text)
+
+    def testDisabled(self):
+        googlenews = GoogleNews(transport=FixtureTransport())
+        self.assertIs(googlenews._stage("download"), NO_STAGE)
+        googlenews.search("Apple")
+        self.assertEqual(len(googlenews.results()), 11)
+
+
+if __name__ == '__main__':
+    unittest.main()
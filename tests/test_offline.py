@@ -0,0 +1,74 @@
+import unittest
+from datetime import datetime
+
+from GoogleNews import GoogleNews
+from tests.harness import FixtureTransport
+
+
+class OfflineTest(unittest.TestCase):
+    """ End to end runs against the recorded pages. """
+
+    def testSearchAndNextPage(self):
+        transport = FixtureTransport()
+        googlenews = GoogleNews(transport=transport)
+        googlenews.search("Apple")
+        googlenews.get_page(2)
+
+        links = googlenews.get_links()
+        self.assertEqual(len(links), 22)
+        # The navigation link is repeated on both pages
+        self.assertEqual(len(set(links)), 21)
+        self.assertEqual(googlenews.total_count(), 1230000)
+        self.assertEqual(
+            [FixtureTransport.route(url) for url in transport.urls],
+            ["search.html", "search_page2.html"],
+        )
+
+    def testNewsAndTopics(self):
+        googlenews = GoogleNews(transport=FixtureTransport())
+        googlenews.get_news("Markets")
+        googlenews.set_topic("CAAqJggKIiBDQkFTRWdvSUwyMHZNRGx1YlY4U0FtVnVHZ0pWVXlnQVAB")
+        googlenews.get_news()
+
+        titles = googlenews.get_texts()
+        self.assertEqual(len(titles), 24)
+        self.assertEqual(titles[0], "Markets react to story number 1")
+        self.assertEqual(titles[12], "Technology headline number 1")
+
+    def testLocalizedPages(self):
+        for lang, title in (
+            ("it", "Apple presenta il prodotto numero 1"),
+            ("ru", "Моцарт: концерт номер 1"),
+        ):
+            with self.subTest(lang=lang):
+                googlenews = GoogleNews(lang=lang, transport=FixtureTransport())
+                googlenews.search("Apple")
+
+                results = googlenews.results()
+                self.assertEqual(results[0]["title"], title)
+                self.assertEqual(googlenews.total_count(), 1230000)
+                # "12 ott 2026" / "12 окт. 2026 г."
+                self.assertEqual(results[4]["datetime"], datetime(2026, 10, 12))
+                self.assertTrue(all(result["datetime"] for result in results[:10]))
+
+    def testStreaming(self):
+        for backend in ("html", "rss"):
+            with self.subTest(backend=backend):
+                expected = GoogleNews(transport=FixtureTransport())
+                expected.set_news_backend(backend)
+                expected.get_news("Markets")
+                expected.search("Apple")
+
+                googlenews = GoogleNews(transport=FixtureTransport(chunk_size=512))
+                googlenews.set_news_backend(backend)
+                googlenews.set_streaming()
+                googlenews.get_news("Markets")
+                googlenews.search("Apple")
+
+                self.assertEqual(len(googlenews.results()), 23)
+                self.assertEqual(googlenews.results(), expected.results())
+                self.assertEqual(googlenews.total_count(), 1230000)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import unittest
+from importlib.util import find_spec
+
+from GoogleNews import GoogleNews, Parser
+from GoogleNews.Parser import NEWS_RULES, TagStream
+from tests.harness import FixtureTransport, fixture
+
+
+BACKENDS = ["html.parser"] + (["lxml"] if find_spec("lxml") else [])
+
+
+class ParserTest(unittest.TestCase):
+
+    def setUp(self):
+        self.search_page = fixture("search.html")
+        self.news_page = fixture("news.html")
+
+    def parse(self, parser):
+        googlenews = GoogleNews(parser=parser)
+        search = googlenews._parse_items(googlenews._parse_response(self.search_page))
+        news = googlenews._parse_news(self.news_page)
+        for result in search + news:
+            result.pop("datetime")
+        return search, news, googlenews.total_count()
+
+    def testSelectiveMatchesFullTree(self):
+        expected = self.parse(Parser("html.parser", selective=False))
+        self.assertEqual(len(expected[0]), 11)
+        self.assertEqual(len(expected[1]), 12)
+        self.assertEqual(expected[2], 1230000)
+
+        for backend in BACKENDS:
+            for selective in (True, False):
+                with self.subTest(backend=backend, selective=selective):
+                    self.assertEqual(self.parse(Parser(backend, selective)), expected)
+
+    def testSelectiveTreeOnlyHoldsResults(self):
+        soup = Parser("html.parser").search_soup(self.search_page)
+        self.assertEqual(soup.find_all("script"), [])
+        roots = {tag.name for tag in soup.find_all(recursive=False)}
+        self.assertEqual(roots, {"a", "div"})
+
+        soup = Parser("html.parser").news_soup(self.news_page)
+        roots = {tag.name for tag in soup.find_all(recursive=False)}
+        self.assertEqual(roots, {"article"})
+
+    def testStreamMatchesSoup(self):
+        chunks = [
+            self.news_page[start:start + 100]
+            for start in range(0, len(self.news_page), 100)
+        ]
+        for backend in BACKENDS:
+            with self.subTest(backend=backend):
+                parser = Parser(backend)
+                soup = parser.news_soup(self.news_page)
+                expected = [str(tag) for tag in soup("article")]
+                streamed = [str(tag) for tag in parser.news_stream(chunks)]
+                self.assertEqual(len(expected), 12)
+                self.assertEqual(streamed, expected)
+
+                tags = [tag.name for tag in parser.search_stream([self.search_page])]
+                self.assertEqual(tags, ["div"] + ["a"] * 11)
+
+    def testStreamEmitsTagsAsTheyClose(self):
+        for backend in BACKENDS:
+            with self.subTest(backend=backend):
+                stream = TagStream(NEWS_RULES, backend)
+                self.assertEqual(stream.feed(b"<html><body><article><a>"), [])
+                tags = stream.feed(b"One &amp; two</a></article><article>")
+                self.assertEqual([tag.text for tag in tags], ["One & two"])
+                tags = stream.feed(b"Three</article></body>")
+                self.assertEqual([tag.text for tag in tags], ["Three"])
+                self.assertEqual(stream.close(), [])
+
+    def testResultStats(self):
+        stats = {
+            "About 12 results (0.45 seconds)": 12,
+            "Page 2 of about 7 results (0,21 seconds)": 7,
+            "1 result (0.30 seconds)": 1,
+            "About 1,230,000 results\xa0(0.45 seconds)\xa0": 1230000,
+            "Circa 1.230.000 risultati (0,32 secondi)": 1230000,
+            "Результатов: примерно 1 230 000 (0,45 сек.)": 1230000,
+        }
+        for text, count in stats.items():
+            page = f'<div id="result-stats">{text}</div>'.encode()
+            for streaming in (False, True):
+                with self.subTest(text=text, streaming=streaming):
+                    googlenews = GoogleNews(transport=FixtureTransport(answers=[page]))
+                    googlenews.set_streaming(streaming)
+                    googlenews.search("Apple")
+                    self.assertEqual(googlenews.total_count(), count)
+
+    def testDefaultBackend(self):
+        self.assertEqual(Parser().backend, BACKENDS[-1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+import dataclasses
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from GoogleNews import GoogleNews, Query, ResponseCache
+from GoogleNews.QueryBuilder import url_template
+from tests.harness import FixtureTransport
+
+
+class QueryTest(unittest.TestCase):
+
+    def testUrls(self):
+        query = Query("Apple pie", lang="it", period="7d")
+        self.assertEqual(
+            query.search_url(3),
+            "https://www.google.com/search?q=Apple%20pie&lr=lang_it&biw=1920&bih=976"
+            "&source=lnt&&tbs=lr:lang_1it,qdr:7d,,sbd:1&tbm=nws&start=20",
+        )
+        self.assertEqual(
+            query.news_url(),
+            "https://news.google.com/search?q=Apple%20piewhen%3A7d&hl=it",
+        )
+
+        # The instance facade builds the same URLs
+        googlenews = GoogleNews(lang="it", period="7d")
+        googlenews.search("Apple pie")
+        self.assertEqual(googlenews._search_url(3), query.search_url(3))
+
+    def testPageUrls(self):
+        query = Query("Apple", lang="it", start="01/02/2026", end="03/04/2026")
+        self.assertEqual(
+            query.search_urls(range(1, 51)),
+            [query.search_url(page) for page in range(1, 51)],
+        )
+        self.assertEqual(
+            query.search_url(2, localized=True),
+            query.search_url(2).replace("search?", "search?hl=it&gl=it&"),
+        )
+        self.assertEqual(
+            query.news_url(),
+            "https://news.google.com/search?q=Apple+before:2026-03-04"
+            "+after:2026-01-02&hl=it",
+        )
+
+        # The queries of a language and date range share their template
+        self.assertIs(
+            url_template("it", "", "01/02/2026", "03/04/2026"),
+            url_template("it", "", "01/02/2026", "03/04/2026"),
+        )
+
+    def testInvalidDates(self):
+        for start, end in (("2026-01-02", "03/04/2026"), ("01/02/2026", "13/01/2026")):
+            with self.subTest(start=start, end=end):
+                with self.assertRaises(ValueError):
+                    Query("Apple", start=start, end=end)
+                with self.assertRaises(ValueError):
+                    GoogleNews(start=start, end=end)
+                with self.assertRaises(ValueError):
+                    GoogleNews().set_time_range(start, end)
+
+    def testImmutable(self):
+        query = Query("Apple")
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            query.lang = "it"
+
+        self.assertEqual(dataclasses.replace(query, lang="it"), Query("Apple", "it"))
+        self.assertEqual(len({query, Query("Apple")}), 1)
+
+    def testSharedByThreads(self):
+        googlenews = GoogleNews(transport=FixtureTransport())
+        googlenews.set_cache(ResponseCache())
+        queries = [Query("Apple", lang) for lang in ("en", "it", "ru")] * 4
+
+        def fetch(number):
+            query = queries[number % len(queries)]
+            return query, googlenews.fetch(query, number % 2 + 1)
+
+        with ThreadPoolExecutor(64) as pool:
+            pages = list(pool.map(fetch, range(256)))
+
+        titles = {
+            "en": "Apple announces product number 1",
+            "it": "Apple presenta il prodotto numero 1",
+            "ru": "Моцарт: концерт номер 1",
+        }
+        for query, result_page in pages:
+            self.assertIs(result_page.query, query)
+            self.assertEqual(result_page.total_count, 1230000)
+            title = titles[query.lang]
+            if result_page.page == 2 and query.lang == "en":
+                title += "1"
+            self.assertEqual(result_page.results[0]["title"], title)
+
+        # Nothing was stored on the instance
+        self.assertEqual(googlenews.results(), [])
+        self.assertEqual(googlenews.total_count(), 0)
+
+    def testFetchNews(self):
+        googlenews = GoogleNews(transport=FixtureTransport())
+        result_page = googlenews.fetch_news(Query("Markets"))
+        self.assertEqual(len(result_page.results), 12)
+        self.assertEqual(googlenews.results(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
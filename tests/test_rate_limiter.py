@@ -0,0 +1,123 @@
+import asyncio
+import time
+import unittest
+import warnings
+from email.utils import formatdate
+from urllib.error import HTTPError
+
+from GoogleNews import BlockedError, GoogleNews, RateLimiter, ResponseCache
+from GoogleNews.RateLimiter import retry_after
+from tests.harness import FixtureTransport
+
+
+CAPTCHA = b'<html><form id="captcha-form" action="/sorry/index"></form></html>'
+CONSENT = b'<html><form action="https://consent.google.com/save"></form></html>'
+
+
+def too_many_requests(seconds: str):
+    return HTTPError(
+        "https://www.google.com/search", 429, "Too Many Requests",
+        {"Retry-After": seconds}, None,
+    )
+
+
+class RateLimiterTest(unittest.TestCase):
+
+    def testTokenBucket(self):
+        limiter = RateLimiter(rate=10, burst=2)
+        url = "https://www.google.com/search?q=a"
+
+        self.assertEqual(limiter.reserve(url), 0)
+        self.assertEqual(limiter.reserve(url), 0)
+        self.assertAlmostEqual(limiter.reserve(url), 0.1, delta=0.01)
+        self.assertAlmostEqual(limiter.reserve(url), 0.2, delta=0.01)
+        # Other hosts have their own bucket
+        self.assertEqual(limiter.reserve("https://news.google.com/"), 0)
+
+    def testRetriesThrottledRequests(self):
+        transport = FixtureTransport(answers=[too_many_requests("0"), CAPTCHA])
+        limiter = RateLimiter(rate=10, backoff=0.01)
+        googlenews = GoogleNews(transport=transport)
+        googlenews.set_rate_limiter(limiter)
+        googlenews.enable_exception()
+        googlenews.search("Apple")
+
+        self.assertEqual(len(transport.urls), 3)
+        self.assertEqual(len(googlenews.results()), 11)
+        # Halved twice, then a tenth of the rate won back
+        self.assertAlmostEqual(
+            limiter.current_rate("https://www.google.com/"), 3.5, delta=0.001
+        )
+
+    def testGivesUp(self):
+        transport = FixtureTransport(answers=[too_many_requests("0")] * 3)
+        googlenews = GoogleNews(transport=transport)
+        googlenews.set_rate_limiter(RateLimiter(max_retries=2, backoff=0.01))
+        googlenews.enable_exception()
+
+        with self.assertRaises(HTTPError):
+            googlenews.search("Apple")
+        self.assertEqual(len(transport.urls), 3)
+
+    def testAiohttpStatus(self):
+        import aiohttp
+
+        answers = [
+            aiohttp.ClientResponseError(
+                None, (), status=429, headers={"Retry-After": "0"}
+            ),
+            b"<html></html>",
+        ]
+
+        async def fetch():
+            answer = answers.pop(0)
+            if isinstance(answer, Exception):
+                raise answer
+            return answer
+
+        limiter = RateLimiter(backoff=0.01)
+        with warnings.catch_warnings():
+            # ClientResponseError.code is deprecated
+            warnings.simplefilter("error", DeprecationWarning)
+            page = asyncio.run(limiter.async_call("https://www.google.com/", fetch))
+
+        self.assertEqual(page, b"<html></html>")
+        self.assertEqual(answers, [])
+
+    def testConsentIsNotRetried(self):
+        transport = FixtureTransport(answers=[CONSENT])
+        googlenews = GoogleNews(transport=transport)
+        googlenews.set_rate_limiter(RateLimiter(backoff=0.01))
+        googlenews.enable_exception()
+
+        with self.assertRaises(BlockedError) as raised:
+            googlenews.search("Apple")
+        self.assertEqual(raised.exception.reason, "consent")
+        self.assertEqual(len(transport.urls), 1)
+
+    def testBlockedPagesAreNotParsedOrCached(self):
+        transport = FixtureTransport(answers=[CAPTCHA])
+        googlenews = GoogleNews(transport=transport)
+        googlenews.set_cache(ResponseCache())
+        googlenews.enable_exception()
+
+        with self.assertRaises(BlockedError):
+            googlenews.search("Apple")
+
+        googlenews.get_page()
+        self.assertEqual(len(transport.urls), 2)
+        self.assertEqual(len(googlenews.results()), 11)
+
+    def testRetryAfter(self):
+        self.assertEqual(retry_after({"Retry-After": "120"}), 120)
+        self.assertAlmostEqual(
+            retry_after({"Retry-After": formatdate(time.time() + 60, usegmt=True)}),
+            60,
+            delta=2,
+        )
+        self.assertIsNone(retry_after({}))
+        self.assertIsNone(retry_after(None))
+
+
+if __name__ == '__main__':
+    unittest.main()
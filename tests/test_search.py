@@ -2,7 +2,7 @@
 ### MODULES
 
 import unittest
-from GoogleNews import GoogleNews
+from tests.harness import client
 
 ### TEST
 
@@ -11,14 +11,14 @@ keyword = 'Apple'
 class NumbersTest(unittest.TestCase):
 
   def testResultNumberWithDefaultPage(self):
-    googlenews = GoogleNews()
+    googlenews = client()
     googlenews.search(keyword)
     length = len(googlenews.results())
     self.assertNotEqual(length, 0)
     print('Result length with only one page is correct')
 
   def testResultNumberWithTwoPages(self):
-    googlenews = GoogleNews()
+    googlenews = client()
     googlenews.search(keyword)
     googlenews.get_page(2)
     length = len(googlenews.results())
@@ -26,21 +26,21 @@ class NumbersTest(unittest.TestCase):
     print('Result length with two pages is correct')
 
   def testEncode(self):
-    googlenews = GoogleNews(lang='ru')
+    googlenews = client(lang='ru')
     googlenews.search("Моцарт")
     length = len(googlenews.results())
     self.assertNotEqual(length, 0)
     print('Encoding result is not empty')
 
   # def testTotalCountGreaterThanZero(self):
-  #   googlenews = GoogleNews()
+  #   googlenews = client()
   #   googlenews.search(keyword)
   #   count = googlenews.total_count()
   #   self.assertGreater(count, 0)
   #   print('Total count is greater than zero')
 
   def testResultNumberAtTwoPages(self):
-    googlenews = GoogleNews()
+    googlenews = client()
     googlenews.search(keyword)
     result = googlenews.page_at(2)
     length = len(result)
@@ -50,13 +50,13 @@ class NumbersTest(unittest.TestCase):
 class TestStringMethods(unittest.TestCase):
 
   def testVersion(self):
-    googlenews = GoogleNews()
+    googlenews = client()
     version = '2.0.0'
     self.assertIn(version, googlenews.get_version())
     print('Latest version matched')
 
   def testResultContainsKeyword(self):
-    googlenews = GoogleNews()
+    googlenews = client()
     googlenews.search(keyword)
     result = googlenews.results()[0]
     print(result.get('title').lower()+result.get('desc').lower())
@@ -64,7 +64,7 @@ class TestStringMethods(unittest.TestCase):
     print('Result contains keyword')
 
   def testResultHasLink(self):
-    googlenews = GoogleNews()
+    googlenews = client()
     googlenews.search(keyword)
     result = googlenews.results()[0]
     print(result.get('link').lower())
@@ -72,7 +72,7 @@ class TestStringMethods(unittest.TestCase):
     print('Result contains http link')
 
   def testResultHasImage(self):
-    googlenews = GoogleNews()
+    googlenews = client()
     googlenews.search(keyword)
     result = googlenews.results()[0]
     print(result.get('img').lower())
@@ -80,7 +80,7 @@ class TestStringMethods(unittest.TestCase):
     print('Result contains image')
 
   def testResultHasTitle(self):
-    googlenews = GoogleNews()
+    googlenews = client()
     googlenews.search(keyword)
     result = googlenews.results()[0]
     print(result.get('title').lower())
@@ -88,7 +88,7 @@ class TestStringMethods(unittest.TestCase):
     print('Result title is not empty')
 
   def testResultHasMedia(self):
-    googlenews = GoogleNews()
+    googlenews = client()
     googlenews.search(keyword)
     result = googlenews.results()[0]
     print(result.get('media').lower())
@@ -96,7 +96,7 @@ class TestStringMethods(unittest.TestCase):
     print('Result media is not empty')
 
   def testResultHasDate(self):
-    googlenews = GoogleNews()
+    googlenews = client()
     googlenews.search(keyword)
     result = googlenews.results()[0]
     print(result.get('date').lower())
@@ -0,0 +1,79 @@
+import json
+import tempfile
+import unittest
+from datetime import datetime
+from importlib.util import find_spec
+from pathlib import Path
+
+from GoogleNews import GoogleNews, NdjsonSink, ParquetSink, SqliteSink
+from tests.harness import FixtureTransport
+
+
+class SinkTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def scrape(self, sink, keep_results=True):
+        googlenews = GoogleNews(transport=FixtureTransport())
+        googlenews.set_sink(sink, keep_results)
+        googlenews.search("Apple")
+        googlenews.get_page(2)
+        googlenews.get_news("Markets")
+        return googlenews
+
+    def testNdjson(self):
+        with NdjsonSink(self.path / "news.ndjson", batch_size=5) as sink:
+            googlenews = self.scrape(sink, keep_results=False)
+            # Full batches are written as they fill up
+            self.assertEqual(sink.written, 30)
+        self.assertEqual(googlenews.results(), [])
+        self.assertEqual(sink.written, 34)
+
+        lines = (self.path / "news.ndjson").read_text(encoding="utf-8").splitlines()
+        rows = [json.loads(line) for line in lines]
+        self.assertEqual(len(rows), 34)
+        self.assertEqual(rows[0]["title"], googlenews.page_at(1)[0]["title"])
+        self.assertEqual(rows[-1]["datetime"], "2026-10-15T12:15:00")
+
+    @unittest.skipIf(find_spec("pyarrow") is None, "pyarrow is not installed")
+    def testParquet(self):
+        import pyarrow.parquet
+
+        with ParquetSink(self.path / "news.parquet", batch_size=10) as sink:
+            googlenews = self.scrape(sink)
+
+        parquet = pyarrow.parquet.ParquetFile(self.path / "news.parquet")
+        self.assertEqual(parquet.metadata.num_row_groups, 4)
+        table = parquet.read()
+        self.assertEqual(table.column("link").to_pylist(), googlenews.get_links())
+        self.assertEqual(
+            table.column("datetime").to_pylist(),
+            [result["datetime"] for result in googlenews.results()],
+        )
+
+    def testSqliteSkipsKnownLinks(self):
+        for _ in range(2):
+            with SqliteSink(self.path / "news.sqlite", batch_size=8) as sink:
+                googlenews = self.scrape(sink)
+                self.assertEqual(sink.written, 32)
+                sink.flush()
+                # Both search pages repeat the navigation link
+                count, = sink.connection.execute("SELECT count(*) FROM news").fetchone()
+
+            self.assertEqual(sink.written, 34)
+            self.assertEqual(count, 33)
+            self.assertEqual(len(googlenews.results()), 34)
+
+        with SqliteSink(self.path / "news.sqlite") as sink:
+            query = "SELECT max(datetime) FROM news"
+            newest, = sink.connection.execute(query).fetchone()
+        self.assertEqual(datetime.fromisoformat(newest).year, 2026)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,7 @@
 
 ### MODULES
 
-from GoogleNews import GoogleNews
+from tests.harness import client
 
 ### METHODS
 
@@ -14,8 +14,8 @@ def show_routine(results):
 # Setup the research
 keywords="covid cava de' tirreni"
 period='10d'
-google_news = GoogleNews(lang='it',period=period)
-google=GoogleNews(lang='it',period=period)
+google_news = client(lang='it',period=period)
+google=client(lang='it',period=period)
 
 # Results from news.google.com
 google_news.get_news(keywords)
@@ -0,0 +1,297 @@
+import asyncio
+import gzip
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.error import HTTPError
+
+from GoogleNews import (
+    AsyncGoogleNews,
+    BlockedError,
+    GoogleNews,
+    Metrics,
+    PooledTransport,
+    Query,
+    RateLimiter,
+    ResponseCache,
+    UrllibTransport,
+)
+from tests.harness import fixture
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """
+    Keep-alive stand-in for google.com serving the search fixture gzipped.
+    The first `server.throttled` requests are answered with a 429, and every
+    one with a CAPTCHA page while `server.captcha` is set.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self):
+        with self.server.lock:
+            self.server.requests += 1
+            throttled = self.server.throttled > 0
+            self.server.throttled -= throttled
+
+        if throttled:
+            self.send_response(429)
+            self.send_header("Retry-After", "0")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        if self.server.captcha:
+            body = b'<form action="/sorry/index"><div class="g-recaptcha"></div></form>'
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+
+        if self.path.startswith("/missing"):
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        if self.path.startswith("/moved"):
+            self.send_response(302)
+            self.send_header("Location", "/search?q=moved")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        body = fixture("search.html")
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(body)
+            self.send_response(200)
+            self.send_header("Content-Encoding", "gzip")
+        else:
+            self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=UTF-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class LocalTransport(PooledTransport):
+    """ Redirects google.com to the local stub server. """
+
+    __slots__ = ("base",)
+
+    def fetch(self, url, headers):
+        return super().fetch(url.replace("https://www.google.com", self.base), headers)
+
+
+class LocalUrllibTransport(UrllibTransport):
+
+    __slots__ = ("base",)
+
+    def fetch(self, url, headers):
+        return super().fetch(url.replace("https://www.google.com", self.base), headers)
+
+
+class LocalAsyncGoogleNews(AsyncGoogleNews):
+    """ The aiohttp `_fetch` of AsyncGoogleNews, sent to the local stub server. """
+
+    __slots__ = ("base",)
+
+    async def _fetch(self, url, headers=None):
+        url = url.replace("https://www.google.com", self.base)
+        return await super()._fetch(url, headers)
+
+
+class StubServerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+        self.server.lock = threading.Lock()
+        self.server.connections = 0
+        self.server.requests = 0
+        self.server.throttled = 0
+        self.server.captcha = False
+        self.base = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class PooledTransportTest(StubServerTest):
+
+    def testGzipIsDecoded(self):
+        transport = PooledTransport()
+        page = transport.fetch(self.base + "/search?q=Apple", {})
+        self.assertEqual(page, fixture("search.html"))
+        transport.close()
+
+    def testStream(self):
+        transport = PooledTransport()
+        chunks = list(transport.stream(self.base + "/moved", {}))
+        self.assertEqual(b"".join(chunks), fixture("search.html"))
+
+        # The connection went back to the pool once the body was read
+        list(transport.stream(self.base + "/search", {}))
+        self.assertEqual(transport.connections_opened, 1)
+
+        with self.assertRaises(HTTPError):
+            next(transport.stream(self.base + "/missing", {}))
+        transport.close()
+
+    def testConnectionsAreReusedAcrossInstances(self):
+        transport = LocalTransport()
+        transport.base = self.base
+        for _ in range(5):
+            googlenews = GoogleNews(transport=transport)
+            googlenews.search("Apple")
+            googlenews.get_page(2)
+            self.assertNotEqual(len(googlenews.results()), 0)
+        transport.close()
+
+        self.assertEqual(transport.connections_opened, 1)
+        self.assertEqual(self.server.connections, 1)
+
+    def testConnectStage(self):
+        metrics = Metrics()
+        transport = LocalTransport(metrics=metrics)
+        transport.base = self.base
+        googlenews = GoogleNews(transport=transport)
+        googlenews.set_metrics(metrics)
+        googlenews.search("Apple")
+        googlenews.get_page(2)
+        transport.close()
+
+        stages = metrics.snapshot()["stages"]
+        self.assertEqual(stages["connect"]["count"], 1)
+        self.assertEqual(stages["download"]["count"], 2)
+        self.assertGreaterEqual(
+            stages["download"]["seconds"], stages["connect"]["seconds"]
+        )
+
+    def testUrllibOpensOneConnectionPerPage(self):
+        transport = LocalUrllibTransport()
+        transport.base = self.base
+        googlenews = GoogleNews(transport=transport)
+        for page in range(1, 6):
+            googlenews.get_page(page)
+
+        self.assertEqual(self.server.connections, 5)
+
+    def testPerHostLimit(self):
+        transport = PooledTransport(max_per_host=2)
+        threads = [
+            threading.Thread(target=transport.fetch, args=(self.base + "/search", {}))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        transport.close()
+
+        self.assertLessEqual(transport.connections_opened, 2)
+
+    def testRedirectAndErrors(self):
+        transport = PooledTransport()
+        self.assertIn(b"result-stats", transport.fetch(self.base + "/moved", {}))
+        with self.assertRaises(HTTPError) as error:
+            transport.fetch(self.base + "/missing", {})
+        self.assertEqual(error.exception.code, 404)
+        transport.close()
+
+    def testShared(self):
+        self.assertIs(PooledTransport.shared(), PooledTransport.shared())
+
+
+class AsyncGoogleNewsTest(StubServerTest):
+
+    def setUp(self):
+        super().setUp()
+        self.metrics = Metrics()
+
+    def client(self):
+        googlenews = LocalAsyncGoogleNews()
+        googlenews.base = self.base
+        googlenews.set_metrics(self.metrics)
+        return googlenews
+
+    def run_client(self, googlenews, coroutine):
+        async def run():
+            async with googlenews:
+                return await coroutine()
+
+        return asyncio.run(run())
+
+    def testSessionAndCache(self):
+        googlenews = self.client()
+        googlenews.set_cache(ResponseCache())
+
+        async def search():
+            await googlenews.search("Apple")
+            await googlenews.fetch(Query("Apple"))
+
+        self.run_client(googlenews, search)
+
+        self.assertEqual(len(googlenews.results()), 11)
+        self.assertEqual(googlenews.total_count(), 1230000)
+        self.assertEqual(self.server.requests, 1)
+
+        snapshot = self.metrics.snapshot()
+        self.assertEqual(snapshot["counters"]["requests"], 1)
+        self.assertGreater(snapshot["counters"]["bytes_downloaded"], 0)
+        self.assertEqual(snapshot["stages"]["download"]["count"], 1)
+
+    def testThrottledRequestIsRetried(self):
+        self.server.throttled = 1
+        googlenews = self.client()
+        rate_limiter = RateLimiter(rate=100, backoff=0.01)
+        googlenews.set_rate_limiter(rate_limiter)
+
+        result_page = self.run_client(
+            googlenews, lambda: googlenews.fetch(Query("Apple"))
+        )
+
+        self.assertEqual(len(result_page.results), 11)
+        self.assertEqual(self.server.requests, 2)
+        counters = self.metrics.snapshot()["counters"]
+        self.assertEqual(counters["retries"], 1)
+        self.assertEqual(counters["requests"], 1)
+        self.assertLess(rate_limiter.current_rate(self.base), 100)
+
+    def testThrottledWithoutRateLimiter(self):
+        import aiohttp
+
+        self.server.throttled = 1
+        googlenews = self.client()
+
+        with self.assertRaises(aiohttp.ClientResponseError) as error:
+            self.run_client(googlenews, lambda: googlenews.fetch(Query("Apple")))
+        self.assertEqual(error.exception.status, 429)
+
+    def testCaptcha(self):
+        self.server.captcha = True
+        googlenews = self.client()
+
+        with self.assertRaises(BlockedError) as error:
+            self.run_client(googlenews, lambda: googlenews.fetch(Query("Apple")))
+        self.assertEqual(error.exception.reason, "captcha")
+
+        googlenews.set_rate_limiter(RateLimiter(rate=100, backoff=0.01, max_retries=1))
+        with self.assertRaises(BlockedError):
+            self.run_client(googlenews, lambda: googlenews.fetch(Query("Apple")))
+        self.assertEqual(self.server.requests, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+import pickle
+import unittest
+
+from GoogleNews import GoogleNews, UrlCanonicalizer
+from GoogleNews.UrlCanonicalizer import GOOGLE_PARAMS, TRACKING_PARAMS
+
+
+class UrlCanonicalizerTest(unittest.TestCase):
+
+    def testGoogleRedirect(self):
+        link = "/url?q=https://www.example.com/a%3Fref%3Dfeed&sa=U&ved=2ah&usg=AOv"
+
+        self.assertEqual(GoogleNews.fix_url(link), "https://www.example.com/a?ref=feed")
+        self.assertEqual(
+            GoogleNews.fix_url("https://www.example.com/a&sa=U&page=2"),
+            "https://www.example.com/a?page=2",
+        )
+
+    def testLegacyHelpers(self):
+        self.assertEqual(
+            GoogleNews.fix_malformed_query_string("https://www.example.com/a%2526b%3D1"),
+            "https://www.example.com/a?b=1",
+        )
+        self.assertEqual(
+            GoogleNews.remove_query_params_from_url(
+                "https://www.example.com/a?sa=U&b=1&usg=AOv#c"
+            ),
+            "https://www.example.com/a?b=1#c",
+        )
+
+        class Subclass(GoogleNews):
+            @classmethod
+            def fix_url(cls, url: str):
+                return super().fix_url(url).upper()
+
+        self.assertEqual(
+            Subclass.fix_url("/url?q=https://example.com/a&sa=U"), "HTTPS://EXAMPLE.COM/A"
+        )
+
+    def testUnquotedValuesAreQuotedAgain(self):
+        for link, expected in (
+            ("https://example.com/a?b=c d&sa=U", "https://example.com/a?b=c+d"),
+            ("https://example.com/a?b=%2520x", "https://example.com/a?b=+x"),
+            ("https://example.com/a?b=%2520x&sa=U", "https://example.com/a?b=+x"),
+            (
+                "https://it.example.com/a?t=%C3%A8+vero&sa=U",
+                "https://it.example.com/a?t=%C3%A8+vero",
+            ),
+            (
+                "/url?q=https://ru.example.com/a%3Fq%3D%D0%BC%D0%B8%D1%80&sa=U",
+                "https://ru.example.com/a?q=%D0%BC%D0%B8%D1%80",
+            ),
+        ):
+            with self.subTest(link=link):
+                self.assertEqual(GoogleNews.fix_url(link), expected)
+                self.assertEqual(
+                    UrlCanonicalizer(GOOGLE_PARAMS).canonicalize(link), expected
+                )
+
+    def testKeepsQueriesWithNothingToStrip(self):
+        canonicalizer = UrlCanonicalizer()
+
+        for url in (
+            "https://www.example.com/a",
+            "https://www.example.com/a?b=2&a=1&empty=&b=3",
+            "https://www.example.com/a?q=x+y#section",
+        ):
+            with self.subTest(url=url):
+                self.assertEqual(canonicalizer.canonicalize(url), url)
+
+    def testTrackingParams(self):
+        canonicalizer = UrlCanonicalizer(GOOGLE_PARAMS + TRACKING_PARAMS)
+
+        self.assertEqual(
+            canonicalizer.canonicalize(
+                "https://www.example.com/a?id=7&utm_source=x&utm_medium=y&fbclid=z#top"
+            ),
+            "https://www.example.com/a?id=7#top",
+        )
+        self.assertEqual(
+            canonicalizer.canonicalize("https://www.example.com/a?utm_campaign=x"),
+            "https://www.example.com/a",
+        )
+
+    def testBatchAndCache(self):
+        canonicalizer = UrlCanonicalizer()
+        links = ["https://www.example.com/a?sa=U", "https://www.example.com/b"] * 3
+
+        self.assertEqual(
+            canonicalizer.canonicalize_many(links),
+            ["https://www.example.com/a", "https://www.example.com/b"] * 3,
+        )
+        self.assertEqual(canonicalizer.cache_info().misses, 2)
+        self.assertEqual(canonicalizer.cache_info().hits, 4)
+
+    def testPickle(self):
+        canonicalizer = pickle.loads(pickle.dumps(UrlCanonicalizer(["fbclid"])))
+
+        self.assertEqual(canonicalizer.strip, ("fbclid",))
+        self.assertEqual(
+            canonicalizer.canonicalize("https://www.example.com/?fbclid=1&sa=U"),
+            "https://www.example.com/?sa=U",
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
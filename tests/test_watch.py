@@ -0,0 +1,113 @@
+import asyncio
+import re
+import tempfile
+import unittest
+from pathlib import Path
+
+from GoogleNews import GoogleNews, WatchStore
+from tests.harness import FixtureAsyncGoogleNews, FixtureTransport, fixture
+
+
+class NewsFlow:
+    """
+    Rewrites the search pages into articles listed newest first, `latest`
+    being the newest, the other pages are the fixtures.
+    """
+
+    __slots__ = ("latest",)
+
+    def __init__(self, latest: int = 100):
+        self.latest = latest
+
+    def __call__(self, url: str, page: bytes):
+        if not url.startswith("https://www.google.com/"):
+            return page
+
+        first = self.latest - int(re.search(r"start=(\d+)", url).group(1))
+        def renumber(match):
+            return b"example.com/news/apple-%d" % (first - int(match.group(1)) + 1)
+
+        return re.sub(
+            rb"example\d\.com/news/apple-(\d+)", renumber, fixture("search.html")
+        )
+
+
+def news_flow_transport(flow: NewsFlow | None = None):
+    return FixtureTransport(rewrite=flow if flow is not None else NewsFlow())
+
+
+class WatchTest(unittest.TestCase):
+
+    def testOnlyNewResults(self):
+        flow = NewsFlow()
+        transport = news_flow_transport(flow)
+        googlenews = GoogleNews(transport=transport)
+        googlenews.set_watch_store(WatchStore())
+
+        first = googlenews.poll_new("Apple", max_pages=2)
+        # 10 articles a page, plus the navigation link repeated on every page
+        self.assertEqual(len(first), 21)
+        self.assertEqual(len(transport.urls), 2)
+
+        flow.latest += 5
+        transport.urls.clear()
+        second = googlenews.poll_new()
+        self.assertEqual(
+            [re.search(r"apple-(\d+)", result["link"]).group(1) for result in second],
+            ["105", "104", "103", "102", "101"],
+        )
+        # Stopped on the first page, which reached the previous poll
+        self.assertEqual(len(transport.urls), 1)
+        self.assertEqual(googlenews.results(), [])
+
+    def testWatermarksPersist(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = str(Path(directory) / "watch.sqlite")
+            transport = news_flow_transport()
+
+            store = WatchStore(path)
+            googlenews = GoogleNews(transport=transport)
+            googlenews.set_watch_store(store)
+            googlenews.set_news_backend("rss")
+            self.assertEqual(len(googlenews.poll_new_news("Markets")), 12)
+            self.assertEqual(len(googlenews.poll_new("Apple", max_pages=1)), 11)
+            store.close()
+
+            store = WatchStore(path)
+            googlenews.set_watch_store(store)
+            self.assertEqual(googlenews.poll_new_news("Markets"), [])
+            self.assertEqual(googlenews.poll_new("Apple"), [])
+            self.assertEqual(len(googlenews.poll_new_news("Other")), 12)
+            store.close()
+
+    def testForgetsOldestLinks(self):
+        store = WatchStore(max_links=15)
+        googlenews = GoogleNews(transport=news_flow_transport())
+        googlenews.set_watch_store(store)
+        googlenews.poll_new("Apple", max_pages=2)
+
+        watermark = store.load(googlenews._search_url(1))
+        self.assertEqual(len(watermark.links), 15)
+        self.assertTrue(any("apple-100?" in link for link in watermark.links))
+        self.assertFalse(any("apple-81?" in link for link in watermark.links))
+
+    def testAsync(self):
+        flow = NewsFlow()
+
+        async def poll():
+            googlenews = FixtureAsyncGoogleNews(news_flow_transport(flow))
+            googlenews.set_watch_store(WatchStore())
+            first = await googlenews.poll_new("Apple", max_pages=1)
+            flow.latest += 3
+            return first, await googlenews.poll_new()
+
+        first, second = asyncio.run(poll())
+        self.assertEqual((len(first), len(second)), (11, 3))
+
+    def testRequiresStore(self):
+        with self.assertRaises(AttributeError):
+            GoogleNews(transport=news_flow_transport()).poll_new("Apple")
+
+
+if __name__ == '__main__':
+    unittest.main()